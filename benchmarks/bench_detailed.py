@@ -0,0 +1,92 @@
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fault_engine import detailed_fault_batch, detailed_fault_batch_complex, feeder_schedule_batch
+
+# --- Per-row scalar path (the formulas as DetailedCalculationWidget.calculate runs them) ---
+def scalar_detailed(zp, r1_r2, vp, vs, va, z_percent):
+    zp_referred = zp * (vs / vp)**2
+    zt = (z_percent / 100) * (vs**2 / va)
+    zsec = zp_referred + zt + r1_r2
+    earth_fault_current = (vs / math.sqrt(3)) / zsec
+    return zsec, earth_fault_current, earth_fault_current * (vs / vp)
+
+def make_schedule(n_circuits, n_transformers, seed=0):
+    rng = np.random.default_rng(seed)
+    transformers = {
+        "zp": rng.uniform(0.1, 1.0, n_transformers),
+        "vp": np.full(n_transformers, 11000.0),
+        "vs": np.full(n_transformers, 415.0),
+        "va": rng.choice([315e3, 630e3, 1000e3, 1600e3], n_transformers),
+        "z_percent": rng.choice([4.5, 5.0, 6.0, 6.5], n_transformers),
+    }
+    transformer_index = rng.integers(0, n_transformers, n_circuits)
+    r1_r2 = rng.uniform(0.01, 2.0, n_circuits)
+    return transformers, transformer_index, r1_r2
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(n_circuits, n_transformers, scalar_rows, repeat):
+    tx, idx, r1_r2 = make_schedule(n_circuits, n_transformers)
+
+    # Plain Python floats, as the widget reads them out of its QLineEdits
+    rows = list(zip(tx["zp"][idx].tolist(), r1_r2.tolist(), tx["vp"][idx].tolist(),
+                    tx["vs"][idx].tolist(), tx["va"][idx].tolist(), tx["z_percent"][idx].tolist()))[:scalar_rows]
+
+    def scalar_path():
+        for row in rows:
+            scalar_detailed(*row)
+
+    def row_batch_path():
+        detailed_fault_batch(tx["zp"][idx], r1_r2, tx["vp"][idx], tx["vs"][idx], tx["va"][idx], tx["z_percent"][idx])
+
+    def feeder_path():
+        feeder_schedule_batch(idx, r1_r2, tx["zp"], tx["vp"], tx["vs"], tx["va"], tx["z_percent"])
+
+    zp_complex = tx["zp"][idx] * (1 + 0.5j)
+    x_r = np.full(n_circuits, 6.0)
+
+    def complex_path():
+        detailed_fault_batch_complex(zp_complex, r1_r2, tx["vp"][idx], tx["vs"][idx], tx["va"][idx],
+                                     tx["z_percent"][idx], x_r)
+
+    scalar_rate = len(rows) / timed(scalar_path, 1)
+    row_rate = n_circuits / timed(row_batch_path, repeat)
+    feeder_rate = n_circuits / timed(feeder_path, repeat)
+    complex_rate = n_circuits / timed(complex_path, repeat)
+
+    print(f"circuits={n_circuits:,} transformers={n_transformers}")
+    print(f"  scalar per-row     : {scalar_rate:>14,.0f} rows/s")
+    print(f"  batch (per-row Zt) : {row_rate:>14,.0f} rows/s  ({row_rate / scalar_rate:,.0f}x)")
+    print(f"  feeder schedule    : {feeder_rate:>14,.0f} rows/s  ({feeder_rate / scalar_rate:,.0f}x)")
+    print(f"  complex (R + jX)   : {complex_rate:>14,.0f} rows/s  ({complex_rate / scalar_rate:,.0f}x)")
+
+    # The batch paths must agree with the scalar formulas
+    check = feeder_schedule_batch(idx[:100], r1_r2[:100], tx["zp"], tx["vp"], tx["vs"], tx["va"], tx["z_percent"])
+    for i in range(100):
+        t = idx[i]
+        zsec, ief, _ = scalar_detailed(tx["zp"][t], r1_r2[i], tx["vp"][t], tx["vs"][t], tx["va"][t], tx["z_percent"][t])
+        assert math.isclose(check["zsec"][i], zsec, rel_tol=1e-12)
+        assert math.isclose(check["earth_fault_current"][i], ief, rel_tol=1e-12)
+    return {"scalar": scalar_rate, "batch": row_rate, "feeder": feeder_rate, "complex": complex_rate}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the detailed (loop impedance) solver")
+    parser.add_argument("--circuits", type=int, default=500_000)
+    parser.add_argument("--transformers", type=int, default=8)
+    parser.add_argument("--scalar-rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.circuits, args.transformers, args.scalar_rows, args.repeat)
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- Load generator ---
+def make_body(endpoint, rng):
+    if endpoint == "/simple":
+        body = {"vp": 11000, "vs": 415, "kva": rng.choice([315, 630, 1000, 1600]), "z_percent": rng.uniform(4, 7)}
+    elif endpoint == "/detailed":
+        body = {"zp": rng.uniform(0.1, 1), "r1_r2": rng.uniform(0.01, 1), "vp": 11000, "vs": 415,
+                "va": rng.choice([315e3, 630e3, 1000e3]), "z_percent": rng.uniform(4, 7)}
+    else:
+        body = {"kva": rng.uniform(50, 2500), "secondary_voltage": 415}
+    return json.dumps(body).encode("utf-8")
+
+async def client(host, port, endpoint, count, latencies, errors, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            body = make_body(endpoint, rng)
+            start = time.perf_counter()
+            writer.write(f"POST {endpoint} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+async def load(host, port, endpoint, concurrency, requests):
+    latencies, errors = [], []
+    per_client = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, endpoint, n, latencies, errors, i) for i, n in enumerate(per_client) if n))
+    elapsed = time.perf_counter() - start
+    ms = np.array(latencies) * 1000
+    return {"endpoint": endpoint, "requests": len(latencies), "concurrency": concurrency, "errors": len(errors),
+            "seconds": elapsed, "requests_per_second": len(latencies) / elapsed,
+            "p50_ms": float(np.percentile(ms, 50)), "p99_ms": float(np.percentile(ms, 99)), "max_ms": float(ms.max())}
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b"\r\n\r\n", 1)[1])
+
+# --- Local server process ---
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port, window_ms, max_batch):
+    process = subprocess.Popen([sys.executable, "calc_service.py", "--port", str(port), "--window-ms", str(window_ms),
+                                "--max-batch", str(max_batch)], cwd=ROOT, stdout=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("calc_service did not start")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load-test the calculation service and report latency percentiles")
+    parser.add_argument("--url", help="host:port of a running service; by default one is started locally")
+    parser.add_argument("--endpoint", choices=("/simple", "/detailed", "/lookup"), default="/simple")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--window-ms", type=float, default=2.0, help="batching window of the started service")
+    parser.add_argument("--max-batch", type=int, default=4096, help="use 1 to measure without batching")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        host, port = args.url.rsplit(":", 1)
+        port = int(port)
+    else:
+        host, port = "127.0.0.1", free_port()
+        process = start_server(port, args.window_ms, args.max_batch)
+    try:
+        results = asyncio.run(load(host, port, args.endpoint, args.concurrency, args.requests))
+        results["server"] = asyncio.run(fetch_stats(host, port))["batches"]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{results['requests']:,} requests to {results['endpoint']} at concurrency {results['concurrency']}"
+              f" ({results['errors']} errors)")
+        print(f"  {results['requests_per_second']:,.0f} req/s   p50 {results['p50_ms']:.2f} ms   "
+              f"p99 {results['p99_ms']:.2f} ms   max {results['max_ms']:.2f} ms")
+        for kind, batches in results["server"].items():
+            if batches["batches"]:
+                print(f"  {kind}: {batches['rows']:,} rows in {batches['batches']:,} batches "
+                      f"(mean {batches['mean_batch']:.1f})")
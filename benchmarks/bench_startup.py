@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each probe runs in a fresh interpreter so module import costs are really cold
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import fixed_transformer_calc
+print(time.perf_counter() - start, 'PyQt5' in sys.modules)
+"""
+
+WINDOW_PROBE = """
+import os, time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+import transformer_gui
+app = QApplication([])
+imported = time.perf_counter()
+window = transformer_gui.TransformerCalculatorMainWindow()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+timings = {}
+for name in ("simple", "detailed", "tables"):
+    page_start = time.perf_counter()
+    getattr(window, {"simple": "show_simple_calculations", "detailed": "show_detailed_calculations",
+                     "tables": "show_transformer_tables"}[name])()
+    app.processEvents()
+    timings[name] = time.perf_counter() - page_start
+print(imported - start, shown - imported, timings["simple"], timings["detailed"], timings["tables"])
+"""
+
+def run_probe(source):
+    output = subprocess.run([sys.executable, "-c", source], cwd=ROOT, capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def run(repeat):
+    imports, qt_loaded = [], False
+    for _ in range(repeat):
+        seconds, loaded = run_probe(IMPORT_PROBE)
+        imports.append(float(seconds))
+        qt_loaded = qt_loaded or loaded == "True"
+
+    window_runs = [list(map(float, run_probe(WINDOW_PROBE))) for _ in range(repeat)]
+    keys = ("qt_import", "main_window_shown", "first_simple_page", "first_detailed_page", "first_tables_page")
+    results = {"core_import": median(imports), "core_import_loads_qt": qt_loaded}
+    for i, key in enumerate(keys):
+        results[key] = median([r[i] for r in window_runs])
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the calculator")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for key, value in results.items():
+            print(f"{key:<22}: {value * 1000:8.1f} ms" if isinstance(value, float) else f"{key:<22}: {value}")
@@ -0,0 +1,278 @@
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fault_engine import simple_fault_batch, detailed_fault_batch
+from bench_detailed import scalar_detailed
+import bench_startup
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7, 10**8)
+DEFAULT_TABLE_SIZES = (10**2, 10**4, 10**6)
+# Above this many rows the batch path runs chunk by chunk, as the CLI does, so memory stays flat
+CHUNK_ROWS = 10**6
+# The scalar path runs at a constant rate, so it is timed on at most this many rows
+SCALAR_ROWS = 10**5
+MIN_SECONDS = 0.5
+DEFAULT_TOLERANCE = 0.25
+
+# --- Per-row scalar path (the formulas as SimpleCalculationWidget.calculate runs them) ---
+def scalar_simple(vp, vs, kva, z_percent):
+    va = kva * 1000
+    vz = (vp * z_percent) / 100
+    secondary_full_load = va / (math.sqrt(3) * vs)
+    max_fault_current = (100 / z_percent) * secondary_full_load
+    return vz, secondary_full_load, max_fault_current, va / (math.sqrt(3) * vp)
+
+def make_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "zp": rng.uniform(0.1, 1.0, n), "r1_r2": rng.uniform(0.01, 2.0, n),
+        "vp": np.full(n, 11000.0), "vs": np.full(n, 415.0),
+        "kva": rng.choice([315.0, 630.0, 1000.0, 1600.0], n), "z_percent": rng.choice([4.5, 5.0, 6.0, 6.5], n),
+    }
+
+def best_time(func, min_seconds=MIN_SECONDS):
+    # Best single run, repeating small workloads until min_seconds have been spent
+    best, spent = float("inf"), 0.0
+    while spent < min_seconds or best == float("inf"):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best, spent = min(best, elapsed), spent + elapsed
+        if elapsed > min_seconds:
+            break
+    return best
+
+# --- Suites (each returns {metric name: (value, unit, "higher"/"lower" is better)}) ---
+def kernel_suite(sizes):
+    chunk = make_inputs(min(max(sizes), CHUNK_ROWS))
+    simple_args = [chunk[k] for k in ("vp", "vs", "kva", "z_percent")]
+    detailed_args = [chunk["zp"], chunk["r1_r2"], chunk["vp"], chunk["vs"], chunk["kva"] * 1000, chunk["z_percent"]]
+    metrics = {}
+    for kind, kernel, args, scalar in (("simple", simple_fault_batch, simple_args, scalar_simple),
+                                       ("detailed", detailed_fault_batch, detailed_args, scalar_detailed)):
+        rows = list(zip(*(a[:SCALAR_ROWS].tolist() for a in args)))
+        for n in sizes:
+            def batch_path(n=n):
+                for start in range(0, n, CHUNK_ROWS):
+                    kernel(*(a[:min(CHUNK_ROWS, n - start)] for a in args))
+
+            def scalar_path(m=min(n, SCALAR_ROWS)):
+                for row in rows[:m]:
+                    scalar(*row)
+
+            label = f"1e{round(math.log10(n))}"
+            metrics[f"{kind}.scalar.{label}"] = (min(n, SCALAR_ROWS) / best_time(scalar_path), "rows/s", "higher")
+            metrics[f"{kind}.batch.{label}"] = (n / best_time(batch_path), "rows/s", "higher")
+    return metrics
+
+def check_kernels(n=10**4, rtol=1e-12):
+    # The batch kernels must give the scalar path's answers before their speed counts
+    chunk = make_inputs(n, seed=1)
+    simple_args = [chunk[k] for k in ("vp", "vs", "kva", "z_percent")]
+    detailed_args = [chunk["zp"], chunk["r1_r2"], chunk["vp"], chunk["vs"], chunk["kva"] * 1000, chunk["z_percent"]]
+    mismatches = []
+    for kind, batch, args, scalar in (
+            ("simple", simple_fault_batch(*simple_args), simple_args, scalar_simple),
+            ("detailed", detailed_fault_batch(*detailed_args), detailed_args, scalar_detailed)):
+        names = (("vz", "secondary_full_load", "max_fault_current", "primary_current") if kind == "simple"
+                 else ("zsec", "earth_fault_current", "primary_fault_current"))
+        expected = np.array([scalar(*row) for row in zip(*(a.tolist() for a in args))])
+        for j, name in enumerate(names):
+            bad = ~np.isclose(batch[name], expected[:, j], rtol=rtol, atol=0)
+            if bad.any():
+                i = int(np.argmax(bad))
+                mismatches.append((f"{kind}.{name}", int(np.count_nonzero(bad)), float(batch[name][i]), float(expected[i, j])))
+    return mismatches
+
+def memory_suite(sizes):
+    # Peak traced allocation of one batched call; NumPy reports its buffers to tracemalloc
+    metrics = {}
+    for n in sizes:
+        args = make_inputs(n)
+        label = f"1e{round(math.log10(n))}"
+        for kind, call in (("simple", lambda: simple_fault_batch(args["vp"], args["vs"], args["kva"], args["z_percent"])),
+                           ("detailed", lambda: detailed_fault_batch(args["zp"], args["r1_r2"], args["vp"], args["vs"],
+                                                                     args["kva"] * 1000, args["z_percent"]))):
+            tracemalloc.start()
+            call()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            metrics[f"memory.{kind}.{label}"] = (peak / 2**20, "MiB", "lower")
+    return metrics
+
+TABLE_PROBE = """
+import os, sys, time, json
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import QApplication
+import transformer_gui
+from rating_tables import generate_table
+import numpy as np
+app = QApplication([])
+page = transformer_gui.TransformerTablesWidget(transformer_gui.load_transformer_data())
+page.show()
+app.processEvents()
+timings = {}
+for n in %r:
+    # A synthetic catalogue of n ratings: kVA steps against a Z%% series
+    table = generate_table(np.linspace(10, 5000, max(n // 100, 1)), 415, 11000, np.linspace(4, 8, 100), grid=True)
+    data = {name: table[name][:n] for name in ("kva", "primary_voltage", "secondary_voltage", "base_current", "impedance")}
+    start = time.perf_counter()
+    tab = page.create_table_tab("Catalogue", ["kVA", "V_pri", "V_sec", "I_base (A)", "Z (%%)"], data)
+    page.tab_widget.setCurrentIndex(page.tab_widget.addTab(tab, str(n)))
+    app.processEvents()
+    timings[n] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+# Builds every calculator page afresh inside a shown main window (so the theme
+# applies), up to the first painted frame, and times re-applying the theme once
+# all pages exist
+UI_PROBE = """
+import os, sys, time, json
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEvent
+import transformer_gui
+app = QApplication([])
+window = transformer_gui.TransformerCalculatorMainWindow()
+window.show()
+app.processEvents()
+timings = {}
+for name, factory in window.page_factories.items():
+    runs = []
+    for _ in range(%d):
+        start = time.perf_counter()
+        page = factory()
+        window.stacked_widget.addWidget(page)
+        window.stacked_widget.setCurrentWidget(page)
+        page.grab()
+        runs.append(time.perf_counter() - start)
+        window.stacked_widget.removeWidget(page)
+        page.deleteLater()
+        # No event loop runs here, so deferred deletes have to be flushed by hand
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+    timings[name] = sorted(runs)[len(runs) // 2]
+for name in window.page_factories:
+    window.switch_page(name)
+    app.processEvents()
+start = time.perf_counter()
+window.set_dark_theme()
+window.grab()
+timings["restyle"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+def ui_suite(repeat):
+    output = subprocess.run([sys.executable, "-c", UI_PROBE % repeat], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    timings = json.loads(output.stdout.strip().splitlines()[-1])
+    return {f"ui_build.{name}": (seconds, "s", "lower") for name, seconds in timings.items()}
+
+def table_suite(sizes):
+    output = subprocess.run([sys.executable, "-c", TABLE_PROBE % (tuple(sizes),)], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    timings = json.loads(output.stdout.strip().splitlines()[-1])
+    return {f"table_render.1e{round(math.log10(int(n)))}": (seconds, "s", "lower") for n, seconds in timings.items()}
+
+def startup_suite(repeat):
+    results = bench_startup.run(repeat)
+    return {f"startup.{name}": (value, "s", "lower") for name, value in results.items() if isinstance(value, float)}
+
+# --- Baselines and the regression gate ---
+def to_json(metrics):
+    return {"machine": {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+            "metrics": {name: {"value": value, "unit": unit, "better": better}
+                        for name, (value, unit, better) in metrics.items()}}
+
+def compare(metrics, baseline, tolerance):
+    # A metric regresses when it is more than tolerance worse than its baseline value
+    regressions = []
+    for name, (value, unit, better) in metrics.items():
+        reference = baseline["metrics"].get(name)
+        if reference is None:
+            continue
+        ratio = value / reference["value"] if reference["value"] else float("inf")
+        worse = ratio < 1 - tolerance if better == "higher" else ratio > 1 + tolerance
+        if worse:
+            regressions.append((name, reference["value"], value, unit))
+    return regressions
+
+def format_value(value, unit):
+    if unit == "rows/s":
+        return f"{value:,.0f} rows/s"
+    if unit == "s":
+        return f"{value * 1000:.1f} ms"
+    return f"{value:.1f} {unit}"
+
+def parse_sizes(text):
+    return tuple(int(float(v)) for v in text.split(","))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the calculator benchmarks and check them against a JSON baseline")
+    parser.add_argument("--suites", default="kernels,memory,tables,ui,startup",
+                        help="comma-separated subset of kernels,memory,tables,ui,startup")
+    parser.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES, help="row counts for the kernel suite")
+    parser.add_argument("--memory-sizes", type=parse_sizes, default=(10**4, 10**6))
+    parser.add_argument("--table-sizes", type=parse_sizes, default=DEFAULT_TABLE_SIZES)
+    parser.add_argument("--ui-repeat", type=int, default=15, help="page builds per page in the ui suite")
+    parser.add_argument("--startup-repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before a metric fails (default %(default)s = 25%%)")
+    parser.add_argument("--output", help="also write the results JSON here")
+    args = parser.parse_args()
+
+    suites = set(args.suites.split(","))
+    metrics = {}
+    if "kernels" in suites:
+        mismatches = check_kernels()
+        for name, count, got, expected in mismatches:
+            print(f"MISMATCH {name}: {count:,} rows differ from the scalar path (e.g. {got!r} vs {expected!r})")
+        if mismatches:
+            sys.exit(1)
+        metrics.update(kernel_suite(args.sizes))
+    if "memory" in suites:
+        metrics.update(memory_suite(args.memory_sizes))
+    if "tables" in suites:
+        metrics.update(table_suite(args.table_sizes))
+    if "ui" in suites:
+        metrics.update(ui_suite(args.ui_repeat))
+    if "startup" in suites:
+        metrics.update(startup_suite(args.startup_repeat))
+
+    for name, (value, unit, _) in metrics.items():
+        print(f"{name:<32} {format_value(value, unit):>22}")
+    results = to_json(metrics)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        sys.exit(0)
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to record one")
+        sys.exit(0)
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(metrics, json.load(f), args.tolerance)
+    for name, before, after, unit in regressions:
+        print(f"REGRESSION {name}: {format_value(before, unit)} -> {format_value(after, unit)}")
+    if regressions:
+        sys.exit(1)
+    print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
@@ -0,0 +1,146 @@
+import argparse
+import csv
+import json
+import os
+import time
+
+import numpy as np
+
+from fault_engine import transformer_source_impedance, detailed_fault_batch
+
+SQRT3 = np.sqrt(3.0)
+# R1+R2 at 70 °C (PVC operating temperature) relative to the 20 °C table values
+DEFAULT_TEMPERATURE_FACTOR = 1.20
+DEFAULT_MAX_DROP_PERCENT = 5.0
+LIMITS = ("ampacity", "voltage_drop", "fault_current")
+
+# Typical copper multicore PVC cable: conductor resistance at 20 °C (mΩ/m),
+# current-carrying capacity (A, clipped direct) and three-phase voltage drop
+# (mV/A/m). The CPC is taken as the same size as the line conductor.
+COPPER_PVC_MULTICORE = {
+    "size_mm2": (1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240, 300),
+    "r1": (12.10, 7.41, 4.61, 3.08, 1.83, 1.15, 0.727, 0.524, 0.387, 0.268, 0.193, 0.153, 0.124, 0.0991, 0.0754, 0.0601),
+    "ampacity": (17.5, 24, 32, 41, 57, 76, 96, 119, 144, 184, 223, 259, 299, 341, 403, 464),
+    "mv_per_a_m": (25, 15, 9.5, 6.4, 3.8, 2.4, 1.5, 1.1, 0.81, 0.57, 0.42, 0.34, 0.29, 0.24, 0.21, 0.185),
+}
+
+# --- Cable catalogue (sorted by conductor size) ---
+class CableCatalogue:
+    # Columns are sorted by size, and a bigger cable must never be worse:
+    # ampacity rises while R1+R2 and voltage drop fall. Each sizing constraint
+    # is then a binary search (np.searchsorted) over one of those columns.
+    def __init__(self, size_mm2, r1, ampacity, mv_per_a_m, r2=None, names=None):
+        order = np.argsort(np.asarray(size_mm2, dtype=np.float64), kind="stable")
+        self.size_mm2 = np.asarray(size_mm2, dtype=np.float64)[order]
+        r1 = np.asarray(r1, dtype=np.float64)[order]
+        r2 = r1 if r2 is None else np.asarray(r2, dtype=np.float64)[order]
+        self.r1_r2 = r1 + r2
+        self.ampacity = np.asarray(ampacity, dtype=np.float64)[order]
+        self.mv_per_a_m = np.asarray(mv_per_a_m, dtype=np.float64)[order]
+        self.names = (np.array([f"{s:g} mm²" for s in self.size_mm2]) if names is None
+                      else np.asarray(names, dtype=str)[order])
+        if np.any(np.diff(self.ampacity) < 0) or np.any(np.diff(self.r1_r2) > 0) or np.any(np.diff(self.mv_per_a_m) > 0):
+            raise ValueError("cable catalogue must improve with size: ampacity rising, R1+R2 and mV/A/m falling")
+
+    def __len__(self):
+        return len(self.size_mm2)
+
+    @classmethod
+    def default(cls):
+        return cls(**COPPER_PVC_MULTICORE)
+
+    @classmethod
+    def from_file(cls, path):
+        # CSV or JSON records with size_mm2, r1, ampacity, mv_per_a_m and optionally r2, name
+        if os.path.splitext(path)[1].lower() == ".json":
+            with open(path, encoding="utf-8") as f:
+                records = json.load(f)
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                records = list(csv.DictReader(f))
+        columns = {name: [float(r[name]) for r in records] for name in ("size_mm2", "r1", "ampacity", "mv_per_a_m")}
+        if all(r.get("r2") not in (None, "") for r in records):
+            columns["r2"] = [float(r["r2"]) for r in records]
+        if all(r.get("name") for r in records):
+            columns["names"] = [r["name"] for r in records]
+        return cls(**columns)
+
+    # --- Smallest size meeting each constraint ---
+    def min_index_ampacity(self, design_current):
+        return np.searchsorted(self.ampacity, design_current, side="left")
+
+    def min_index_voltage_drop(self, max_mv_per_a_m):
+        # mV/A/m falls with size; search the negated column so it is ascending
+        return np.searchsorted(-self.mv_per_a_m, -max_mv_per_a_m, side="left")
+
+    def min_index_r1_r2(self, max_r1_r2_per_m):
+        return np.searchsorted(-self.r1_r2, -max_r1_r2_per_m, side="left")
+
+# --- Optimizer ---
+def size_cables(catalogue, length, design_current, min_fault_current, zp, vp, vs, va, z_percent,
+                max_drop_percent=DEFAULT_MAX_DROP_PERCENT, temperature_factor=DEFAULT_TEMPERATURE_FACTOR):
+    # Smallest catalogue cable per circuit that carries design_current, keeps
+    # the voltage drop within max_drop_percent of Vs, and keeps R1+R2 low
+    # enough that the earth-fault current from the DetailedCalculationWidget
+    # chain (Zp referred + Zt + R1+R2) reaches min_fault_current.
+    # length in m, impedances in Ω, the rating in VA. index is -1 where no cable fits.
+    length = np.asarray(length, dtype=np.float64)
+    design_current = np.asarray(design_current, dtype=np.float64)
+    min_fault_current = np.asarray(min_fault_current, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    zp_referred, zt = transformer_source_impedance(zp, vp, vs, va, z_percent)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # mV/A/m * Ib * L / 1000 <= drop limit in volts
+        max_mv_per_a_m = (max_drop_percent / 100) * vs * 1000 / (design_current * length)
+        # (Vs/√3) / (Zsource + (R1+R2)/1000 * L * k) >= Ia
+        max_r1_r2 = ((vs / SQRT3) / min_fault_current - (zp_referred + zt)) * 1000 / (length * temperature_factor)
+
+    by_limit = np.stack(np.broadcast_arrays(catalogue.min_index_ampacity(design_current),
+                                            catalogue.min_index_voltage_drop(max_mv_per_a_m),
+                                            catalogue.min_index_r1_r2(max_r1_r2)))
+    index = by_limit.max(axis=0)
+    limiting = by_limit.argmax(axis=0)
+    found = index < len(catalogue)
+    index = np.where(found, index, -1)
+
+    safe = np.where(found, index, 0)
+    r1_r2 = np.where(found, catalogue.r1_r2[safe] * length * temperature_factor / 1000, np.nan)
+    check = detailed_fault_batch(zp, r1_r2, vp, vs, va, z_percent)
+    return {
+        "index": index,
+        "size_mm2": np.where(found, catalogue.size_mm2[safe], np.nan),
+        "r1_r2": r1_r2,
+        "earth_fault_current": check["earth_fault_current"],
+        "voltage_drop_percent": np.where(found, catalogue.mv_per_a_m[safe] * design_current * length / 1000 / vs * 100, np.nan),
+        "limiting": limiting,
+        "found": found,
+    }
+
+def _synthetic_circuits(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "length": rng.uniform(5, 250, n), "design_current": rng.uniform(5, 300, n),
+        "min_fault_current": rng.choice([80.0, 160.0, 320.0, 640.0, 1280.0], n),
+        "zp": 0.46, "vp": 11000.0, "vs": 415.0, "va": 1e6, "z_percent": 6.0,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Size cables for many circuits against ampacity, voltage drop and fault current")
+    parser.add_argument("--circuits", type=int, default=50_000)
+    parser.add_argument("--catalogue", help="CSV/JSON cable catalogue (default: built-in copper PVC multicore)")
+    parser.add_argument("--max-drop", type=float, default=DEFAULT_MAX_DROP_PERCENT, help="voltage drop limit in %% of Vs")
+    args = parser.parse_args()
+
+    catalogue = CableCatalogue.from_file(args.catalogue) if args.catalogue else CableCatalogue.default()
+    circuits = _synthetic_circuits(args.circuits)
+    start = time.perf_counter()
+    result = size_cables(catalogue, max_drop_percent=args.max_drop, **circuits)
+    elapsed = time.perf_counter() - start
+    found = result["found"]
+    print(f"{args.circuits:,} circuits sized in {elapsed * 1000:.1f} ms ({args.circuits / elapsed:,.0f} circuits/s)")
+    print(f"  no suitable cable: {np.count_nonzero(~found):,}")
+    for i, name in enumerate(LIMITS):
+        print(f"  governed by {name:<13}: {np.count_nonzero(found & (result['limiting'] == i)):,}")
+    sizes, counts = np.unique(result["size_mm2"][found], return_counts=True)
+    print("  " + ", ".join(f"{s:g} mm²: {c:,}" for s, c in zip(sizes, counts)))
@@ -0,0 +1,85 @@
+import collections
+import threading
+
+import numpy as np
+
+from fault_engine import simple_fault, detailed_fault
+
+DEFAULT_MAXSIZE = 4096
+SIGNIFICANT_DIGITS = 12
+
+# --- Input normalisation ---
+def normalize(values, digits=SIGNIFICANT_DIGITS):
+    # Round to a fixed number of significant digits so 0.1 + 0.2 and 0.3, or
+    # "11000" and "11000.0", land on the same key; -0.0 becomes 0.0
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponent = np.floor(np.log10(np.abs(values)))
+    exponent = np.where(np.isfinite(exponent), exponent, 0)
+    scale = 10.0 ** (digits - 1 - exponent)
+    return np.round(values * scale) / scale + 0.0
+
+def normalize_key(*values):
+    return tuple(normalize(values).tolist())
+
+# --- Bounded LRU cache ---
+class CalculationCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, kind, inputs, compute):
+        key = (kind,) + normalize_key(*inputs)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        # Computed outside the lock; exceptions propagate and nothing is cached
+        result = compute(*inputs)
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self.entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+DEFAULT_CACHE = CalculationCache()
+
+def cached_simple_fault(vp, vs, kva, z_percent, cache=DEFAULT_CACHE):
+    return dict(cache.get_or_compute("simple", (vp, vs, kva, z_percent), simple_fault))
+
+def cached_detailed_fault(zp, r1_r2, vp, vs, va, z_percent, cache=DEFAULT_CACHE):
+    return dict(cache.get_or_compute("detailed", (zp, r1_r2, vp, vs, va, z_percent), detailed_fault))
+
+# --- Batch de-duplication ---
+def dedup_batch(kernel, *arrays):
+    # Evaluate kernel once per distinct (normalised) input row and scatter the
+    # results back to every row; also reports how many rows were unique
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arrays])
+    if arrays[0].size == 0:
+        return kernel(*arrays), 0
+    keys = np.ascontiguousarray(np.column_stack([normalize(a.ravel()) for a in arrays]))
+    # One structured row per input tuple lets np.unique sort rows as single values
+    rows = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+    unique_results = kernel(*[a.ravel()[first] for a in arrays])
+    shape = arrays[0].shape
+    return {name: values[inverse].reshape(shape) for name, values in unique_results.items()}, len(first)
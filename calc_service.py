@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+
+import numpy as np
+
+from fault_engine import simple_fault_batch, detailed_fault_batch
+from rating_catalogue import RatingCatalogue
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Requests arriving within this window are computed as one batch
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 4096
+MAX_BODY = 1 << 20
+
+SIMPLE_INPUTS = ("vp", "vs", "kva", "z_percent")
+DETAILED_INPUTS = ("zp", "r1_r2", "vp", "vs", "va", "z_percent")
+# Voltages, rating and Z% must be positive; source and cable impedances may be zero
+POSITIVE_INPUTS = ("vp", "vs", "kva", "va", "z_percent")
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# --- Request coalescing ---
+class BatchQueue:
+    # Collects single-row requests for one kernel and evaluates them together:
+    # the first request opens a window, and the batch runs when the window
+    # closes or max_batch requests are waiting, whichever comes first.
+    def __init__(self, kernel, names, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.kernel = kernel
+        self.names = names
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = []
+        self.timer = None
+        self.batches = 0
+        self.rows = 0
+
+    def submit(self, values):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((values, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.rows += len(batch)
+        try:
+            columns = np.array([values for values, _ in batch], dtype=np.float64).T
+            results = self.kernel(*columns)
+            rows = zip(*(np.broadcast_to(results[name], len(batch)).tolist() for name in results))
+            for (_, future), row in zip(batch, rows):
+                if not future.done():
+                    future.set_result(dict(zip(results, row)))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+# --- Calculations exposed over HTTP ---
+class CalculationService:
+    def __init__(self, catalogue=None, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.catalogue = catalogue or RatingCatalogue.from_tables()
+        self.queues = {
+            "simple": BatchQueue(simple_fault_batch, SIMPLE_INPUTS, window, max_batch),
+            "detailed": BatchQueue(detailed_fault_batch, DETAILED_INPUTS, window, max_batch),
+        }
+        self.requests = 0
+        self.started = time.perf_counter()
+
+    async def calculate(self, kind, body):
+        names = self.queues[kind].names
+        values = _read_numbers(body, names)
+        # Same rule as the calculator pages
+        if any(v <= 0 if name in POSITIVE_INPUTS else v < 0 for name, v in zip(names, values)):
+            raise RequestError(400, "Voltages, rating and Z% must be greater than zero; impedances cannot be negative.")
+        result = await self.queues[kind].submit(values)
+        result.pop("valid", None)
+        if kind == "detailed" and result["zsec"] == 0:
+            raise RequestError(400, "Total impedance cannot be zero.")
+        return {name: _json_number(value) for name, value in result.items()}
+
+    def lookup(self, body):
+        kva, vs = _read_numbers(body, ("kva", "secondary_voltage"))
+        present = [name for name in ("primary_voltage", "phases") if body.get(name) is not None]
+        options = dict(zip(present, _read_numbers(body, present)))
+        index = self.catalogue.covering(kva, vs, **options)
+        if index is None:
+            raise RequestError(404, f"no catalogue rating covers {kva:g} kVA at {vs:g} V")
+        return {name: _json_number(value) if isinstance(value, float) else value
+                for name, value in self.catalogue.row(index).items()}
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "uptime_s": time.perf_counter() - self.started,
+            "batches": {kind: {"batches": q.batches, "rows": q.rows,
+                               "mean_batch": q.rows / q.batches if q.batches else 0.0}
+                        for kind, q in self.queues.items()},
+        }
+
+    async def dispatch(self, method, path, body):
+        self.requests += 1
+        if path == "/stats" and method == "GET":
+            return self.stats()
+        if method != "POST":
+            raise RequestError(405, "use POST with a JSON body")
+        if path in ("/simple", "/detailed"):
+            return await self.calculate(path[1:], body)
+        if path == "/lookup":
+            return self.lookup(body)
+        raise RequestError(404, f"unknown endpoint {path}")
+
+    # --- Minimal HTTP/1.1 (keep-alive, JSON bodies) ---
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await _respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                method, path, _ = parts
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # Without a usable length the body can't be framed, so the connection ends here
+                    await _respond(writer, 400, {"error": "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await _respond(writer, 413, {"error": "request body too large"}, False)
+                    break
+                raw = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    body = json.loads(raw) if raw else {}
+                    if not isinstance(body, dict):
+                        raise RequestError(400, "the request body must be a JSON object")
+                    status, payload = 200, await self.dispatch(method, path.split("?", 1)[0], body)
+                except RequestError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except ValueError as e:
+                    status, payload = 400, {"error": f"Invalid input: {e}"}
+                await _respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def _respond(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode("utf-8")
+    reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+              413: "Payload Too Large"}.get(status, "Error")
+    writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                 .encode("latin-1") + body)
+    await writer.drain()
+
+def _read_numbers(body, names):
+    missing = [name for name in names if body.get(name) is None]
+    if missing:
+        raise RequestError(400, f"missing field(s): {', '.join(missing)}")
+    values = []
+    for name in names:
+        try:
+            value = float(body[name])
+        except (TypeError, ValueError):
+            raise RequestError(400, f"field {name!r} must be a number") from None
+        # json.loads accepts NaN and Infinity, and "nan"/"inf" strings convert too
+        if not math.isfinite(value):
+            raise RequestError(400, f"field {name!r} must be a finite number")
+        values.append(value)
+    return values
+
+def _json_number(value):
+    # NaN/inf are not valid JSON
+    return value if math.isfinite(value) else None
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+    service = CalculationService(window=window, max_batch=max_batch)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    return service, server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service for the transformer fault calculations")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW * 1000,
+                        help="how long to wait for more requests before computing a batch (default %(default)s)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args(argv)
+
+    async def run():
+        _, server = await serve(args.host, args.port, args.window_ms / 1000, args.max_batch)
+        print(f"serving on http://{args.host}:{args.port} (POST /simple, /detailed, /lookup; GET /stats)")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    main()
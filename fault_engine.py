@@ -0,0 +1,210 @@
+import numpy as np
+
+SQRT3 = np.sqrt(3.0)
+
+# --- Simple calculation (impedance voltage method) ---
+def simple_fault_batch(vp, vs, kva, z_percent, phases=3):
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    kva = np.asarray(kva, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+    # Single-phase ratings divide by V rather than √3·V
+    factor = np.where(np.asarray(phases) == 1, 1.0, SQRT3)
+
+    valid = (vp > 0) & (vs > 0) & (kva > 0) & (z_percent > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        va = kva * 1000
+        vz = (vp * z_percent) / 100
+        secondary_full_load = va / (factor * vs)
+        max_fault_current = (100 / z_percent) * secondary_full_load
+        primary_current = va / (factor * vp)
+
+    results = {
+        "vz": vz,
+        "secondary_full_load": secondary_full_load,
+        "primary_current": primary_current,
+        "max_fault_current": max_fault_current,
+        "max_fault_kA": max_fault_current / 1000,
+    }
+    return _mask_invalid(results, valid)
+
+def simple_fault(vp, vs, kva, z_percent, phases=3):
+    results = simple_fault_batch(vp, vs, kva, z_percent, phases)
+    return {name: values.item() for name, values in results.items()}
+
+# --- Detailed calculation (loop impedance / earth fault) ---
+def transformer_source_impedance(zp, vp, vs, va, z_percent):
+    zp = np.asarray(zp, dtype=np.float64)
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    va = np.asarray(va, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zp_referred = zp * (vs / vp)**2
+        zt = (z_percent / 100) * (vs**2 / va)
+    return zp_referred, zt
+
+def detailed_fault_batch(zp, r1_r2, vp, vs, va, z_percent):
+    zp_referred, zt = transformer_source_impedance(zp, vp, vs, va, z_percent)
+    r1_r2 = np.asarray(r1_r2, dtype=np.float64)
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    va = np.asarray(va, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+    return _detailed_from_chain(zp_referred, zt, r1_r2, vp, vs, va, z_percent)
+
+def feeder_schedule_batch(transformer_index, r1_r2, zp, vp, vs, va, z_percent):
+    # zp/vp/vs/va/z_percent describe each transformer once; every circuit only
+    # carries its own R1+R2 and the index of the transformer feeding it.
+    zp_referred, zt = transformer_source_impedance(zp, vp, vs, va, z_percent)
+    idx = np.asarray(transformer_index, dtype=np.intp)
+    r1_r2 = np.asarray(r1_r2, dtype=np.float64)
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    va = np.asarray(va, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+
+    valid = (vp > 0) & (vs > 0) & (va > 0) & (z_percent > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        voltage_to_earth = vs / SQRT3
+        secondary_full_load = va / (SQRT3 * vs)
+        max_theoretical_fault = (100 / z_percent) * secondary_full_load
+        ratio = vs / vp
+    source_z = zp_referred + zt
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zsec = source_z[idx] + r1_r2
+        earth_fault_current = voltage_to_earth[idx] / zsec
+        primary_fault_current = earth_fault_current * ratio[idx]
+
+    results = {
+        "zp_referred": zp_referred[idx],
+        "zt": zt[idx],
+        "zsec": zsec,
+        "voltage_to_earth": voltage_to_earth[idx],
+        "earth_fault_current": earth_fault_current,
+        "primary_fault_current": primary_fault_current,
+        "secondary_full_load": secondary_full_load[idx],
+        "max_theoretical_fault": max_theoretical_fault[idx],
+    }
+    return _mask_invalid(results, valid[idx])
+
+def _detailed_from_chain(zp_referred, zt, r1_r2, vp, vs, va, z_percent):
+    valid = (vp > 0) & (vs > 0) & (va > 0) & (z_percent > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zsec = zp_referred + zt + r1_r2
+        voltage_to_earth = vs / SQRT3
+        earth_fault_current = voltage_to_earth / zsec
+        primary_fault_current = earth_fault_current * (vs / vp)
+        secondary_full_load = va / (SQRT3 * vs)
+        max_theoretical_fault = (100 / z_percent) * secondary_full_load
+
+    results = {
+        "zp_referred": zp_referred,
+        "zt": zt,
+        "zsec": zsec,
+        "voltage_to_earth": voltage_to_earth,
+        "earth_fault_current": earth_fault_current,
+        "primary_fault_current": primary_fault_current,
+        "secondary_full_load": secondary_full_load,
+        "max_theoretical_fault": max_theoretical_fault,
+    }
+    return _mask_invalid(results, valid)
+
+def detailed_fault(zp, r1_r2, vp, vs, va, z_percent):
+    results = detailed_fault_batch(zp, r1_r2, vp, vs, va, z_percent)
+    results = {name: values.item() for name, values in results.items()}
+    if results["valid"] and results["zsec"] == 0:
+        raise ZeroDivisionError("total loop impedance is zero")
+    return results
+
+def _mask_invalid(results, valid):
+    # Rows that fail the same "> 0" check as the widgets come back as NaN
+    shape = np.broadcast_shapes(np.shape(valid), *(np.shape(v) for v in results.values()))
+    valid = np.broadcast_to(valid, shape)
+    all_valid = bool(valid.all())
+    for name, values in results.items():
+        if not all_valid:
+            values = np.where(valid, values, np.nan)
+        elif np.shape(values) != shape:
+            values = np.broadcast_to(values, shape).copy()
+        results[name] = values
+    results["valid"] = valid
+    return results
+
+# --- Complex impedance (R + jX) engine ---
+def split_impedance(z, x_r):
+    # Complex impedance with magnitude |z| and the given X/R ratio
+    z = np.asarray(z, dtype=np.float64)
+    x_r = np.asarray(x_r, dtype=np.float64)
+    r = z / np.sqrt(1 + x_r**2)
+    return r + 1j * r * x_r
+
+def x_r_ratio(z):
+    z = np.asarray(z, dtype=np.complex128)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return z.imag / z.real
+
+def peak_factor(x_r):
+    # IEC 60909-0 kappa = 1.02 + 0.98 e^(-3 R/X)
+    with np.errstate(divide='ignore'):
+        return 1.02 + 0.98 * np.exp(-3 / np.asarray(x_r, dtype=np.float64))
+
+def asymmetrical_factor(x_r):
+    # RMS of the asymmetrical current at the first half cycle relative to the symmetrical RMS
+    with np.errstate(divide='ignore'):
+        return np.sqrt(1 + 2 * np.exp(-2 * np.pi / np.asarray(x_r, dtype=np.float64)))
+
+def _add_asymmetry(results, x_r, current_name):
+    kappa = peak_factor(x_r)
+    results["x_r"] = x_r
+    results["kappa"] = kappa
+    results["peak_" + current_name] = kappa * np.sqrt(2) * results[current_name]
+    results["asym_" + current_name] = asymmetrical_factor(x_r) * results[current_name]
+    return results
+
+def simple_fault_batch_complex(vp, vs, kva, z_percent, x_r):
+    # Symmetrical currents are the same as the magnitude path; the transformer
+    # X/R adds the complex impedance, peak (ip) and asymmetrical fault current
+    results = simple_fault_batch(vp, vs, kva, z_percent)
+    valid = results.pop("valid")
+    vs = np.asarray(vs, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zt = split_impedance((np.asarray(z_percent, dtype=np.float64) / 100) * (vs**2 / (np.asarray(kva, dtype=np.float64) * 1000)), x_r)
+    results["zt"] = zt
+    _add_asymmetry(results, np.asarray(x_r, dtype=np.float64), "max_fault_current")
+    return _mask_invalid(results, valid)
+
+def detailed_fault_batch_complex(zp, r1_r2, vp, vs, va, z_percent, x_r):
+    # zp and r1_r2 may be complex (R + jX); the transformer impedance takes its
+    # angle from x_r. Impedances add as phasors, so |zsec| reflects X/R.
+    zp = np.asarray(zp, dtype=np.complex128)
+    r1_r2 = np.asarray(r1_r2, dtype=np.complex128)
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    va = np.asarray(va, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+
+    valid = (vp > 0) & (vs > 0) & (va > 0) & (z_percent > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zp_referred = zp * (vs / vp)**2
+        zt = split_impedance((z_percent / 100) * (vs**2 / va), x_r)
+        zsec = zp_referred + zt + r1_r2
+        voltage_to_earth = vs / SQRT3
+        earth_fault_current = voltage_to_earth / np.abs(zsec)
+        primary_fault_current = earth_fault_current * (vs / vp)
+        secondary_full_load = va / (SQRT3 * vs)
+        max_theoretical_fault = (100 / z_percent) * secondary_full_load
+
+    results = {
+        "zp_referred": zp_referred,
+        "zt": zt,
+        "zsec": zsec,
+        "voltage_to_earth": voltage_to_earth,
+        "earth_fault_current": earth_fault_current,
+        "primary_fault_current": primary_fault_current,
+        "secondary_full_load": secondary_full_load,
+        "max_theoretical_fault": max_theoretical_fault,
+    }
+    _add_asymmetry(results, x_r_ratio(zsec), "earth_fault_current")
+    return _mask_invalid(results, valid)
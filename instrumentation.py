@@ -0,0 +1,142 @@
+import atexit
+import cProfile
+import collections
+import os
+import threading
+import time
+
+# Opt-in timing counters and session profiling. Nothing is recorded unless
+# enable() is called (or TRANSFORMER_INSTRUMENT=1 is set); while disabled,
+# span() hands back one shared no-op context manager.
+INSTRUMENT_ENV = "TRANSFORMER_INSTRUMENT"
+PROFILE_ENV = "TRANSFORMER_PROFILE"
+
+class _State:
+    enabled = False
+    profiler = None
+
+_state = _State()
+_lock = threading.Lock()
+_local = threading.local()
+# name -> [count, total seconds, max seconds]
+_counters = {}
+# "outer;inner" stack -> self seconds, in the collapsed format flamegraph.pl reads
+_stacks = collections.Counter()
+
+def enable():
+    _state.enabled = True
+
+def disable():
+    _state.enabled = False
+
+def is_enabled():
+    return _state.enabled
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _stacks.clear()
+
+# --- Timing spans ---
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+    __slots__ = ("name", "start", "child_time")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self.child_time = 0.0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stack = _local.stack
+        path = ";".join(s.name for s in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_time += elapsed
+        with _lock:
+            counter = _counters.get(self.name)
+            if counter is None:
+                counter = _counters[self.name] = [0, 0.0, 0.0]
+            counter[0] += 1
+            counter[1] += elapsed
+            counter[2] = max(counter[2], elapsed)
+            _stacks[path] += elapsed - self.child_time
+        return False
+
+def span(name):
+    # with span("compute"): ...  -- nested spans build the flamegraph stacks
+    return Span(name) if _state.enabled else NULL_SPAN
+
+def snapshot():
+    # Counters sorted by total time: name, count, total/mean/max in seconds
+    with _lock:
+        rows = [{"name": name, "count": count, "total": total, "mean": total / count, "max": longest}
+                for name, (count, total, longest) in _counters.items()]
+    return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+# --- Session profiling and trace dumps ---
+def start_profile():
+    # cProfile only sees the thread it was started on (the GUI thread); pool
+    # threads still show up through their spans
+    enable()
+    if _state.profiler is None:
+        _state.profiler = cProfile.Profile()
+        _state.profiler.enable()
+
+def stop_profile():
+    profiler, _state.profiler = _state.profiler, None
+    if profiler is not None:
+        profiler.disable()
+    return profiler
+
+def is_profiling():
+    return _state.profiler is not None
+
+def dump_trace(directory, profiler=None):
+    # Writes session.prof (pstats, for snakeviz/flameprof) when a profile ran,
+    # and spans.collapsed (one "a;b;c microseconds" line per stack) for flamegraph.pl/speedscope
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    profiler = profiler or _state.profiler
+    if profiler is not None:
+        path = os.path.join(directory, "session.prof")
+        # dump_stats stops the profiler; a running session carries on afterwards
+        profiler.dump_stats(path)
+        if profiler is _state.profiler:
+            profiler.enable()
+        written.append(path)
+    path = os.path.join(directory, "spans.collapsed")
+    with _lock:
+        lines = [f"{stack} {round(seconds * 1e6)}\n" for stack, seconds in sorted(_stacks.items())]
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    written.append(path)
+    return written
+
+def configure_from_env():
+    if os.environ.get(INSTRUMENT_ENV, "") not in ("", "0"):
+        enable()
+    directory = os.environ.get(PROFILE_ENV)
+    if directory:
+        start_profile()
+        atexit.register(lambda: dump_trace(directory, stop_profile()))
+
+configure_from_env()
@@ -0,0 +1,101 @@
+import argparse
+import collections
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from transformer_cli import calculate_chunk
+
+DEFAULT_SHARD_SIZE = 250_000
+
+# --- Sharded execution ---
+def default_workers():
+    return os.cpu_count() or 1
+
+def split_shards(n_rows, shard_size):
+    return [(start, min(start + shard_size, n_rows)) for start in range(0, n_rows, shard_size)]
+
+def _run_shard(args):
+    columns, options = args
+    return calculate_chunk(columns, **options)
+
+def imap_ordered(executor, func, items, max_pending):
+    # Like executor.map, but never has more than max_pending shards in flight,
+    # so a streaming input is not pulled into memory all at once. Each result
+    # is yielded together with the item it was computed from.
+    pending = collections.deque()
+    for item in items:
+        pending.append((item, executor.submit(func, item)))
+        if len(pending) >= max_pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+def run_sharded(columns, workers=None, shard_size=DEFAULT_SHARD_SIZE, **options):
+    # options are passed through to transformer_cli.calculate_chunk (mode, dedupe, engine)
+    workers = workers or default_workers()
+    n_rows = len(columns["vp"])
+    shards = split_shards(n_rows, shard_size)
+    items = (({name: values[start:stop] for name, values in columns.items()}, options) for start, stop in shards)
+
+    if workers == 1 or len(shards) <= 1:
+        parts = [_run_shard(item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = [result for _, result in imap_ordered(executor, _run_shard, items, workers * 2)]
+
+    if not parts:
+        return {}
+    # Shards come back in submission order, so concatenation restores input order
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+def run_chunks(chunks, workers=None, **options):
+    workers = workers or default_workers()
+    if workers == 1:
+        for columns in chunks:
+            yield columns, calculate_chunk(columns, **options)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        items = ((columns, options) for columns in chunks)
+        for (columns, _), results in imap_ordered(executor, _run_shard, items, workers * 2):
+            yield columns, results
+
+# --- Throughput scaling report ---
+def make_study(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "vp": 11000 * (1 + rng.integers(-2, 3, n_rows) * 0.025),
+        "vs": np.full(n_rows, 415.0),
+        "kva": rng.choice([315.0, 630.0, 1000.0, 1600.0], n_rows),
+        "z_percent": rng.uniform(4.0, 7.0, n_rows),
+        "zp": rng.uniform(0.1, 1.0, n_rows),
+        "r1_r2": rng.uniform(0.01, 2.0, n_rows),
+    }
+
+def scaling_report(n_rows, max_workers=None, shard_size=DEFAULT_SHARD_SIZE):
+    max_workers = max_workers or default_workers()
+    columns = make_study(n_rows)
+    report = []
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        run_sharded(columns, workers, shard_size)
+        elapsed = time.perf_counter() - start
+        rate = n_rows / elapsed
+        baseline = baseline or rate
+        report.append({"workers": workers, "seconds": elapsed, "rows_per_second": rate, "speedup": rate / baseline})
+    return report
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Report fault-study throughput from 1 to N worker processes")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    args = parser.parse_args()
+    print(f"{'workers':>7} {'seconds':>9} {'rows/s':>14} {'speedup':>8}")
+    for row in scaling_report(args.rows, args.workers, args.shard_size):
+        print(f"{row['workers']:>7} {row['seconds']:>9.3f} {row['rows_per_second']:>14,.0f} {row['speedup']:>7.2f}x")
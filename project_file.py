@@ -0,0 +1,188 @@
+import json
+import os
+
+MAGIC = b"TXPROJ 1\n"
+# Rewrite the file once superseded records take up more than this share of it
+COMPACT_RATIO = 0.5
+
+# --- Project file layout ---
+# An append-only journal of records. Each record is one header line
+#   <section name> <kind> <payload length>\n
+# followed by the payload and a newline. kind is "json" (any JSON value); it
+# leaves room for other payload encodings later. The newest record for a
+# section wins; a "null" json payload deletes it. Opening a project only
+# reads the header lines and skips over payloads, so sections are decoded
+# the first time they are asked for.
+
+class ProjectFormatError(ValueError):
+    pass
+
+def _encode(value):
+    return "json", json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+def _decode(kind, payload):
+    if kind != "json":
+        raise ProjectFormatError(f"unsupported section kind {kind!r}")
+    return json.loads(payload)
+
+class Project:
+    def __init__(self, path=None):
+        self.path = path
+        # section -> (kind, payload offset, payload length, record size) of its newest record on disk
+        self.index = {}
+        # decoded values, including unsaved ones
+        self.values = {}
+        self.dirty = set()
+        self.file_size = 0
+        self.live_size = 0
+        if path is not None and os.path.exists(path):
+            self._scan()
+
+    # --- Reading ---
+    def _scan(self):
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ProjectFormatError(f"{self.path} is not a project file")
+            # Appends start after the magic even if no record survives
+            self.file_size = len(MAGIC)
+            while True:
+                start = f.tell()
+                header = f.readline()
+                if not header:
+                    break
+                if not header.endswith(b"\n"):
+                    # A save interrupted mid-header; everything before it is intact
+                    break
+                try:
+                    name, kind, length = header.decode("utf-8").rsplit(" ", 2)
+                    length = int(length)
+                except ValueError:
+                    raise ProjectFormatError(f"corrupt record header at byte {start}") from None
+                offset = f.tell()
+                f.seek(length + 1, os.SEEK_CUR)
+                if f.tell() > os.fstat(f.fileno()).st_size:
+                    # A save interrupted mid-record; everything before it is intact
+                    break
+                if kind == "json" and length == 4 and self._read(f, offset, length) == b"null":
+                    self.index.pop(name, None)
+                else:
+                    self.index[name] = (kind, offset, length, f.tell() - start)
+                self.file_size = f.tell()
+        self.live_size = sum(record[3] for record in self.index.values())
+
+    @staticmethod
+    def _read(f, offset, length):
+        position = f.tell()
+        f.seek(offset)
+        payload = f.read(length)
+        f.seek(position)
+        return payload
+
+    def sections(self):
+        # Deleted but not yet saved sections hold None
+        names = set(self.index) | set(self.values)
+        return sorted(name for name in names if self.values.get(name, True) is not None)
+
+    def __contains__(self, name):
+        return self.values[name] is not None if name in self.values else name in self.index
+
+    def get(self, name, default=None):
+        if name in self.values:
+            value = self.values[name]
+            return default if value is None else value
+        if name not in self.index:
+            return default
+        kind, offset, length, _ = self.index[name]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            value = _decode(kind, f.read(length))
+        self.values[name] = value
+        return value
+
+    # --- Changing ---
+    def set(self, name, value):
+        # Only a real change marks the section dirty
+        if " " in name or "\n" in name:
+            raise ValueError("section names cannot contain spaces or newlines")
+        if name in self and _same(self.get(name), value):
+            return False
+        self.values[name] = value
+        self.dirty.add(name)
+        return True
+
+    def delete(self, name):
+        if name in self:
+            self.values[name] = None
+            self.dirty.add(name)
+            if name not in self.index:
+                # Never saved, so there is nothing on disk to delete
+                del self.values[name]
+                self.dirty.discard(name)
+
+    @property
+    def is_dirty(self):
+        return bool(self.dirty)
+
+    # --- Saving ---
+    def save(self, path=None):
+        # Appends one record per dirty section; a new path (or a file that is
+        # mostly superseded records) gets a full rewrite instead
+        if path is not None and path != self.path:
+            return self._rewrite(path)
+        if self.path is None:
+            raise ValueError("the project has no file name yet")
+        if not os.path.exists(self.path):
+            return self._rewrite(self.path)
+        if not self.dirty:
+            return 0
+        with open(self.path, "r+b") as f:
+            # Drop a torn record left by an interrupted save before appending
+            f.truncate(self.file_size)
+            f.seek(self.file_size)
+            written = self._append(f, sorted(self.dirty))
+            f.flush()
+            os.fsync(f.fileno())
+        self.dirty.clear()
+        if self.file_size and self.live_size < self.file_size * (1 - COMPACT_RATIO):
+            self._rewrite(self.path)
+        return written
+
+    def _append(self, f, names):
+        written = 0
+        for name in names:
+            value = self.values[name]
+            kind, payload = _encode(value)
+            header = f"{name} {kind} {len(payload)}\n".encode("utf-8")
+            start = f.tell()
+            f.write(header + payload + b"\n")
+            if value is None:
+                self.index.pop(name, None)
+                del self.values[name]
+            else:
+                self.index[name] = (kind, start + len(header), len(payload), f.tell() - start)
+            written += f.tell() - start
+        self.file_size = f.tell()
+        self.live_size = sum(record[3] for record in self.index.values())
+        return written
+
+    def _rewrite(self, path):
+        # Every live section, written to a temporary file and swapped in
+        names = self.sections()
+        for name in names:
+            self.get(name)
+        self.values = {name: value for name, value in self.values.items() if value is not None}
+        tmp = path + ".tmp"
+        self.index = {}
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            written = self._append(f, names)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self.path = path
+        self.dirty.clear()
+        return written
+
+def _same(a, b):
+    # Compare through JSON so 1 vs 1.0 or tuple vs list count as unchanged only when they save the same
+    return _encode(a) == _encode(b)
@@ -0,0 +1,122 @@
+import numpy as np
+
+SQRT3 = np.sqrt(3.0)
+
+def transformer_impedance(vs, va, z_percent):
+    # Transformer impedance referred to its secondary, as in DetailedCalculationWidget
+    return (z_percent / 100) * (vs**2 / va)
+
+# --- Radial network short-circuit solver ---
+class RadialNetwork:
+    # A tree of sources, transformers and cables. Every node carries the
+    # impedance of the branch feeding it (in ohms at the node's own voltage)
+    # and its line voltage. Impedances are accumulated from the root as
+    # Z / V^2, which refers upstream impedance through any transformer exactly
+    # like zp * (Vs / Vp)^2 in the detailed calculation.
+    def __init__(self):
+        self.parent = []
+        self.branch = []
+        self.voltage = []
+        self.names = []
+        self.solved = False
+
+    def __len__(self):
+        return len(self.parent)
+
+    # --- Building the tree ---
+    def add_node(self, parent, impedance, voltage=None, name=None):
+        if parent is not None and not 0 <= parent < len(self.parent):
+            raise ValueError(f"unknown parent node {parent}")
+        if voltage is None:
+            if parent is None:
+                raise ValueError("a root node needs a voltage")
+            voltage = self.voltage[parent]
+        self.parent.append(-1 if parent is None else parent)
+        self.branch.append(impedance)
+        self.voltage.append(float(voltage))
+        self.names.append(name if name is not None else f"node{len(self.names)}")
+        self.solved = False
+        return len(self.parent) - 1
+
+    def add_source(self, voltage, impedance=0.0, name=None):
+        return self.add_node(None, impedance, voltage, name)
+
+    def add_transformer(self, parent, vs, va, z_percent, name=None):
+        return self.add_node(parent, transformer_impedance(vs, va, z_percent), vs, name)
+
+    def add_cable(self, parent, impedance, name=None):
+        return self.add_node(parent, impedance, None, name)
+
+    # --- Solving ---
+    def solve(self):
+        n = len(self.parent)
+        parent = np.asarray(self.parent, dtype=np.intp)
+        self.voltage_array = np.asarray(self.voltage, dtype=np.float64)
+        self.branch_array = np.asarray(self.branch)
+        if not np.iscomplexobj(self.branch_array):
+            self.branch_array = self.branch_array.astype(np.float64)
+
+        children = [[] for _ in range(n)]
+        for node in range(n):
+            if parent[node] >= 0:
+                children[parent[node]].append(node)
+
+        # One depth-first pass: preorder position and accumulated Z / V^2 of every node
+        order = np.empty(n, dtype=np.intp)
+        normalized = np.zeros(n, dtype=self.branch_array.dtype)
+        weight = self.branch_array / self.voltage_array**2
+        position = 0
+        stack = [node for node in range(n - 1, -1, -1) if parent[node] < 0]
+        while stack:
+            node = stack.pop()
+            order[position] = node
+            position += 1
+            up = parent[node]
+            normalized[node] = weight[node] + (normalized[up] if up >= 0 else 0)
+            stack.extend(reversed(children[node]))
+
+        # In preorder every subtree is a contiguous run starting at its root
+        size = np.ones(n, dtype=np.intp)
+        for node in order[::-1]:
+            if parent[node] >= 0:
+                size[parent[node]] += size[node]
+        self.order = order
+        self.position = np.empty(n, dtype=np.intp)
+        self.position[order] = np.arange(n)
+        self.subtree_size = size
+        self.normalized = normalized
+        self.solved = True
+        return self.results()
+
+    def results(self, nodes=None):
+        if not self.solved:
+            return self.solve()
+        nodes = slice(None) if nodes is None else nodes
+        v = self.voltage_array[nodes]
+        z_total = self.normalized[nodes] * v**2
+        with np.errstate(divide='ignore'):
+            fault_current = (v / SQRT3) / np.abs(z_total)
+        return {"z_total": z_total, "fault_current": fault_current, "fault_kA": fault_current / 1000}
+
+    def update_branch(self, node, impedance):
+        # Change one branch and shift only its subtree; returns the affected nodes in preorder
+        if not self.solved:
+            self.branch[node] = impedance
+            self.solve()
+            return self.order
+        delta = (impedance - self.branch_array[node]) / self.voltage_array[node]**2
+        if np.iscomplexobj(delta) and not np.iscomplexobj(self.normalized):
+            self.normalized = self.normalized.astype(np.complex128)
+            self.branch_array = self.branch_array.astype(np.complex128)
+        self.branch[node] = impedance
+        self.branch_array[node] = impedance
+        start = self.position[node]
+        affected = self.order[start:start + self.subtree_size[node]]
+        self.normalized[affected] += delta
+        return affected
+
+    def update_transformer(self, node, va, z_percent):
+        return self.update_branch(node, transformer_impedance(self.voltage[node], va, z_percent))
+
+    def fault_at(self, node):
+        return {name: values.item() for name, values in self.results(np.array([node])).items()}
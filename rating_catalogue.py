@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+
+import numpy as np
+
+from transformer_data import load_transformer_data
+
+# Numeric columns every catalogue carries; voltages are line-to-line volts and
+# base_current is the full-load current on the secondary (LV) side.
+CATALOGUE_COLUMNS = ("kva", "phases", "primary_voltage", "secondary_voltage", "impedance",
+                     "base_current", "primary_current")
+
+# --- Columnar rating catalogue ---
+class RatingCatalogue:
+    # Struct-of-arrays catalogue sorted by voltage class (phases, Vp, Vs) and
+    # then kVA. Each voltage class is a contiguous slice, so rating lookups are
+    # a binary search (np.searchsorted) inside one slice.
+    def __init__(self, columns, sources=None):
+        n = len(columns["kva"])
+        data = {}
+        for name in CATALOGUE_COLUMNS:
+            values = columns.get(name)
+            data[name] = np.full(n, np.nan) if values is None else np.asarray(values, dtype=np.float64)
+        # Unknown primary voltage (e.g. the single-phase table) is stored as 0 so it can form a class
+        data["primary_voltage"] = np.nan_to_num(data["primary_voltage"], nan=0.0)
+        data["phases"] = np.nan_to_num(data["phases"], nan=3.0)
+        self.sources = np.asarray(sources if sources is not None else np.full(n, ""), dtype=object)
+
+        order = np.lexsort((data["kva"], data["secondary_voltage"], data["primary_voltage"], data["phases"]))
+        self.columns = {name: values[order] for name, values in data.items()}
+        self.sources = self.sources[order]
+
+        keys = np.column_stack([self.columns["phases"], self.columns["primary_voltage"], self.columns["secondary_voltage"]])
+        starts = np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)]) if n else np.empty(0, dtype=int)
+        stops = np.r_[starts[1:], n]
+        self.classes = {tuple(keys[start].tolist()): (start, stop) for start, stop in zip(starts, stops)}
+
+    def __len__(self):
+        return len(self.columns["kva"])
+
+    def row(self, index):
+        record = {name: values[index].item() for name, values in self.columns.items()}
+        record["source"] = self.sources[index]
+        return record
+
+    def voltage_classes(self):
+        return list(self.classes)
+
+    def _slices(self, secondary_voltage=None, primary_voltage=None, phases=None):
+        for (ph, vp, vs), bounds in self.classes.items():
+            if secondary_voltage is not None and vs != secondary_voltage:
+                continue
+            if primary_voltage is not None and vp != primary_voltage:
+                continue
+            if phases is not None and ph != phases:
+                continue
+            yield bounds
+
+    # --- Queries (O(log n) per voltage class) ---
+    def covering(self, kva, secondary_voltage=None, primary_voltage=None, phases=None):
+        # Index of the smallest standard rating >= kva, or None if nothing covers the load
+        best = None
+        kvas = self.columns["kva"]
+        for start, stop in self._slices(secondary_voltage, primary_voltage, phases):
+            i = start + np.searchsorted(kvas[start:stop], kva, side="left")
+            if i < stop and (best is None or kvas[i] < kvas[best]):
+                best = i
+        return None if best is None else int(best)
+
+    def nearest(self, kva, secondary_voltage=None, primary_voltage=None, phases=None):
+        best = None
+        kvas = self.columns["kva"]
+        for start, stop in self._slices(secondary_voltage, primary_voltage, phases):
+            i = start + np.searchsorted(kvas[start:stop], kva)
+            for j in (i - 1, i):
+                if start <= j < stop and (best is None or abs(kvas[j] - kva) < abs(kvas[best] - kva)):
+                    best = j
+        return None if best is None else int(best)
+
+    def in_range(self, kva_low, kva_high, secondary_voltage=None, primary_voltage=None, phases=None):
+        kvas = self.columns["kva"]
+        parts = []
+        for start, stop in self._slices(secondary_voltage, primary_voltage, phases):
+            lo = start + np.searchsorted(kvas[start:stop], kva_low, side="left")
+            hi = start + np.searchsorted(kvas[start:stop], kva_high, side="right")
+            parts.append(np.arange(lo, hi))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    def covering_batch(self, kva, secondary_voltage, primary_voltage=0.0, phases=3):
+        # Vectorised covering() for many loads in one voltage class; -1 where nothing covers
+        bounds = self.classes.get((float(phases), float(primary_voltage), float(secondary_voltage)))
+        kva = np.asarray(kva, dtype=np.float64)
+        if bounds is None:
+            return np.full(kva.shape, -1, dtype=np.intp)
+        start, stop = bounds
+        index = start + np.searchsorted(self.columns["kva"][start:stop], kva, side="left")
+        return np.where(index < stop, index, -1)
+
+    def autofill(self, kva, secondary_voltage, primary_voltage=None, phases=None):
+        # Z% and base current of the rating that covers kva, for pre-filling the calculators
+        index = self.covering(kva, secondary_voltage, primary_voltage, phases)
+        if index is None:
+            return None
+        return {"kva": self.columns["kva"][index].item(), "impedance": self.columns["impedance"][index].item(),
+                "base_current": self.columns["base_current"][index].item()}
+
+    # --- Construction and persistence ---
+    @classmethod
+    def from_tables(cls, tables=None):
+        tables = load_transformer_data() if tables is None else tables
+        parts, sources = [], []
+        for name, table in tables.items():
+            part = _normalize_table(name, table)
+            parts.append(part)
+            sources.extend([name] * len(part["kva"]))
+        columns = {name: np.concatenate([p.get(name, np.full(len(p["kva"]), np.nan)) for p in parts])
+                   for name in CATALOGUE_COLUMNS}
+        return cls(columns, sources)
+
+    @classmethod
+    def from_file(cls, path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".npz":
+            with np.load(path, allow_pickle=False) as data:
+                columns = {name: data[name] for name in data.files if name != "source"}
+                sources = data["source"] if "source" in data.files else None
+            return cls(columns, sources)
+        if ext == ".json":
+            with open(path, encoding="utf-8") as f:
+                records = json.load(f)
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                records = list(csv.DictReader(f))
+        columns = {name: np.array([_to_float(r.get(name)) for r in records]) for name in CATALOGUE_COLUMNS}
+        return cls(columns, [r.get("source", "") for r in records])
+
+    def save(self, path):
+        np.savez_compressed(path, source=self.sources.astype(str), **self.columns)
+
+def _to_float(value):
+    if value is None or value == "":
+        return np.nan
+    return float(value)
+
+def _normalize_table(name, table):
+    # Map the reference tables in transformer_data onto the catalogue columns
+    kva = np.asarray(table["kva"] if "kva" in table else np.asarray(table["mva"]) * 1000, dtype=np.float64)
+    n = len(kva)
+    part = {"kva": kva}
+    if name == "single_phase_240v":
+        part.update(phases=np.full(n, 1.0), secondary_voltage=np.full(n, 240.0))
+    elif name == "three_phase_480v":
+        part.update(phases=np.full(n, 3.0), secondary_voltage=np.full(n, 480.0))
+    elif "voltage" in table:
+        # "66/11 kV" style labels
+        pairs = [label.split()[0].split("/") for label in table["voltage"]]
+        part.update(primary_voltage=np.array([float(p[0]) * 1000 for p in pairs]),
+                    secondary_voltage=np.array([float(p[1]) * 1000 for p in pairs]))
+    for column in ("primary_voltage", "secondary_voltage", "impedance", "base_current"):
+        if column in table:
+            part[column] = np.asarray(table[column], dtype=np.float64)
+    if "base_current_lv" in table:
+        part["base_current"] = np.asarray(table["base_current_lv"], dtype=np.float64)
+        part["primary_current"] = np.asarray(table["base_current_hv"], dtype=np.float64)
+    return part
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from fault_engine import simple_fault_batch
+
+# Bump when the formulas below change so stale cache files are not reused
+GENERATOR_VERSION = 2
+CACHE_ENV = "TRANSFORMER_TABLE_CACHE"
+
+# --- Table generation ---
+def generate_table(kva, secondary_voltage, primary_voltage=np.nan, impedance=np.nan, phases=3,
+                   grid=False, decimals=None):
+    # Every derived column for a set of ratings in one vectorised pass. With
+    # grid=True each kVA is paired with each Z% (e.g. a full 4-8 % series);
+    # otherwise the inputs are broadcast row by row.
+    kva = np.asarray(kva, dtype=np.float64)
+    impedance = np.asarray(impedance, dtype=np.float64)
+    if grid:
+        kva, impedance = (a.ravel() for a in np.meshgrid(kva, impedance, indexing="ij"))
+    kva, vs, vp, impedance, phases = np.broadcast_arrays(
+        kva, np.asarray(secondary_voltage, dtype=np.float64), np.asarray(primary_voltage, dtype=np.float64),
+        impedance, np.asarray(phases, dtype=np.float64))
+    # The calculator's own kernel. It masks a whole row when any input is
+    # missing, so a table without primary voltages or Z% runs it on stand-ins
+    # and blanks only the columns that depend on them.
+    has_vp, has_z = vp > 0, impedance > 0
+    results = simple_fault_batch(np.where(has_vp, vp, vs), vs, kva, np.where(has_z, impedance, 100.0), phases)
+    base_current = results["secondary_full_load"]
+    primary_current = np.where(has_vp, results["primary_current"], np.nan)
+    max_short_circuit = np.where(has_z, results["max_fault_current"], np.nan)
+    if decimals is not None:
+        base_current, primary_current = np.round(base_current, decimals), np.round(primary_current, decimals)
+        max_short_circuit = np.round(max_short_circuit, decimals)
+    voltage = np.array([f"{p / 1000:g}/{s / 1000:g} kV" for p, s in zip(vp, vs)], dtype=str)
+    return {
+        "kva": kva, "mva": kva / 1000, "phases": phases, "primary_voltage": vp, "secondary_voltage": vs,
+        "voltage": voltage, "impedance": impedance, "base_current": base_current,
+        "primary_current": primary_current, "base_current_lv": base_current, "base_current_hv": primary_current,
+        "max_short_circuit": max_short_circuit,
+    }
+
+def build_tables(specs):
+    # specs: {table name: {"columns": [...], plus generate_table keyword arguments}}
+    tables = {}
+    for name, spec in specs.items():
+        options = {key: value for key, value in spec.items() if key != "columns"}
+        table = generate_table(**options)
+        tables[name] = {column: table[column] for column in spec["columns"]}
+    return tables
+
+# --- Binary disk cache ---
+def spec_key(specs):
+    text = json.dumps([GENERATOR_VERSION, specs], sort_keys=True, default=list)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def default_cache_dir():
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "transformer_calc")
+
+def save_tables(path, tables):
+    # One .npz entry per "table/column"; the order of columns is kept by the archive
+    arrays = {f"{name}/{column}": values for name, table in tables.items() for column, values in table.items()}
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def read_tables(path):
+    tables = {}
+    with np.load(path, allow_pickle=False) as data:
+        for key in data.files:
+            name, column = key.split("/", 1)
+            tables.setdefault(name, {})[column] = data[key]
+    return tables
+
+def load_tables(specs, cache_dir=None):
+    # Reuse the cached tables for these exact specs, otherwise generate and store them;
+    # an unwritable cache directory just means generating every time
+    cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+    path = os.path.join(cache_dir, f"rating_tables-{spec_key(specs)}.npz")
+    try:
+        return read_tables(path)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        pass
+    tables = build_tables(specs)
+    try:
+        save_tables(path, tables)
+    except OSError:
+        pass
+    return tables
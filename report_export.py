@@ -0,0 +1,338 @@
+import argparse
+import csv
+import os
+import sys
+import time
+import zipfile
+import zlib
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+DEFAULT_CHUNK_ROWS = 10_000
+CSV_FLOAT_FORMAT = "%.12g"
+PDF_FLOAT_FORMAT = "%.6g"
+XLSX_MAX_ROWS = 1_048_576
+
+# --- Row sources ---
+def iter_column_rows(columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+    # Rows of a dict (or list) of equal-length arrays, converted a chunk at a
+    # time so memory-mapped result stores are never loaded whole
+    arrays = list(columns.values()) if isinstance(columns, dict) else list(columns)
+    n = len(arrays[0]) if arrays else 0
+    for start in range(0, n, chunk_rows):
+        yield from zip(*(np.asarray(a[start:start + chunk_rows]).tolist() for a in arrays))
+
+def _chunks(rows, chunk_rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class ExportStats:
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes / 2**20 / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.rows:,} rows, {self.bytes / 2**20:.1f} MiB in {self.seconds:.2f} s "
+                f"({self.rows_per_second:,.0f} rows/s, {self.megabytes_per_second:.1f} MiB/s)")
+
+# --- Writers: begin_table / write_rows (one chunk) / end_table / close ---
+# abort() replaces close() when the export fails: it releases the file
+# without finishing it, and never raises over the original error.
+class CsvExporter:
+    # Several tables go into one file, each under a title row and separated by a blank line
+    def __init__(self, path, title=None):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.tables = 0
+
+    def begin_table(self, title, headers):
+        if self.tables:
+            self.writer.writerow([])
+        if title:
+            self.writer.writerow([title])
+        self.writer.writerow(headers)
+        self.tables += 1
+
+    def write_rows(self, rows):
+        self.writer.writerows([CSV_FLOAT_FORMAT % v if isinstance(v, float) else v for v in row] for row in rows)
+        self.file.flush()
+
+    def end_table(self):
+        pass
+
+    def close(self):
+        self.file.close()
+
+    def abort(self):
+        self.file.close()
+
+class XlsxExporter:
+    # A minimal SpreadsheetML workbook: each sheet's XML is streamed straight
+    # into its deflated zip entry, and the workbook parts naming the sheets are
+    # written last. Text uses inline strings, so no shared-string table is kept.
+    def __init__(self, path, title=None):
+        self.zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self.sheets = []
+        self.stream = None
+
+    def begin_table(self, title, headers):
+        self.title = title or f"Sheet{len(self.sheets) + 1}"
+        self.headers = list(headers)
+        self._open_sheet()
+
+    def _open_sheet(self):
+        # Sheet names: at most 31 characters, none of []:*?/\ and unique
+        name = "".join(c for c in self.title if c not in '[]:*?/\\')[:31] or "Sheet"
+        if name in self.sheets:
+            suffix = f" ({len(self.sheets) + 1})"
+            name = name[:31 - len(suffix)] + suffix
+        self.sheets.append(name)
+        self.stream = self.zip.open(f"xl/worksheets/sheet{len(self.sheets)}.xml", "w", force_zip64=True)
+        self.stream.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                          b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+        self.row_number = 0
+        self._write([self.headers])
+
+    def _write(self, rows):
+        parts = []
+        for row in rows:
+            self.row_number += 1
+            parts.append(f'<row r="{self.row_number}">')
+            for value in row:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if value == value and abs(value) != float("inf"):
+                        parts.append(f"<c><v>{value!r}</v></c>")
+                    else:
+                        parts.append("<c/>")
+                else:
+                    parts.append(f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>')
+            parts.append("</row>")
+        self.stream.write("".join(parts).encode("utf-8"))
+
+    def write_rows(self, rows):
+        while rows:
+            room = XLSX_MAX_ROWS - self.row_number
+            if room <= 0:
+                # Sheet is full: continue on a new sheet with the headers repeated
+                self.end_table()
+                self._open_sheet()
+                continue
+            self._write(rows[:room])
+            rows = rows[room:]
+
+    def end_table(self):
+        self.stream.write(b"</sheetData></worksheet>")
+        self.stream.close()
+        self.stream = None
+
+    def close(self):
+        sheets = range(1, len(self.sheets) + 1)
+        overrides = "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="application/'
+                            f'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>' for i in sheets)
+        self.zip.writestr("[Content_Types].xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>' + overrides + '</Types>')
+        self.zip.writestr("_rels/.rels",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+            'officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        self.zip.writestr("xl/workbook.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + "".join(f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+                      for i, name in zip(sheets, self.sheets)) + '</sheets></workbook>')
+        self.zip.writestr("xl/_rels/workbook.xml.rels",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+                      f'relationships/worksheet" Target="worksheets/sheet{i}.xml"/>' for i in sheets)
+            + '</Relationships>')
+        self.zip.close()
+
+    def abort(self):
+        # The open sheet must be closed before the archive will close
+        for part in (self.stream, self.zip):
+            if part is None:
+                continue
+            try:
+                part.close()
+            except (OSError, ValueError):
+                pass
+
+class PdfExporter:
+    # Hand-written PDF 1.4: landscape A4, Courier, one fixed-width text table
+    # per page. Every page is written (and its compressed content stream
+    # released) as soon as it is full; only object offsets and page ids are
+    # kept until the cross-reference table is written at the end.
+    page_width, page_height = 842, 595
+    margin = 36
+    font_size = 7
+    leading = 9
+    column_width = 14
+
+    def __init__(self, path, title=None):
+        self.file = open(path, "wb")
+        self.title = title or "Report"
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = 4
+        self.lines = []
+        self.lines_per_page = int((self.page_height - 2 * self.margin) / self.leading) - 4
+        self.columns = int((self.page_width - 2 * self.margin) / (self.font_size * 0.6) // self.column_width)
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _object(self, obj_id, body):
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(f"{obj_id} 0 obj\n".encode("latin-1") + body + b"\nendobj\n")
+
+    def _cell(self, value):
+        text = PDF_FLOAT_FORMAT % value if isinstance(value, float) else str(value)
+        return text[:self.column_width - 1].rjust(self.column_width - 1) + " "
+
+    def begin_table(self, title, headers):
+        if self.lines:
+            self._flush_page()
+        self.table_title = title or self.title
+        # Columns beyond the page width are dropped rather than wrapped
+        self.header_line = "".join(self._cell(h) for h in list(headers)[:self.columns])
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.lines.append("".join(self._cell(v) for v in row[:self.columns]))
+            if len(self.lines) >= self.lines_per_page:
+                self._flush_page()
+
+    def end_table(self):
+        if self.lines:
+            self._flush_page()
+
+    def _flush_page(self):
+        y = self.page_height - self.margin
+        text = [f"BT /F1 11 Tf {self.margin} {y} Td ({_pdf_escape(self.table_title)}) Tj ET",
+                f"BT /F1 {self.font_size} Tf {self.leading} TL {self.margin} {y - 2 * self.leading} Td",
+                f"({_pdf_escape(self.header_line)}) Tj T*"]
+        text += [f"({_pdf_escape(line)}) Tj T*" for line in self.lines]
+        text.append("ET")
+        text.append(f"BT /F1 {self.font_size} Tf {self.page_width - self.margin - 60} {self.margin / 2} Td "
+                    f"(Page {len(self.page_ids) + 1}) Tj ET")
+        stream = zlib.compress("\n".join(text).encode("cp1252", errors="replace"))
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._object(content_id, f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("latin-1")
+                     + stream + b"\nendstream")
+        self._object(page_id, f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.page_width} {self.page_height}] "
+                              f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode("latin-1"))
+        self.page_ids.append(page_id)
+        self.lines = []
+        self.file.flush()
+
+    def close(self):
+        if self.lines:
+            self._flush_page()
+        self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>")
+        kids = " ".join(f"{i} 0 R" for i in self.page_ids)
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>".encode("latin-1"))
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        xref = self.file.tell()
+        count = self.next_id
+        entries = ["0000000000 65535 f \n"] + [f"{self.offsets.get(i, 0):010d} 00000 n \n" for i in range(1, count)]
+        self.file.write(f"xref\n0 {count}\n{''.join(entries)}trailer\n<< /Size {count} /Root 1 0 R >>\n"
+                        f"startxref\n{xref}\n%%EOF\n".encode("latin-1"))
+        self.file.close()
+
+    def abort(self):
+        self.file.close()
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+EXPORTERS = {"csv": CsvExporter, "xlsx": XlsxExporter, "pdf": PdfExporter}
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext not in EXPORTERS:
+        raise ValueError(f"unsupported export format {ext!r}; use one of {', '.join(sorted(EXPORTERS))}")
+    return ext
+
+# --- Export pipeline ---
+def export_tables(path, tables, output_format=None, chunk_rows=DEFAULT_CHUNK_ROWS, title=None):
+    # tables: iterable of (title, headers, rows) where rows is any iterable of
+    # row tuples (e.g. iter_column_rows over arrays or a result store)
+    output_format = output_format or detect_format(path)
+    stats = ExportStats()
+    start = time.perf_counter()
+    exporter = EXPORTERS[output_format](path, title)
+    try:
+        for table_title, headers, rows in tables:
+            exporter.begin_table(table_title, headers)
+            for chunk in _chunks(rows, chunk_rows):
+                exporter.write_rows(chunk)
+                stats.rows += len(chunk)
+            exporter.end_table()
+        exporter.close()
+    except BaseException:
+        # Finishing a half-written report could raise over the real error; drop it instead
+        exporter.abort()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    stats.seconds = time.perf_counter() - start
+    stats.bytes = os.path.getsize(path)
+    return stats
+
+def export_rows(path, headers, rows, output_format=None, chunk_rows=DEFAULT_CHUNK_ROWS, title=None):
+    return export_tables(path, [(title, headers, rows)], output_format, chunk_rows, title)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export a result store (or a synthetic study) to CSV, XLSX or PDF")
+    parser.add_argument("output", help="report file; the extension picks csv, xlsx or pdf")
+    parser.add_argument("--store", help="result store directory written by the batch CLI")
+    parser.add_argument("--rows", type=int, default=50_000, help="rows of a synthetic study when no store is given")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    if args.store:
+        from result_store import ResultStore
+        store = ResultStore(args.store)
+        headers, columns = store.names, store.columns()
+        title = f"Fault study: {os.path.basename(os.path.normpath(args.store))}"
+    else:
+        from fault_engine import detailed_fault_batch
+        rng = np.random.default_rng(0)
+        r1_r2 = rng.uniform(0.05, 2.0, args.rows)
+        results = detailed_fault_batch(0.46, r1_r2, 11000, 415, 1e6, 6.0)
+        headers = ["circuit", "r1_r2", "zsec", "earth_fault_current", "primary_fault_current"]
+        columns = [np.arange(1, args.rows + 1), r1_r2, results["zsec"], results["earth_fault_current"],
+                   results["primary_fault_current"]]
+        title = f"Fault study: {args.rows:,} circuits"
+    try:
+        stats = export_rows(args.output, headers, iter_column_rows(columns, args.chunk_rows),
+                            chunk_rows=args.chunk_rows, title=title)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(f"{args.output}: {stats}")
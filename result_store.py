@@ -0,0 +1,111 @@
+import json
+import os
+
+import numpy as np
+
+SCHEMA_FILE = "schema.json"
+SCHEMA_VERSION = 1
+
+# --- Column store layout ---
+# A store is a directory holding schema.json plus one raw little-endian file
+# per column (<name>.bin). Every column has the same number of rows, so row i
+# of any column sits at byte offset i * itemsize and a slice maps straight
+# onto the file without reading the rest.
+
+def _column_file(name):
+    # Column names come from our own outputs, but keep them safe as file names
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name) + ".bin"
+
+def _store_dtype(values):
+    return np.dtype(values.dtype).newbyteorder("<")
+
+# --- Writing ---
+class ResultStoreWriter:
+    # Appends chunks of columns; schema.json is rewritten after every chunk so
+    # an interrupted run still leaves a readable store of the rows written so far
+    def __init__(self, path):
+        self.path = path
+        self.schema = None
+        self.rows = 0
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, columns, results=None):
+        arrays = dict(columns)
+        arrays.update(results or {})
+        arrays = {name: np.asarray(values) for name, values in arrays.items()}
+        if self.schema is None:
+            self.schema = [{"name": name, "dtype": _store_dtype(values).str, "file": _column_file(name)}
+                           for name, values in arrays.items()]
+            file_mode = "wb"
+        else:
+            if list(arrays) != [column["name"] for column in self.schema]:
+                raise ValueError("every chunk written to a result store needs the same columns")
+            file_mode = "ab"
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("all columns in a chunk must have the same length")
+        for column in self.schema:
+            values = np.ascontiguousarray(arrays[column["name"]], dtype=column["dtype"])
+            with open(os.path.join(self.path, column["file"]), file_mode) as f:
+                values.tofile(f)
+        self.rows += lengths.pop()
+        self.flush()
+
+    def flush(self):
+        if self.schema is None:
+            return
+        header = {"version": SCHEMA_VERSION, "rows": self.rows, "columns": self.schema}
+        tmp = os.path.join(self.path, SCHEMA_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=1)
+        os.replace(tmp, os.path.join(self.path, SCHEMA_FILE))
+
+def write_store(path, columns):
+    writer = ResultStoreWriter(path)
+    writer.write(columns)
+    return ResultStore(path)
+
+# --- Reading (zero-copy through memory maps) ---
+class ResultStore:
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, SCHEMA_FILE), encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"unsupported result store version {header.get('version')!r}")
+        self.rows = header["rows"]
+        self.schema = {column["name"]: column for column in header["columns"]}
+        self.maps = {}
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.schema
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    @property
+    def names(self):
+        return list(self.schema)
+
+    def column(self, name):
+        # The whole column as a read-only memmap; pages are only read when touched
+        if name not in self.maps:
+            column = self.schema[name]
+            dtype = np.dtype(column["dtype"])
+            if self.rows == 0:
+                self.maps[name] = np.empty(0, dtype=dtype)
+            else:
+                self.maps[name] = np.memmap(os.path.join(self.path, column["file"]), dtype=dtype,
+                                            mode="r", shape=(self.rows,))
+        return self.maps[name]
+
+    def slice(self, start=None, stop=None, names=None):
+        # Views into the maps, not copies
+        rows = slice(start, stop)
+        return {name: self.column(name)[rows] for name in (names or self.names)}
+
+    def columns(self, names=None):
+        return {name: self.column(name) for name in (names or self.names)}
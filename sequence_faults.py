@@ -0,0 +1,90 @@
+import numpy as np
+
+from fault_engine import split_impedance, peak_factor
+
+SQRT3 = np.sqrt(3.0)
+A = np.exp(2j * np.pi / 3)
+
+def voltage_factor(un, maximum=True):
+    # IEC 60909-0 Table 1: LV (<= 1 kV, +6 % tolerance) cmax 1.05 / cmin 0.95; above 1 kV cmax 1.10 / cmin 1.00
+    un = np.asarray(un, dtype=np.float64)
+    if maximum:
+        return np.where(un <= 1000, 1.05, 1.10)
+    return np.where(un <= 1000, 0.95, 1.00)
+
+# --- Sequence network (one per bus, batched) ---
+class SequenceNetwork:
+    # Positive/negative/zero-sequence impedances at the fault location for
+    # many buses. The products and sums the fault formulas need are computed
+    # once here and shared by every fault-type kernel.
+    def __init__(self, z1, z2, z0, un, c=None):
+        z1, z2, z0 = np.broadcast_arrays(*(np.asarray(z, dtype=np.complex128) for z in (z1, z2, z0)))
+        self.z1, self.z2, self.z0 = z1, z2, z0
+        self.un = np.asarray(un, dtype=np.float64)
+        self.c = voltage_factor(self.un) if c is None else np.asarray(c, dtype=np.float64)
+        self.cun = self.c * self.un
+        self.sum12 = z1 + z2
+        self.sum120 = self.sum12 + z0
+        self.denominator = z1 * z2 + z2 * z0 + z0 * z1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.kappa = peak_factor(z1.imag / z1.real)
+
+    # --- Fault-type kernels (initial symmetrical short-circuit current I"k, in A) ---
+    def three_phase(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.cun / (SQRT3 * np.abs(self.z1))
+
+    def line_to_line(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.cun / np.abs(self.sum12)
+
+    def line_to_line_earth(self):
+        # Returns (current to earth I"kE2E, larger of the two faulted line currents)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            earth = SQRT3 * self.cun * np.abs(self.z2) / np.abs(self.denominator)
+            line_l2 = np.abs(self.cun * (self.z0 - A * self.z2) / self.denominator)
+            line_l3 = np.abs(self.cun * (self.z0 - A**2 * self.z2) / self.denominator)
+        return earth, np.maximum(line_l2, line_l3)
+
+    def line_to_earth(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return SQRT3 * self.cun / np.abs(self.sum120)
+
+    def all_faults(self):
+        llg_earth, llg_line = self.line_to_line_earth()
+        results = {
+            "ik3": self.three_phase(),
+            "ik2": self.line_to_line(),
+            "ik2e_earth": llg_earth,
+            "ik2e_line": llg_line,
+            "ik1": self.line_to_earth(),
+        }
+        # Peak currents use kappa from the positive-sequence X/R (IEC 60909-0 method B style)
+        peak = self.kappa * np.sqrt(2)
+        for name in list(results):
+            results["ip_" + name[2:]] = peak * results[name]
+        return results
+
+# --- Building sequence impedances from transformer data ---
+def transformer_sequence_impedances(vp, vs, va, z_percent, x_r, zp=0.0, z0_ratio=1.0,
+                                    circuit_z1=0.0, circuit_z0=None):
+    # Sequence impedances at a bus fed by a Dyn transformer, referred to the
+    # secondary. The source (zp, referred like in the detailed calculation)
+    # only appears in Z1/Z2 because the delta winding blocks zero sequence;
+    # the transformer's Z0 is z0_ratio * Zt. circuit_z1/circuit_z0 add a
+    # downstream cable (circuit_z0 defaults to circuit_z1).
+    vp = np.asarray(vp, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    va = np.asarray(va, dtype=np.float64)
+    z_percent = np.asarray(z_percent, dtype=np.float64)
+    circuit_z1 = np.asarray(circuit_z1, dtype=np.complex128)
+    circuit_z0 = circuit_z1 if circuit_z0 is None else np.asarray(circuit_z0, dtype=np.complex128)
+    zt = split_impedance((z_percent / 100) * (vs**2 / va), x_r)
+    zp_referred = np.asarray(zp, dtype=np.complex128) * (vs / vp)**2
+    z1 = zp_referred + zt + circuit_z1
+    z0 = z0_ratio * zt + circuit_z0
+    return z1, z1, z0
+
+def transformer_faults(vp, vs, va, z_percent, x_r, zp=0.0, z0_ratio=1.0, circuit_z1=0.0, circuit_z0=None, c=None):
+    z1, z2, z0 = transformer_sequence_impedances(vp, vs, va, z_percent, x_r, zp, z0_ratio, circuit_z1, circuit_z0)
+    return SequenceNetwork(z1, z2, z0, vs, c).all_faults()
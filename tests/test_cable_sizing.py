@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from cable_sizing import CableCatalogue, size_cables, DEFAULT_TEMPERATURE_FACTOR
+
+# --- Per-circuit reference: walk the catalogue from the smallest size ---
+def scalar_size(catalogue, length, design_current, min_fault_current, zp, vp, vs, va, z_percent, max_drop_percent=5.0):
+    source = zp * (vs / vp)**2 + (z_percent / 100) * (vs**2 / va)
+    for i in range(len(catalogue)):
+        r1_r2 = catalogue.r1_r2[i] * length * DEFAULT_TEMPERATURE_FACTOR / 1000
+        drop = catalogue.mv_per_a_m[i] * design_current * length / 1000 / vs * 100
+        fault = (vs / math.sqrt(3)) / (source + r1_r2)
+        if catalogue.ampacity[i] >= design_current and drop <= max_drop_percent and fault >= min_fault_current:
+            return i, fault
+    return -1, math.nan
+
+@pytest.fixture
+def catalogue():
+    return CableCatalogue.default()
+
+def test_batch_matches_scalar(catalogue):
+    rng = np.random.default_rng(4)
+    n = 500
+    circuits = {"length": rng.uniform(1, 400, n), "design_current": rng.uniform(1, 500, n),
+                "min_fault_current": rng.choice([50.0, 160.0, 640.0, 2000.0], n)}
+    source = {"zp": 0.46, "vp": 11000.0, "vs": 415.0, "va": 1e6, "z_percent": 6.0}
+    results = size_cables(catalogue, **circuits, **source)
+    assert (~results["found"]).any() and results["found"].any()
+    for i in range(n):
+        index, fault = scalar_size(catalogue, circuits["length"][i], circuits["design_current"][i],
+                                   circuits["min_fault_current"][i], **source)
+        assert results["index"][i] == index
+        if index >= 0:
+            assert results["earth_fault_current"][i] == pytest.approx(fault, rel=1e-9)
+        else:
+            assert np.isnan(results["size_mm2"][i]) and np.isnan(results["earth_fault_current"][i])
+
+def test_oversized_load_finds_no_cable(catalogue):
+    results = size_cables(catalogue, [10.0, 10.0], [5000.0, 10.0], 100.0, 0.46, 11000, 415, 1e6, 6.0)
+    assert results["index"].tolist()[0] == -1 and results["index"][1] >= 0
+    assert results["found"].tolist() == [False, True]
+
+def test_catalogue_must_improve_with_size():
+    with pytest.raises(ValueError):
+        CableCatalogue(size_mm2=[1.5, 2.5], r1=[7.41, 12.1], ampacity=[17.5, 24], mv_per_a_m=[25, 15])
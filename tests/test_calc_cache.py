@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from calc_cache import CalculationCache, normalize_key, dedup_batch, cached_simple_fault
+from fault_engine import simple_fault, simple_fault_batch
+
+def test_normalize_key_merges_float_noise():
+    assert normalize_key(0.1 + 0.2, 11000) == normalize_key(0.3, 11000.0)
+    assert normalize_key(-0.0) == normalize_key(0.0)
+    assert normalize_key(1.0) != normalize_key(1.0 + 1e-9)
+    assert normalize_key(0.0, np.nan)[0] == 0.0
+
+def test_cache_hits_and_lru_eviction():
+    cache = CalculationCache(maxsize=2)
+    calls = []
+
+    def compute(*inputs):
+        calls.append(inputs)
+        return sum(inputs)
+
+    assert cache.get_or_compute("k", (1, 2), compute) == 3
+    assert cache.get_or_compute("k", (1.0, 2.0), compute) == 3
+    cache.get_or_compute("k", (2, 2), compute)
+    # (3, 3) evicts the least recently used entry, (1, 2), so asking for it again recomputes it
+    cache.get_or_compute("k", (3, 3), compute)
+    cache.get_or_compute("k", (1, 2), compute)
+    stats = cache.stats()
+    assert len(calls) == 4
+    assert stats == {"size": 2, "maxsize": 2, "hits": 1, "misses": 4, "evictions": 2, "hit_rate": 0.2}
+    # Different kinds never share an entry
+    cache.get_or_compute("other", (3, 3), compute)
+    assert len(calls) == 5
+    cache.clear()
+    assert cache.stats()["size"] == 0 and cache.stats()["hits"] == 0
+
+def test_errors_are_not_cached():
+    cache = CalculationCache()
+
+    def fail(*inputs):
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_compute("k", (1,), fail)
+    assert cache.stats()["size"] == 0
+
+def test_cached_fault_returns_a_copy():
+    cache = CalculationCache()
+    first = cached_simple_fault(11000, 415, 1000, 5, cache=cache)
+    first["max_fault_current"] = -1
+    assert cached_simple_fault(11000, 415, 1000, 5, cache=cache) == simple_fault(11000, 415, 1000, 5)
+
+def test_dedup_batch_matches_kernel():
+    rng = np.random.default_rng(0)
+    vp = rng.choice([11000.0, 0.0], 1000)
+    kva = rng.choice([315.0, 630.0, 1000.0], 1000)
+    results, unique = dedup_batch(simple_fault_batch, vp, 415.0, kva, 5.0)
+    expected = simple_fault_batch(vp, 415.0, kva, 5.0)
+    assert unique == 6
+    for name, values in expected.items():
+        np.testing.assert_array_equal(results[name], values)
+    empty, unique = dedup_batch(simple_fault_batch, [], [], [], [])
+    assert unique == 0 and empty["max_fault_current"].size == 0
@@ -0,0 +1,133 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from calc_service import CalculationService, BatchQueue, RequestError, serve, _read_numbers
+from fault_engine import simple_fault_batch, detailed_fault_batch
+
+SIMPLE = {"vp": 11000, "vs": 415, "kva": 500, "z_percent": 4}
+DETAILED = {"zp": 0.5, "r1_r2": 0.01, "vp": 11000, "vs": 415, "va": 500000, "z_percent": 4}
+
+def expected(kernel, names, body):
+    results = kernel(*(np.array([float(body[name])]) for name in names))
+    results.pop("valid")
+    return {name: float(values[0]) for name, values in results.items()}
+
+def test_read_numbers():
+    assert _read_numbers({"a": "1.5", "b": 2}, ("a", "b")) == [1.5, 2.0]
+    with pytest.raises(RequestError, match="missing field"):
+        _read_numbers({"a": 1, "b": None}, ("a", "b"))
+    with pytest.raises(RequestError, match="must be a number"):
+        _read_numbers({"a": [1]}, ("a",))
+    for value in (float("nan"), float("inf"), "nan", "-Infinity"):
+        with pytest.raises(RequestError, match="finite") as error:
+            _read_numbers({"a": value}, ("a",))
+        assert error.value.status == 400
+
+def test_calculations_match_the_kernels():
+    async def run():
+        service = CalculationService()
+        simple = await service.calculate("simple", SIMPLE)
+        detailed = await service.calculate("detailed", DETAILED)
+        return simple, detailed
+
+    simple, detailed = asyncio.run(run())
+    assert simple == pytest.approx(expected(simple_fault_batch, ("vp", "vs", "kva", "z_percent"), SIMPLE))
+    assert detailed == pytest.approx(expected(detailed_fault_batch, ("zp", "r1_r2", "vp", "vs", "va", "z_percent"), DETAILED))
+
+def test_validation_matches_the_calculator_pages():
+    async def run(kind, body):
+        with pytest.raises(RequestError) as error:
+            await CalculationService().calculate(kind, body)
+        return error.value
+
+    assert asyncio.run(run("simple", dict(SIMPLE, kva=0))).status == 400
+    assert asyncio.run(run("detailed", dict(DETAILED, zp=-1))).status == 400
+
+def test_concurrent_requests_share_a_batch():
+    async def run():
+        service = CalculationService(window=0.05)
+        bodies = [dict(SIMPLE, kva=kva) for kva in (100, 200, 300, 400)]
+        results = await asyncio.gather(*(service.calculate("simple", body) for body in bodies))
+        return service.stats(), results
+
+    stats, results = asyncio.run(run())
+    assert stats["batches"]["simple"] == {"batches": 1, "rows": 4, "mean_batch": 4.0}
+    assert [r["secondary_full_load"] for r in results] == sorted(r["secondary_full_load"] for r in results)
+
+def test_batch_queue_flushes_at_max_batch():
+    async def run():
+        queue = BatchQueue(simple_fault_batch, ("vp", "vs", "kva", "z_percent"), window=60, max_batch=2)
+        first = queue.submit([11000, 415, 500, 4])
+        second = queue.submit([11000, 415, 1000, 4])
+        # No waiting for the 60 s window: the second request filled the batch
+        assert first.done() and second.done()
+        return queue.batches
+
+    assert asyncio.run(run()) == 1
+
+def test_lookup():
+    service = CalculationService()
+    row = service.lookup({"kva": 400, "secondary_voltage": 415})
+    assert row["kva"] == 630 and row["source"] == "distribution_11kv"
+    assert row["primary_current"] is None
+    with pytest.raises(RequestError) as error:
+        service.lookup({"kva": 1e9, "secondary_voltage": 415})
+    assert error.value.status == 404
+
+# --- Over HTTP ---
+def exchange(*requests):
+    # Sends raw requests on one keep-alive connection and returns (status, payload) pairs
+    async def run():
+        service, server = await serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for request in requests:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers["content-length"]))
+            responses.append((int(status_line.split()[1]), json.loads(body)))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    return asyncio.run(run())
+
+def post(path, body):
+    raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return f"POST {path} HTTP/1.1\r\nContent-Length: {len(raw)}\r\n\r\n".encode() + raw
+
+def test_http_round_trip():
+    responses = exchange(post("/simple", SIMPLE), post("/lookup", {"kva": 400, "secondary_voltage": 415}),
+                         b"GET /stats HTTP/1.1\r\n\r\n")
+    assert [status for status, _ in responses] == [200, 200, 200]
+    assert responses[0][1] == pytest.approx(expected(simple_fault_batch, ("vp", "vs", "kva", "z_percent"), SIMPLE))
+    assert responses[1][1]["kva"] == 630
+    assert responses[2][1]["requests"] == 3
+
+def test_http_errors():
+    responses = exchange(post("/simple", b"{not json"), post("/simple", b"[1, 2]"),
+                         post("/simple", b'{"vp": NaN, "vs": 415, "kva": 500, "z_percent": 4}'),
+                         post("/simple", dict(SIMPLE, vs=-415)), post("/nowhere", {}),
+                         b"GET /simple HTTP/1.1\r\n\r\n")
+    assert [status for status, _ in responses] == [400, 400, 400, 400, 404, 405]
+    assert "finite" in responses[2][1]["error"]
+    assert all("error" in payload for _, payload in responses)
+
+def test_http_bad_content_length_closes_the_connection():
+    responses = exchange(b"POST /simple HTTP/1.1\r\nContent-Length: lots\r\n\r\n", post("/simple", SIMPLE))
+    assert responses == [(400, {"error": "invalid Content-Length"})]
@@ -0,0 +1,78 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import Qt, QThreadPool, QPersistentModelIndex
+
+from transformer_gui import ColumnTableModel, TableFilter
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(0)
+    n = 5000
+    return [np.round(rng.uniform(1, 5000, n), 1), rng.integers(0, 100, n),
+            np.array(["11/0.415 kV", "33/11 kV", "66/11 KV"])[rng.integers(0, 3, n)]]
+
+def brute(columns, text):
+    texts = [[("%.10g" % v if c.dtype.kind in "iuf" else str(v).lower()) for v in c.tolist()] for c in columns]
+    return [i for i in range(len(columns[0])) if any(text in t[i] for t in texts)]
+
+def shown(model, column=0):
+    return [model.data(model.index(r, column)) for r in range(model.rowCount())]
+
+def test_cells_are_formatted_on_demand(app, columns):
+    model = ColumnTableModel(columns, ["kVA", "n", "Voltage"])
+    assert model.rowCount() == 5000 and model.columnCount() == 3
+    assert model.data(model.index(0, 0)) == "%.10g" % columns[0][0]
+    assert model.data(model.index(0, 2)) == columns[2][0]
+    assert model.headerData(1, Qt.Horizontal) == "n" and model.headerData(4, Qt.Vertical) == "5"
+
+def test_filter_matches_display_text(app, columns):
+    model = ColumnTableModel(columns, ["a", "b", "c"])
+    model.sort(0, Qt.DescendingOrder)
+    # Narrowing ("1" -> "12" -> "12.") only searches the rows still shown
+    for text in ["1", "12", "12.", "KV", "33/", "", "no match"]:
+        model.set_filter(text)
+        expected = np.array(brute(columns, text.lower()), dtype=np.intp)
+        order = np.argsort(columns[0][expected], kind="stable")[::-1]
+        assert model.rows.tolist() == expected[order].tolist()
+
+def test_sort_keeps_selection_on_its_row(app, columns):
+    model = ColumnTableModel(columns, ["a", "b", "c"])
+    index = QPersistentModelIndex(model.index(10, 1))
+    value = model.data(model.index(10, 0))
+    model.sort(0, Qt.AscendingOrder)
+    assert model.data(model.index(index.row(), 0)) == value and index.column() == 1
+    model.sort(-1)
+    assert index.row() == 10
+
+def test_set_columns_keeps_filter_and_sort(app, columns):
+    model = ColumnTableModel(columns, ["a", "b", "c"])
+    model.sort(1, Qt.AscendingOrder)
+    model.set_filter("33/")
+    model.set_columns([c[:100] for c in columns])
+    assert model.rowCount() == len(brute([c[:100] for c in columns], "33/"))
+    values = [columns[1][r] for r in model.rows]
+    assert values == sorted(values)
+
+def test_table_filter_searches_off_the_gui_thread(app, columns):
+    model = ColumnTableModel(columns, ["a", "b", "c"])
+    line_edit = QtWidgets.QLineEdit()
+    TableFilter(model, line_edit)
+    for text in ("3", "33", "33/1"):
+        line_edit.setText(text)
+    # Nothing happens until typing pauses
+    assert model.rowCount() == 5000
+    deadline = time.monotonic() + 10
+    while model.filter_text != "33/1" and time.monotonic() < deadline:
+        QThreadPool.globalInstance().waitForDone(50)
+        app.processEvents()
+    assert model.rows.tolist() == brute(columns, "33/1")
@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+import pytest
+
+from fault_engine import (simple_fault_batch, simple_fault, detailed_fault_batch, detailed_fault,
+                          feeder_schedule_batch, simple_fault_batch_complex, detailed_fault_batch_complex)
+
+# --- Per-row references (the widgets' formulas) ---
+def scalar_simple(vp, vs, kva, z_percent, phases=3):
+    factor = 1.0 if phases == 1 else math.sqrt(3)
+    va = kva * 1000
+    secondary_full_load = va / (factor * vs)
+    return {"vz": vp * z_percent / 100, "secondary_full_load": secondary_full_load,
+            "primary_current": va / (factor * vp), "max_fault_current": (100 / z_percent) * secondary_full_load}
+
+def scalar_detailed(zp, r1_r2, vp, vs, va, z_percent):
+    zsec = zp * (vs / vp)**2 + (z_percent / 100) * (vs**2 / va) + r1_r2
+    earth_fault_current = (vs / math.sqrt(3)) / zsec
+    return {"zsec": zsec, "earth_fault_current": earth_fault_current,
+            "primary_fault_current": earth_fault_current * (vs / vp)}
+
+@pytest.fixture
+def rows():
+    rng = np.random.default_rng(1)
+    n = 200
+    return {
+        "zp": rng.uniform(0.0, 1.0, n), "r1_r2": rng.uniform(0.0, 2.0, n),
+        "vp": rng.choice([3300.0, 6600.0, 11000.0, 33000.0], n), "vs": rng.choice([240.0, 415.0, 690.0], n),
+        "kva": rng.choice([25.0, 315.0, 1000.0, 2500.0], n), "z_percent": rng.uniform(3.0, 12.0, n),
+    }
+
+def test_simple_batch_matches_scalar(rows):
+    results = simple_fault_batch(rows["vp"], rows["vs"], rows["kva"], rows["z_percent"])
+    assert results["valid"].all()
+    for i in range(len(rows["vp"])):
+        expected = scalar_simple(rows["vp"][i], rows["vs"][i], rows["kva"][i], rows["z_percent"][i])
+        for name, value in expected.items():
+            assert results[name][i] == pytest.approx(value, rel=1e-12)
+
+@pytest.mark.parametrize("bad", [0.0, -1.0, np.nan])
+@pytest.mark.parametrize("column", ["vp", "vs", "kva", "z_percent"])
+def test_simple_invalid_rows_are_masked(rows, column, bad):
+    args = {k: rows[k][:5].copy() for k in ("vp", "vs", "kva", "z_percent")}
+    args[column][2] = bad
+    results = simple_fault_batch(**args)
+    assert results["valid"].tolist() == [True, True, False, True, True]
+    for name, values in results.items():
+        if name != "valid":
+            assert np.isnan(values[2])
+            assert not np.isnan(values[[0, 1, 3, 4]]).any()
+
+def test_simple_scalar_wrapper_matches_batch(rows):
+    batch = simple_fault_batch(rows["vp"], rows["vs"], rows["kva"], rows["z_percent"])
+    single = simple_fault(rows["vp"][7], rows["vs"][7], rows["kva"][7], rows["z_percent"][7])
+    assert single["valid"] is True
+    for name in ("vz", "secondary_full_load", "primary_current", "max_fault_current", "max_fault_kA"):
+        assert single[name] == batch[name][7]
+
+def test_detailed_batch_matches_scalar(rows):
+    va = rows["kva"] * 1000
+    results = detailed_fault_batch(rows["zp"], rows["r1_r2"], rows["vp"], rows["vs"], va, rows["z_percent"])
+    for i in range(len(va)):
+        expected = scalar_detailed(rows["zp"][i], rows["r1_r2"][i], rows["vp"][i], rows["vs"][i], va[i], rows["z_percent"][i])
+        for name, value in expected.items():
+            assert results[name][i] == pytest.approx(value, rel=1e-12)
+
+def test_detailed_zero_source_and_cable_are_valid():
+    # Zp and R1+R2 may be zero; only the transformer impedance is left in the loop
+    results = detailed_fault(0.0, 0.0, 11000, 415, 1e6, 5.0)
+    assert results["valid"]
+    assert results["earth_fault_current"] == pytest.approx(scalar_detailed(0.0, 0.0, 11000, 415, 1e6, 5.0)["earth_fault_current"])
+
+def test_detailed_invalid_rows_are_masked():
+    results = detailed_fault_batch([0.5, 0.5, 0.5], [0.1, 0.1, 0.1], [11000, 0, 11000], [415, 415, np.nan], 1e6, 5.0)
+    assert results["valid"].tolist() == [True, False, False]
+    assert np.isnan(results["earth_fault_current"][1:]).all()
+    assert not detailed_fault(0.5, 0.1, -11000, 415, 1e6, 5.0)["valid"]
+
+def test_feeder_schedule_matches_detailed(rows):
+    n_transformers = 4
+    transformers = {k: rows[k][:n_transformers] for k in ("zp", "vp", "vs", "z_percent")}
+    transformers["va"] = rows["kva"][:n_transformers] * 1000
+    index = np.arange(len(rows["r1_r2"])) % n_transformers
+    schedule = feeder_schedule_batch(index, rows["r1_r2"], **transformers)
+    expanded = detailed_fault_batch(transformers["zp"][index], rows["r1_r2"], transformers["vp"][index],
+                                    transformers["vs"][index], transformers["va"][index], transformers["z_percent"][index])
+    for name, values in expanded.items():
+        np.testing.assert_allclose(schedule[name], values, rtol=1e-12)
+
+def test_complex_paths_reduce_to_magnitude_paths(rows):
+    # With X/R = 0 every impedance is resistive, so the complex engine gives the magnitude results
+    va = rows["kva"] * 1000
+    plain = detailed_fault_batch(rows["zp"], rows["r1_r2"], rows["vp"], rows["vs"], va, rows["z_percent"])
+    complex_ = detailed_fault_batch_complex(rows["zp"], rows["r1_r2"], rows["vp"], rows["vs"], va, rows["z_percent"], 0.0)
+    for name in ("earth_fault_current", "primary_fault_current", "secondary_full_load", "max_theoretical_fault"):
+        np.testing.assert_allclose(complex_[name], plain[name], rtol=1e-12)
+    np.testing.assert_allclose(np.abs(complex_["zsec"]), plain["zsec"], rtol=1e-12)
+
+    simple = simple_fault_batch(rows["vp"], rows["vs"], rows["kva"], rows["z_percent"])
+    simple_complex = simple_fault_batch_complex(rows["vp"], rows["vs"], rows["kva"], rows["z_percent"], 8.0)
+    np.testing.assert_array_equal(simple_complex["max_fault_current"], simple["max_fault_current"])
+    assert (simple_complex["peak_max_fault_current"] > math.sqrt(2) * simple["max_fault_current"]).all()
+
+def test_complex_invalid_rows_are_masked():
+    results = simple_fault_batch_complex([11000, 0], 415, 1000, 5.0, 6.0)
+    assert results["valid"].tolist() == [True, False]
+    assert np.isnan(results["peak_max_fault_current"][1]) and np.isnan(results["zt"][1])
@@ -0,0 +1,57 @@
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import QThreadPool
+
+from transformer_gui import SimpleCalculationWidget
+
+ERROR = "❌ ERROR: Please enter valid numerical values for all fields."
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+@pytest.fixture
+def page(app):
+    return SimpleCalculationWidget()
+
+def settle(app, page, previous):
+    # Run the debounce timer and the pool task through to the result label
+    deadline = time.monotonic() + 5
+    page.live_calculator.timer.stop()
+    page.live_calculator.start()
+    while page.results_display.text() == previous and time.monotonic() < deadline:
+        QThreadPool.globalInstance().waitForDone(20)
+        app.processEvents()
+    return page.results_display.text()
+
+def fill(page, values):
+    for field, value in zip(page.input_fields(), values):
+        field.setText(value)
+
+def test_partly_filled_form_shows_the_placeholder(app, page):
+    fill(page, ["11000"])
+    page.live_calculator.start()
+    assert page.results_display.text() == page.results_placeholder
+
+def test_complete_form_shows_a_result_and_blanking_clears_it(app, page):
+    fill(page, ["11000", "415", "1000", "5"])
+    text = settle(app, page, page.results_placeholder)
+    assert text != page.results_placeholder and "ERROR" not in text
+    page.input_fields()[3].setText("")
+    page.live_calculator.start()
+    assert page.results_display.text() == page.results_placeholder
+
+def test_unparseable_field_is_an_error(app, page):
+    fill(page, ["11000", "415", "1000", "5x"])
+    page.live_calculator.start()
+    assert page.results_display.text() == ERROR
+
+def test_calculate_button_still_rejects_blank_fields(app, page):
+    fill(page, ["11000"])
+    page.calculate()
+    assert page.results_display.text() == ERROR
@@ -0,0 +1,28 @@
+import numpy as np
+
+from parallel_study import split_shards, run_sharded, run_chunks, make_study
+from transformer_cli import calculate_chunk
+
+def test_split_shards_cover_every_row():
+    assert split_shards(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert split_shards(0, 4) == []
+
+def test_sharded_results_match_one_pass():
+    study = make_study(1000)
+    expected = calculate_chunk(study)
+    for workers in (1, 2):
+        results = run_sharded(study, workers=workers, shard_size=128)
+        assert list(results) == list(expected)
+        for name, values in expected.items():
+            np.testing.assert_array_equal(results[name], values)
+
+def test_run_chunks_keeps_input_order():
+    study = make_study(300, seed=1)
+    chunks = [{name: values[start:start + 50] for name, values in study.items()} for start in range(0, 300, 50)]
+    out = list(run_chunks(iter(chunks), workers=2, mode="simple"))
+    assert [columns["vp"].tolist() for columns, _ in out] == [c["vp"].tolist() for c in chunks]
+    for columns, results in out:
+        np.testing.assert_array_equal(results["max_fault_current"], calculate_chunk(columns, mode="simple")["max_fault_current"])
+
+def test_empty_study():
+    assert run_sharded({name: values[:0] for name, values in make_study(10).items()}, workers=2) == {}
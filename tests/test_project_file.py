@@ -0,0 +1,150 @@
+import os
+
+import pytest
+
+from project_file import Project, ProjectFormatError, MAGIC
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "study.txproj")
+
+def test_new_project_round_trip(path):
+    project = Project(path)
+    project.set("page/simple", {"kva": "500"})
+    project.set("window", {"page": "simple"})
+    project.save()
+    reopened = Project(path)
+    assert reopened.sections() == ["page/simple", "window"]
+    assert reopened.get("page/simple") == {"kva": "500"}
+    assert not reopened.is_dirty
+
+def test_saves_append_only_changed_sections(path):
+    project = Project(path)
+    project.set("a", [1, 2])
+    project.set("b", "text")
+    project.save()
+    size = os.path.getsize(path)
+    # Setting an equal value is not a change
+    assert not project.set("a", [1, 2])
+    assert project.save() == 0
+    project.set("b", "other")
+    written = project.save()
+    assert os.path.getsize(path) == size + written
+    reopened = Project(path)
+    assert reopened.get("a") == [1, 2] and reopened.get("b") == "other"
+
+def test_sections_decode_lazily(path):
+    project = Project(path)
+    project.set("a", {"x": 1})
+    project.save()
+    reopened = Project(path)
+    assert reopened.values == {}
+    assert "a" in reopened
+    assert reopened.get("a") == {"x": 1}
+    assert reopened.values == {"a": {"x": 1}}
+
+def test_delete(path):
+    project = Project(path)
+    project.set("a", 1)
+    project.set("b", 2)
+    project.save()
+    project.delete("a")
+    assert "a" not in project and project.sections() == ["b"]
+    project.save()
+    reopened = Project(path)
+    assert reopened.sections() == ["b"] and reopened.get("a", "gone") == "gone"
+    # Deleting an unsaved section leaves nothing to write
+    reopened.set("c", 3)
+    reopened.delete("c")
+    assert not reopened.is_dirty
+
+def test_torn_tail_is_dropped_on_the_next_save(path):
+    project = Project(path)
+    project.set("a", "kept")
+    project.save()
+    with open(path, "ab") as f:
+        f.write(b"b json 100\n{\"partial")
+    reopened = Project(path)
+    assert reopened.sections() == ["a"]
+    reopened.set("c", "new")
+    reopened.save()
+    again = Project(path)
+    assert again.sections() == ["a", "c"]
+    assert again.get("a") == "kept" and again.get("c") == "new"
+
+@pytest.mark.parametrize("tail", [b"", b"a json 10\n", b"a json"])
+def test_magic_only_or_torn_first_record_keeps_the_magic(path, tail):
+    with open(path, "wb") as f:
+        f.write(MAGIC + tail)
+    project = Project(path)
+    assert project.sections() == []
+    project.set("a", 1)
+    project.save()
+    with open(path, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+    assert Project(path).get("a") == 1
+
+def test_compaction_drops_superseded_records(path):
+    project = Project(path)
+    project.set("a", "x" * 100)
+    project.save()
+    for i in range(5):
+        project.set("a", str(i) * 100)
+        project.save()
+    # Superseded records never outweigh live ones for long
+    assert os.path.getsize(path) <= 2 * (len(MAGIC) + project.live_size)
+    assert Project(path).get("a") == "4" * 100
+    assert not os.path.exists(path + ".tmp")
+
+def test_save_as_rewrites_to_the_new_path(path, tmp_path):
+    project = Project(path)
+    project.set("a", 1)
+    project.save()
+    project.set("a", 2)
+    copy = str(tmp_path / "copy.txproj")
+    project.save(copy)
+    assert project.path == copy
+    assert Project(copy).get("a") == 2
+    assert Project(path).get("a") == 1
+
+def test_bad_files_and_names(path, tmp_path):
+    with pytest.raises(ValueError, match="no file name"):
+        Project().save()
+    with pytest.raises(ValueError):
+        Project(path).set("two words", 1)
+    other = str(tmp_path / "other.txt")
+    with open(other, "wb") as f:
+        f.write(b"not a project\n")
+    with pytest.raises(ProjectFormatError):
+        Project(other)
+    with open(path, "wb") as f:
+        f.write(MAGIC + b"a json notanumber\n")
+    with pytest.raises(ProjectFormatError, match="corrupt record header"):
+        Project(path)
+
+def test_corrupt_payload_fails_when_read(path):
+    with open(path, "wb") as f:
+        f.write(MAGIC + b"a json 5\n{bad}\nb yaml 2\nx:\n")
+    project = Project(path)
+    assert project.sections() == ["a", "b"]
+    with pytest.raises(ValueError):
+        project.get("a")
+    with pytest.raises(ProjectFormatError, match="unsupported"):
+        project.get("b")
+
+def test_corrupt_page_section_opens_an_empty_page(path, monkeypatch):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    import transformer_gui
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    warnings = []
+    monkeypatch.setattr(transformer_gui.QMessageBox, "warning", lambda *args: warnings.append(args[2]))
+    with open(path, "wb") as f:
+        f.write(MAGIC + b"page/simple json 5\n{bad}\n")
+    window = transformer_gui.TransformerCalculatorMainWindow()
+    window.load_project(path)
+    page = window.get_page("simple")
+    assert len(warnings) == 1 and "simple" in warnings[0]
+    assert page.get_state() == {key: "" for key in page.state_fields}
+    window.close()
+    app.processEvents()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from protection import CurveTable, standard_devices, check_disconnection, coordinate_circuits, mcb_curve
+from fault_engine import detailed_fault_batch
+
+# --- Per-device reference: log-log interpolation straight from the curve points ---
+def scalar_trip_time(points, current):
+    points = sorted(points)
+    if not current > 0 or current < points[0][0]:
+        return np.inf
+    log_i = np.log10([i for i, _ in points])
+    log_t = np.log10([t for _, t in points])
+    return 10.0 ** np.interp(np.log10(current), log_i, log_t)
+
+@pytest.fixture(scope="module")
+def curves():
+    return standard_devices()
+
+@pytest.fixture(scope="module")
+def table(curves):
+    return CurveTable(curves)
+
+def test_batch_matches_scalar(curves, table):
+    rng = np.random.default_rng(5)
+    names = rng.choice(table.names, 400)
+    currents = 10.0 ** rng.uniform(0.5, 4.5, 400)
+    trip_time = table.trip_time(table.index(names), currents)
+    for name, current, time in zip(names, currents, trip_time):
+        expected = scalar_trip_time(curves[name], current)
+        # Away from the curve's corners (the MCB magnetic step) the tabulated grid agrees to well under 1 %
+        near_corner = any(abs(current / i - 1) < 0.02 for i, _ in curves[name])
+        if np.isinf(expected) or near_corner:
+            continue
+        assert time == pytest.approx(expected, rel=1e-2)
+
+def test_below_curve_zero_and_nan_never_trip(curves, table):
+    index = table.index(["MCB-B16"] * 4)
+    trip_time = table.trip_time(index, [1.0, 0.0, np.nan, 16 * 10.0])
+    assert np.isinf(trip_time[:3]).all()
+    assert trip_time[3] == pytest.approx(scalar_trip_time(curves["MCB-B16"], 160.0), rel=1e-2)
+
+def test_unknown_device(table):
+    with pytest.raises(ValueError):
+        table.index(["MCB-Z16"])
+
+def test_bad_curve():
+    with pytest.raises(ValueError):
+        CurveTable({"rising": [(10, 1.0), (20, 2.0)]})
+
+def test_coordination_uses_detailed_fault(table):
+    r1_r2 = np.array([0.05, 0.5, 2.0, 0.1])
+    results = coordinate_circuits(table, ["MCB-B32", "MCB-B32", "MCB-B32", "MCB-D125"], 0.46, r1_r2, [11000, 11000, 11000, 0], 415, 1e6, 6.0)
+    expected = detailed_fault_batch(0.46, r1_r2, [11000, 11000, 11000, 0], 415, 1e6, 6.0)
+    np.testing.assert_array_equal(results["earth_fault_current"], expected["earth_fault_current"])
+    # The invalid row (Vp = 0) has no fault current and cannot pass
+    assert results["passes"].tolist()[3] is False and np.isinf(results["trip_time"][3])
+    assert results["passes"].tolist() == (results["trip_time"] <= 0.4).tolist()
+    check = check_disconnection(table, table.index(["MCB-B32"]), [32 * 5 * 1.1])
+    assert check["passes"].tolist() == [True]
+
+def test_mcb_curve_scales_with_rating():
+    assert mcb_curve(32, "C")[3] == (320.0, 0.1)
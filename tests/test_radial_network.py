@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from fault_engine import detailed_fault
+from radial_network import RadialNetwork
+
+def feeder():
+    # 11 kV source -> 1 MVA 6 % transformer -> two cable runs, one with a spur
+    net = RadialNetwork()
+    source = net.add_source(11000, 0.46, "source")
+    tx = net.add_transformer(source, 415, 1e6, 6.0, "tx")
+    a = net.add_cable(tx, 0.05, "a")
+    b = net.add_cable(a, 0.10, "b")
+    c = net.add_cable(tx, 0.20, "c")
+    return net, (source, tx, a, b, c)
+
+def test_matches_detailed_calculation():
+    net, (source, tx, a, b, c) = feeder()
+    results = net.solve()
+    # The detailed calculation's loop impedance is Zp referred + Zt + R1+R2
+    for node, r1_r2 in ((tx, 0.0), (a, 0.05), (b, 0.15), (c, 0.20)):
+        expected = detailed_fault(0.46, r1_r2, 11000, 415, 1e6, 6.0)
+        assert results["z_total"][node] == pytest.approx(expected["zsec"], rel=1e-12)
+        assert results["fault_current"][node] == pytest.approx(expected["earth_fault_current"], rel=1e-12)
+    assert results["fault_current"][source] == pytest.approx(11000 / np.sqrt(3) / 0.46)
+
+def test_update_branch_matches_full_solve():
+    net, (source, tx, a, b, c) = feeder()
+    net.solve()
+    affected = net.update_branch(a, 0.3)
+    assert sorted(affected.tolist()) == [a, b]
+    fresh, _ = feeder()
+    fresh.branch[a] = 0.3
+    np.testing.assert_allclose(net.results()["z_total"], fresh.solve()["z_total"], rtol=1e-12)
+    affected = net.update_transformer(tx, 2e6, 5.0)
+    assert sorted(affected.tolist()) == [tx, a, b, c]
+    assert net.fault_at(tx)["z_total"] == pytest.approx(detailed_fault(0.46, 0, 11000, 415, 2e6, 5.0)["zsec"])
+
+def test_complex_update_promotes_the_network():
+    net, (source, tx, a, b, c) = feeder()
+    net.solve()
+    net.update_branch(c, 0.2 + 0.1j)
+    assert net.results()["z_total"][c] == pytest.approx(net.results()["z_total"][tx] + 0.2 + 0.1j)
+    assert net.results()["z_total"][b].imag == 0
+
+def test_zero_impedance_and_bad_nodes():
+    net = RadialNetwork()
+    root = net.add_source(400)
+    assert np.isinf(net.fault_at(root)["fault_current"])
+    with pytest.raises(ValueError):
+        net.add_cable(5, 0.1)
+    with pytest.raises(ValueError):
+        net.add_node(None, 0.1)
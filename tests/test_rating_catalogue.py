@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from rating_catalogue import RatingCatalogue, CATALOGUE_COLUMNS
+
+@pytest.fixture(scope="module")
+def catalogue():
+    return RatingCatalogue.from_tables()
+
+def brute_covering(catalogue, kva, vs=None, vp=None, phases=None):
+    c = catalogue.columns
+    ok = c["kva"] >= kva
+    for name, value in (("secondary_voltage", vs), ("primary_voltage", vp), ("phases", phases)):
+        if value is not None:
+            ok &= c[name] == value
+    candidates = np.flatnonzero(ok)
+    return None if not len(candidates) else candidates[np.argmin(c["kva"][candidates])]
+
+def test_covering_matches_brute_force(catalogue):
+    for kva in (1, 50, 99, 100, 101, 630, 999, 2500, 10**6):
+        for vs in (None, 415.0, 240.0, 11000.0):
+            index = catalogue.covering(kva, vs)
+            expected = brute_covering(catalogue, kva, vs)
+            if expected is None:
+                assert index is None
+            else:
+                assert catalogue.columns["kva"][index] == catalogue.columns["kva"][expected]
+                assert vs is None or catalogue.columns["secondary_voltage"][index] == vs
+
+def test_covering_batch_matches_covering(catalogue):
+    vp, vs = 11000.0, 415.0
+    loads = np.array([10.0, 100.0, 630.0, 1e9])
+    batch = catalogue.covering_batch(loads, vs, vp)
+    single = [catalogue.covering(kva, vs, vp, 3) for kva in loads]
+    assert batch.tolist() == [-1 if i is None else i for i in single]
+    assert (catalogue.covering_batch(loads, 123.0) == -1).all()
+
+def test_nearest_and_in_range(catalogue):
+    kvas = catalogue.columns["kva"]
+    index = catalogue.nearest(640, 415, 11000)
+    in_class = kvas[catalogue.in_range(0, np.inf, 415, 11000)]
+    assert kvas[index] == in_class[np.argmin(np.abs(in_class - 640))]
+    found = kvas[catalogue.in_range(100, 1000, 415, 11000)]
+    assert ((found >= 100) & (found <= 1000)).all() and (np.diff(found) >= 0).all()
+    assert len(catalogue.in_range(5, 1, 415)) == 0
+
+def test_autofill(catalogue):
+    filled = catalogue.autofill(900, 415, 11000)
+    assert filled["kva"] >= 900 and filled["impedance"] > 0
+    assert catalogue.autofill(1e12, 415) is None
+
+@pytest.mark.parametrize("ext", [".npz", ".csv", ".json"])
+def test_file_round_trip(catalogue, tmp_path, ext):
+    path = str(tmp_path / ("catalogue" + ext))
+    if ext == ".npz":
+        catalogue.save(path)
+    else:
+        records = [catalogue.row(i) for i in range(len(catalogue))]
+        if ext == ".json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([{k: (None if isinstance(v, float) and np.isnan(v) else v) for k, v in r.items()}
+                           for r in records], f)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(",".join(CATALOGUE_COLUMNS + ("source",)) + "\n")
+                for r in records:
+                    f.write(",".join("" if np.isnan(r[k]) else repr(r[k]) for k in CATALOGUE_COLUMNS) + f",{r['source']}\n")
+    loaded = RatingCatalogue.from_file(path)
+    assert len(loaded) == len(catalogue)
+    for name in CATALOGUE_COLUMNS:
+        np.testing.assert_array_equal(loaded.columns[name], catalogue.columns[name])
+    assert list(loaded.sources) == list(catalogue.sources)
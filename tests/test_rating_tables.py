@@ -0,0 +1,59 @@
+import os
+
+import numpy as np
+import pytest
+
+from fault_engine import simple_fault, simple_fault_batch
+from rating_tables import generate_table, build_tables, load_tables, spec_key, save_tables, read_tables
+from transformer_data import TRANSFORMER_TABLES
+
+def test_single_phase_kernel():
+    results = simple_fault(240, 240, 50, 4.0, phases=1)
+    assert results["secondary_full_load"] == pytest.approx(50_000 / 240)
+    assert results["max_fault_current"] == pytest.approx(50_000 / 240 / 0.04)
+
+def test_generate_table_uses_the_kernel():
+    table = generate_table([100, 1000], 415, 11000, [4.5, 6.0])
+    expected = simple_fault_batch(11000, 415, [100, 1000], [4.5, 6.0])
+    np.testing.assert_array_equal(table["base_current"], expected["secondary_full_load"])
+    np.testing.assert_array_equal(table["primary_current"], expected["primary_current"])
+    np.testing.assert_array_equal(table["max_short_circuit"], expected["max_fault_current"])
+    assert table["voltage"].tolist() == ["11/0.415 kV", "11/0.415 kV"]
+
+def test_missing_primary_voltage_or_impedance_blanks_only_their_columns():
+    table = generate_table([10, 50], 240, phases=1, decimals=2)
+    assert table["base_current"].tolist() == [41.67, 208.33]
+    assert np.isnan(table["primary_current"]).all() and np.isnan(table["max_short_circuit"]).all()
+
+def test_grid_pairs_every_rating_with_every_impedance():
+    table = generate_table([100, 200], 415, 11000, [4, 5, 6], grid=True)
+    assert table["kva"].tolist() == [100, 100, 100, 200, 200, 200]
+    assert table["impedance"].tolist() == [4, 5, 6, 4, 5, 6]
+
+def test_cache_round_trip(tmp_path):
+    first = load_tables(TRANSFORMER_TABLES, str(tmp_path))
+    files = os.listdir(tmp_path)
+    assert files == [f"rating_tables-{spec_key(TRANSFORMER_TABLES)}.npz"]
+    second = load_tables(TRANSFORMER_TABLES, str(tmp_path))
+    built = build_tables(TRANSFORMER_TABLES)
+    for name, table in built.items():
+        assert list(first[name]) == list(table) == list(second[name])
+        for column, values in table.items():
+            np.testing.assert_array_equal(second[name][column], values)
+
+def test_corrupt_or_changed_cache_is_rebuilt(tmp_path):
+    path = tmp_path / f"rating_tables-{spec_key(TRANSFORMER_TABLES)}.npz"
+    path.write_bytes(b"not a zip")
+    tables = load_tables(TRANSFORMER_TABLES, str(tmp_path))
+    np.testing.assert_array_equal(read_tables(str(path))["distribution_11kv"]["kva"], tables["distribution_11kv"]["kva"])
+    changed = dict(TRANSFORMER_TABLES, extra={"kva": (1, 2), "secondary_voltage": 400, "columns": ("kva",)})
+    assert spec_key(changed) != spec_key(TRANSFORMER_TABLES)
+    assert load_tables(changed, str(tmp_path))["extra"]["kva"].tolist() == [1, 2]
+
+def test_unwritable_cache_still_returns_tables(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    tables = load_tables(TRANSFORMER_TABLES, str(blocker / "cache"))
+    assert set(tables) == set(TRANSFORMER_TABLES)
+    with pytest.raises(OSError):
+        save_tables(str(blocker / "cache" / "x.npz"), tables)
@@ -0,0 +1,95 @@
+import csv
+import os
+import re
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+import report_export
+from report_export import export_rows, export_tables, iter_column_rows, detect_format
+
+NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+def sheet_rows(archive, number):
+    root = ET.fromstring(archive.read(f"xl/worksheets/sheet{number}.xml"))
+    rows = []
+    for row in root.iterfind("s:sheetData/s:row", NS):
+        rows.append([cell.findtext("s:v", None, NS) or cell.findtext("s:is/s:t", "", NS) for cell in row])
+    return rows
+
+def test_iter_column_rows_chunks_without_changing_rows():
+    columns = {"a": np.arange(5), "b": np.arange(5) * 0.5}
+    assert list(iter_column_rows(columns, chunk_rows=2)) == [(i, i * 0.5) for i in range(5)]
+    assert list(iter_column_rows({})) == []
+
+def test_detect_format():
+    assert detect_format("report.XLSX") == "xlsx"
+    with pytest.raises(ValueError, match="unsupported export format"):
+        detect_format("report.docx")
+
+def test_csv_tables(tmp_path):
+    path = str(tmp_path / "r.csv")
+    stats = export_tables(path, [("First", ["x", "y"], [(1, 0.1 + 0.2), (2, "text")]),
+                                 (None, ["z"], iter([(3,)]))], chunk_rows=1)
+    assert stats.rows == 3 and stats.bytes == os.path.getsize(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [["First"], ["x", "y"], ["1", "0.3"], ["2", "text"], [], ["z"], ["3"]]
+
+def test_xlsx_is_a_valid_workbook(tmp_path):
+    path = str(tmp_path / "r.xlsx")
+    export_tables(path, [("Faults: a/b", ["kva", "name"], [(500, "T<1>"), (float("nan"), "T2")]),
+                         ("Faults: a/b", ["kva"], [(1.5,)])])
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        names = set(archive.namelist())
+        assert {"[Content_Types].xml", "_rels/.rels", "xl/workbook.xml", "xl/_rels/workbook.xml.rels"} <= names
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        assert [s.get("name") for s in workbook.iterfind("s:sheets/s:sheet", NS)] == ["Faults ab", "Faults ab (2)"]
+        # NaN becomes an empty cell; markup in text is escaped
+        assert sheet_rows(archive, 1) == [["kva", "name"], ["500", "T<1>"], ["", "T2"]]
+        assert sheet_rows(archive, 2) == [["kva"], ["1.5"]]
+
+def test_xlsx_rolls_over_to_a_new_sheet(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_export, "XLSX_MAX_ROWS", 3)
+    path = str(tmp_path / "r.xlsx")
+    export_rows(path, ["n"], [(i,) for i in range(5)], chunk_rows=4, title="Big")
+    with zipfile.ZipFile(path) as archive:
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        assert len(workbook.findall("s:sheets/s:sheet", NS)) == 3
+        # Each sheet repeats the header row
+        assert [sheet_rows(archive, i) for i in (1, 2, 3)] == [[["n"], ["0"], ["1"]], [["n"], ["2"], ["3"]],
+                                                             [["n"], ["4"]]]
+
+def test_pdf_structure(tmp_path):
+    path = str(tmp_path / "r.pdf")
+    rows = [(i, i / 3, "(x)") for i in range(130)]
+    export_rows(path, ["n", "third", "label"], rows, title="Study")
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data.startswith(b"%PDF-1.4\n") and data.endswith(b"%%EOF\n")
+    startxref = int(re.search(rb"startxref\n(\d+)\n", data).group(1))
+    assert data[startxref:].startswith(b"xref\n")
+    count = int(re.search(rb"xref\n0 (\d+)\n", data).group(1))
+    offsets = re.findall(rb"(\d{10}) 00000 n \n", data[startxref:])
+    assert len(offsets) == count - 1
+    # Every cross-reference entry points at its object
+    for obj_id, offset in enumerate(offsets, 1):
+        assert data[int(offset):].startswith(f"{obj_id} 0 obj\n".encode())
+    pages = int(re.search(rb"/Count (\d+)", data).group(1))
+    assert pages == 3
+    text = b"".join(zlib.decompress(m) for m in re.findall(rb"stream\n(.*?)\nendstream", data, re.S))
+    assert b"\\(x\\)" in text and b"Page 3" in text
+
+def test_failed_export_removes_the_partial_file(tmp_path):
+    def rows():
+        yield (1, 2.0)
+        raise RuntimeError("interrupted")
+
+    for extension in ("csv", "xlsx", "pdf"):
+        path = str(tmp_path / f"r.{extension}")
+        with pytest.raises(RuntimeError, match="interrupted"):
+            export_rows(path, ["a", "b"], rows(), chunk_rows=1)
+        assert not os.path.exists(path)
@@ -0,0 +1,86 @@
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+
+from result_store import ResultStore, ResultStoreWriter, write_store, SCHEMA_FILE
+from transformer_cli import run_batch
+
+def test_write_and_read_back(tmp_path):
+    columns = {"kva": np.array([25.0, 50.0, 100.0]), "tap": np.array([1, 2, 3], dtype=np.int32)}
+    store = write_store(str(tmp_path / "a.store"), columns)
+    assert len(store) == 3
+    assert store.names == ["kva", "tap"]
+    assert "kva" in store and "missing" not in store
+    np.testing.assert_array_equal(store["kva"], columns["kva"])
+    assert store["tap"].dtype == np.dtype("<i4")
+    np.testing.assert_array_equal(store["tap"], columns["tap"])
+
+def test_chunks_append_and_schema_tracks_rows(tmp_path):
+    path = str(tmp_path / "b.store")
+    writer = ResultStoreWriter(path)
+    writer.write({"vp": np.arange(4.0)}, {"ik": np.arange(4.0) * 10})
+    # A reader opened between chunks sees the rows written so far
+    assert len(ResultStore(path)) == 4
+    writer.write({"vp": np.arange(4.0, 6.0)}, {"ik": np.arange(4.0, 6.0) * 10})
+    store = ResultStore(path)
+    assert len(store) == 6
+    np.testing.assert_array_equal(store["vp"], np.arange(6.0))
+    np.testing.assert_array_equal(store["ik"], np.arange(6.0) * 10)
+    assert not os.path.exists(os.path.join(path, SCHEMA_FILE + ".tmp"))
+
+def test_chunks_must_match(tmp_path):
+    writer = ResultStoreWriter(str(tmp_path / "c.store"))
+    writer.write({"a": np.zeros(2), "b": np.zeros(2)})
+    with pytest.raises(ValueError, match="same columns"):
+        writer.write({"a": np.zeros(2)})
+    with pytest.raises(ValueError, match="same length"):
+        writer.write({"a": np.zeros(2), "b": np.zeros(3)})
+
+def test_columns_are_read_only_memory_maps(tmp_path):
+    store = write_store(str(tmp_path / "d.store"), {"x": np.arange(10.0)})
+    column = store["x"]
+    assert isinstance(column, np.memmap)
+    assert store["x"] is column
+    with pytest.raises(ValueError):
+        column[0] = 1.0
+    part = store.slice(2, 5)
+    np.testing.assert_array_equal(part["x"], [2.0, 3.0, 4.0])
+    assert np.shares_memory(part["x"], column)
+
+def test_empty_store(tmp_path):
+    path = str(tmp_path / "e.store")
+    writer = ResultStoreWriter(path)
+    writer.write({"x": np.zeros(0)})
+    store = ResultStore(path)
+    assert len(store) == 0
+    assert store["x"].shape == (0,)
+
+def test_unknown_version_is_rejected(tmp_path):
+    path = str(tmp_path / "f.store")
+    write_store(path, {"x": np.zeros(1)})
+    with open(os.path.join(path, SCHEMA_FILE), "w", encoding="utf-8") as f:
+        json.dump({"version": 99, "rows": 1, "columns": []}, f)
+    with pytest.raises(ValueError, match="version"):
+        ResultStore(path)
+
+def test_column_names_become_safe_file_names(tmp_path):
+    path = str(tmp_path / "g.store")
+    store = write_store(path, {"I/base (A)": np.ones(2)})
+    assert os.listdir(path).count("I_base__A_.bin") == 1
+    np.testing.assert_array_equal(store["I/base (A)"], [1.0, 1.0])
+
+def test_cli_round_trip_through_a_store(tmp_path):
+    path = str(tmp_path / "h.store")
+    source = io.StringIO("Vp,Vs,kVA,Z%\n11000,415,500,4\n11000,415,1000,5\n")
+    assert run_batch(source, path, "csv", "store", chunk_size=1) == 2
+    store = ResultStore(path)
+    assert len(store) == 2
+    # Reading the store back as input reproduces the same results
+    output = io.StringIO()
+    assert run_batch(store, output, "store", "csv") == 2
+    direct = io.StringIO()
+    run_batch(io.StringIO("Vp,Vs,kVA,Z%\n11000,415,500,4\n11000,415,1000,5\n"), direct)
+    assert output.getvalue() == direct.getvalue()
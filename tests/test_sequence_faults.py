@@ -0,0 +1,62 @@
+import cmath
+import math
+
+import numpy as np
+import pytest
+
+from sequence_faults import SequenceNetwork, transformer_faults, voltage_factor
+
+A = cmath.exp(2j * math.pi / 3)
+
+# --- Per-bus reference (IEC 60909-0 formulas written out for one bus) ---
+def scalar_faults(z1, z2, z0, un):
+    cun = (1.05 if un <= 1000 else 1.10) * un
+    denominator = z1 * z2 + z2 * z0 + z0 * z1
+    return {
+        "ik3": cun / (math.sqrt(3) * abs(z1)),
+        "ik2": cun / abs(z1 + z2),
+        "ik2e_earth": math.sqrt(3) * cun * abs(z2) / abs(denominator),
+        "ik2e_line": max(abs(cun * (z0 - A * z2) / denominator), abs(cun * (z0 - A**2 * z2) / denominator)),
+        "ik1": math.sqrt(3) * cun / abs(z1 + z2 + z0),
+    }
+
+def peak_factor(z1):
+    return 1.02 + 0.98 * math.exp(-3 * z1.real / z1.imag)
+
+@pytest.fixture
+def buses():
+    rng = np.random.default_rng(2)
+    n = 100
+    z1 = rng.uniform(0.001, 0.1, n) + 1j * rng.uniform(0.001, 0.5, n)
+    z0 = rng.uniform(0.001, 0.3, n) + 1j * rng.uniform(0.001, 0.5, n)
+    return z1, z1.copy(), z0, rng.choice([400.0, 690.0, 11000.0], n)
+
+def test_batch_matches_scalar(buses):
+    z1, z2, z0, un = buses
+    results = SequenceNetwork(z1, z2, z0, un).all_faults()
+    for i in range(len(un)):
+        for name, value in scalar_faults(z1[i], z2[i], z0[i], un[i]).items():
+            assert results[name][i] == pytest.approx(value, rel=1e-12)
+            assert results["ip_" + name[2:]][i] == pytest.approx(peak_factor(z1[i]) * math.sqrt(2) * value, rel=1e-12)
+
+def test_balanced_network_gives_equal_earth_and_three_phase_faults():
+    z = np.array([0.01 + 0.05j, 0.2 + 0.2j])
+    results = SequenceNetwork(z, z, z, 400.0).all_faults()
+    np.testing.assert_allclose(results["ik1"], results["ik3"], rtol=1e-12)
+    np.testing.assert_allclose(results["ik2"], results["ik3"] * math.sqrt(3) / 2, rtol=1e-12)
+
+def test_voltage_factor():
+    assert voltage_factor([400, 1000, 11000]).tolist() == [1.05, 1.05, 1.10]
+    assert voltage_factor([400, 11000], maximum=False).tolist() == [0.95, 1.00]
+
+def test_transformer_faults_match_per_bus():
+    va = np.array([315e3, 1e6])
+    results = transformer_faults(11000, 415, va, 5.0, 6.0, zp=0.5)
+    for i in range(2):
+        single = transformer_faults(11000, 415, va[i], 5.0, 6.0, zp=0.5)
+        for name, values in results.items():
+            assert values[i] == pytest.approx(float(single[name]), rel=1e-12)
+
+def test_zero_impedance_bus_gives_infinite_current():
+    results = SequenceNetwork([0.0, 0.01 + 0.05j], [0.0, 0.01 + 0.05j], [0.0, 0.01 + 0.05j], 400.0).all_faults()
+    assert np.isinf(results["ik3"][0]) and np.isfinite(results["ik3"][1])
@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+import pytest
+
+from thermal_model import Fleet, ThermalModel, THERMAL_CLASSES, REFERENCE_HOT_SPOT
+
+# --- Per-transformer reference (exact exponential solution, one step at a time) ---
+def scalar_hot_spot(load_pu, ambient, cooling, step_minutes):
+    p = THERMAL_CLASSES[cooling]
+    decay_oil = math.exp(-step_minutes / (p["k11"] * p["tau_oil"]))
+    decay_h1 = math.exp(-step_minutes / (p["k22"] * p["tau_winding"]))
+    decay_h2 = math.exp(-step_minutes / (p["tau_oil"] / p["k22"]))
+    state = None
+    hot_spot = []
+    for k, theta_a in zip(load_pu, ambient):
+        oil = theta_a + p["top_oil_rise"] * ((1 + k * k * p["r"]) / (1 + p["r"])) ** p["x"]
+        winding = p["hot_spot_gradient"] * k ** p["y"]
+        targets = (oil, p["k21"] * winding, (p["k21"] - 1) * winding)
+        if state is None:
+            state = targets
+        state = tuple(t + (s - t) * d for t, s, d in zip(targets, state, (decay_oil, decay_h1, decay_h2)))
+        hot_spot.append(state[0] + state[1] - state[2])
+    return np.array(hot_spot)
+
+@pytest.fixture
+def fleet():
+    return Fleet([100.0, 1000.0, 5000.0, 20000.0], [139.0, 1391.0, 6956.0, 27826.0],
+                 ["distribution_onan", "distribution_onan", "power_onan", "power_onaf"])
+
+@pytest.fixture
+def profile(fleet):
+    rng = np.random.default_rng(3)
+    steps = 96
+    hours = np.arange(steps) * 0.5
+    daily = 0.6 + 0.6 * np.clip(np.sin((hours % 24 - 6) / 24 * 2 * np.pi), 0, None)
+    load = fleet.rated_kva * daily[:, None] * rng.uniform(0.9, 1.1, (steps, len(fleet)))
+    return load, 15 + 10 * np.sin(hours / 24 * 2 * np.pi)
+
+def test_batch_matches_scalar(fleet, profile):
+    load, ambient = profile
+    hot_spot = ThermalModel(fleet, 30.0).step_chunk(load, ambient)
+    for j, cooling in enumerate(fleet.cooling):
+        expected = scalar_hot_spot(load[:, j] / fleet.rated_kva[j], ambient, cooling, 30.0)
+        np.testing.assert_allclose(hot_spot[:, j], expected, rtol=1e-12)
+
+def test_chunking_does_not_change_results(fleet, profile):
+    load, ambient = profile
+    whole = ThermalModel(fleet, 30.0)
+    expected = whole.step_chunk(load, ambient)
+    chunked = ThermalModel(fleet, 30.0)
+    parts = [chunked.step_chunk(load[start:start + 7], ambient[start:start + 7]) for start in range(0, len(load), 7)]
+    np.testing.assert_allclose(np.concatenate(parts), expected, rtol=1e-12)
+    for name, values in whole.summary().items():
+        if name == "name":
+            assert list(values) == list(chunked.summary()[name])
+        else:
+            np.testing.assert_allclose(chunked.summary()[name], values, rtol=1e-12)
+
+def test_rated_load_holds_reference_hot_spot(fleet):
+    model = ThermalModel(fleet, 60.0, units="pu")
+    hot_spot = model.step_chunk(np.ones((24, len(fleet))))
+    np.testing.assert_allclose(hot_spot[:, :2], REFERENCE_HOT_SPOT, rtol=1e-12)
+    summary = model.summary()
+    np.testing.assert_allclose(summary["equivalent_ageing"][:2], 1.0, rtol=1e-12)
+    assert (summary["hours_over_limit"] == 0).all()
+
+def test_no_load_and_units(fleet):
+    # Zero load is valid (oil settles at ambient + no-load rise); kVA, amps and pu give the same answer
+    pu = np.vstack([np.zeros(len(fleet)), np.full(len(fleet), 0.8)])
+    by_pu = ThermalModel(fleet, 60.0, units="pu").step_chunk(pu)
+    by_kva = ThermalModel(fleet, 60.0, units="kva").step_chunk(pu * fleet.rated_kva)
+    by_amps = ThermalModel(fleet, 60.0, units="amps").step_chunk(pu * fleet.rated_current)
+    np.testing.assert_allclose(by_kva, by_pu, rtol=1e-12)
+    np.testing.assert_allclose(by_amps, by_pu, rtol=1e-12)
+    assert np.isfinite(by_pu).all()
+
+def test_invalid_options(fleet):
+    with pytest.raises(ValueError):
+        ThermalModel(fleet, 60.0, units="mva")
+    with pytest.raises(ValueError):
+        ThermalModel(fleet, 60.0, paper="kraft")
+    with pytest.raises(ValueError):
+        Fleet([100.0], [139.0], ["oil"])
+
+def test_main_removes_its_scratch_profiles(tmp_path, monkeypatch, capsys):
+    import tempfile
+    import thermal_model
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    assert thermal_model.main(["--transformers", "5", "--steps", "48"]) == 0
+    assert "5 transformers x 48 steps" in capsys.readouterr().out
+    assert list(tmp_path.iterdir()) == []
+    # Also when the run fails after the profiles were written
+    def bad_profiles(*args):
+        raise ValueError("bad profile")
+
+    monkeypatch.setattr(thermal_model, "read_profiles", bad_profiles)
+    assert thermal_model.main(["--transformers", "5", "--steps", "48"]) == 2
+    assert "bad profile" in capsys.readouterr().err
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from fault_engine import simple_fault_batch
+from tolerance_sweep import (sample, monte_carlo, grid_sweep, FaultStatistics, base_transformer,
+                             iec_impedance_tolerance)
+
+BASE = {"vp": 11000.0, "vs": 415.0, "kva": 1000.0, "z_percent": 6.0}
+
+def test_grid_sweep_matches_direct_evaluation():
+    z = [5.4, 6.0, 6.6]
+    kva = [630.0, 1000.0]
+    summary = grid_sweep(BASE, chunk_size=4, z_percent=z, kva=kva)
+    zz, kk = np.meshgrid(z, kva, indexing="ij")
+    expected = simple_fault_batch(11000, 415, kk.ravel(), zz.ravel())["max_fault_current"]
+    assert summary["samples"] == 6
+    stats = summary["max_fault_current"]
+    assert stats["min"] == pytest.approx(expected.min())
+    assert stats["max"] == pytest.approx(expected.max())
+    assert stats["mean"] == pytest.approx(expected.mean())
+    # Fewer samples than the reservoir holds, so percentiles are exact
+    assert stats["percentiles"]["p50"] == pytest.approx(np.percentile(expected, 50))
+
+def test_grid_sweep_needs_a_grid():
+    with pytest.raises(ValueError, match="at least one grid"):
+        grid_sweep(BASE)
+
+def test_grid_sweep_detailed_outputs():
+    summary = grid_sweep(dict(BASE, zp=0.5), r1_r2=[0.0, 0.1])
+    assert "earth_fault_current" in summary and summary["samples"] == 2
+
+def test_monte_carlo_is_reproducible_and_bounded():
+    first = monte_carlo(BASE, samples=5000, chunk_size=1000, seed=3, z_percent=("tolerance", 6.0, 0.1))
+    assert first == monte_carlo(BASE, samples=5000, chunk_size=1000, seed=3, z_percent=("tolerance", 6.0, 0.1))
+    low = simple_fault_batch(11000, 415, 1000, 6.6)["max_fault_current"]
+    high = simple_fault_batch(11000, 415, 1000, 5.4)["max_fault_current"]
+    stats = first["max_fault_current"]
+    assert low <= stats["min"] <= stats["max"] <= high
+
+def test_statistics_skip_invalid_rows():
+    stats = FaultStatistics(["x"], reservoir_size=10, seed=0)
+    stats.update({"x": np.array([1.0, np.nan, 3.0])})
+    stats.update({"x": np.arange(100.0)})
+    summary = stats.summary()
+    assert summary["samples"] == 102 and summary["x"]["max"] == 99.0
+    assert len(stats.keys) == 10
+    assert FaultStatistics(["x"]).summary() == {"samples": 0}
+
+def test_sample_distributions():
+    rng = np.random.default_rng(0)
+    assert sample(6.0, rng, 3).tolist() == [6.0, 6.0, 6.0]
+    taps = sample(("taps", 11000, 0.025, -2, 2), rng, 1000)
+    assert set(np.round(taps).tolist()) <= {10450.0, 10725.0, 11000.0, 11275.0, 11550.0}
+    with pytest.raises(ValueError):
+        sample(("poisson", 1), rng, 1)
+
+def test_base_transformer_and_tolerance():
+    base = base_transformer(900)
+    assert base["kva"] >= 900 and base["vs"] == 415
+    assert iec_impedance_tolerance(6.0) == 0.10 and iec_impedance_tolerance(12.0) == 0.075
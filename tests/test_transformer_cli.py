@@ -0,0 +1,74 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+import transformer_cli
+from fault_engine import simple_fault_batch, detailed_fault_batch
+
+CSV_INPUT = ("Vp,Vs,kVA,Z%,Zp,R1+R2\n"
+             "11000,415,1000,5,0.5,0.1\n"
+             "\n"
+             "11000,415,315,4.5,,0.2\n"
+             "0,415,1000,5,0.5,0.1\n")
+
+def run(text, input_format="csv", output_format="csv", **options):
+    output = io.StringIO()
+    total = transformer_cli.run_batch(io.StringIO(text), output, input_format, output_format, **options)
+    return total, output.getvalue()
+
+def test_csv_batch_matches_kernels():
+    total, text = run(CSV_INPUT, chunk_size=2)
+    assert total == 3
+    lines = text.splitlines()
+    header = lines[0].split(",")
+    rows = [dict(zip(header, map(float, line.split(",")))) for line in lines[1:]]
+    simple = simple_fault_batch([11000, 11000, 0], 415, [1000, 315, 1000], [5, 4.5, 5])
+    detailed = detailed_fault_batch([0.5, np.nan, 0.5], [0.1, 0.2, 0.1], [11000, 11000, 0], 415,
+                                    [1e6, 315e3, 1e6], [5, 4.5, 5])
+    np.testing.assert_allclose([r["max_fault_current"] for r in rows], simple["max_fault_current"], rtol=1e-11)
+    np.testing.assert_allclose([r["earth_fault_current"] for r in rows], detailed["earth_fault_current"], rtol=1e-11)
+    # A blank Zp is missing (NaN), and the Vp = 0 row is invalid
+    assert np.isnan(rows[1]["earth_fault_current"]) and np.isnan(rows[2]["max_fault_current"])
+
+def test_jsonl_round_trip_and_dedupe():
+    records = [{"vp": 11000, "vs": 415, "kva": 1000, "z_percent": 5}] * 3 + [{"vp": 11000, "vs": 415, "kva": 630}]
+    text = "\n".join(json.dumps(r) for r in records) + "\n\n"
+    total, plain = run(text, "jsonl", "jsonl")
+    _, deduped = run(text, "jsonl", "jsonl", dedupe=True)
+    assert total == 4 and plain == deduped
+    out = [json.loads(line) for line in plain.splitlines()]
+    assert out[0]["max_fault_current"] == pytest.approx(simple_fault_batch(11000, 415, 1000, 5)["max_fault_current"])
+    # A missing Z% is written as null, not NaN
+    assert out[3]["max_fault_current"] is None
+
+@pytest.mark.parametrize("text, message", [
+    ("Vp,Vs,kVA,Z%\n11000,415,1000\n", "line 2: expected 4 fields, got 3"),
+    ("Vp,Vs,kVA,Z%\n11000,415,1000,5\n11000,abc,1000,5\n", "line 3: column 'Vs' is not a number: 'abc'"),
+    ("Vp,Vs,kVA\n11000,415,1000\n", "missing required column(s): z_percent"),
+])
+def test_bad_csv(text, message):
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        run(text)
+
+@pytest.mark.parametrize("line, message", [
+    ("[1, 2]", "line 2: expected a JSON object, got list"),
+    ('{"vp": [1], "vs": 415, "kva": 1, "z%": 5}', "line 2: field 'vp' is not a number"),
+    ('{"vp": {"a": 1}, "vs": 415, "kva": 1, "z%": 5}', "line 2: field 'vp' is not a number"),
+    ('{"vp": "x", "vs": 415, "kva": 1, "z%": 5}', "line 2: field 'vp' is not a number"),
+    ("{bad", "line 2: invalid JSON"),
+])
+def test_bad_jsonl(line, message):
+    with pytest.raises(ValueError, match=message):
+        run('{"vp": 11000, "vs": 415, "kva": 1000, "z%": 5}\n' + line + "\n", "jsonl")
+
+def test_main_reports_bad_input(tmp_path, capsys):
+    path = tmp_path / "study.jsonl"
+    path.write_text('[1, 2]\n', encoding="utf-8")
+    assert transformer_cli.main([str(path)]) == 2
+    assert "expected a JSON object" in capsys.readouterr().err
+
+def test_detailed_mode_needs_columns():
+    with pytest.raises(ValueError, match="detailed mode needs"):
+        run("Vp,Vs,kVA,Z%\n11000,415,1000,5\n", mode="detailed")
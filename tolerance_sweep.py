@@ -0,0 +1,175 @@
+import argparse
+import json
+
+import numpy as np
+
+from fault_engine import simple_fault_batch, detailed_fault_batch
+from rating_catalogue import RatingCatalogue
+
+DEFAULT_CHUNK_SIZE = 262_144
+DEFAULT_RESERVOIR_SIZE = 200_000
+DEFAULT_PERCENTILES = (0.1, 1, 5, 50, 95, 99, 99.9)
+
+SIMPLE_OUTPUTS = ("max_fault_current", "primary_current")
+DETAILED_OUTPUTS = ("earth_fault_current", "primary_fault_current", "zsec")
+
+# --- Input distributions ---
+# A parameter is either a plain number or a tuple naming a distribution:
+#   ("uniform", low, high)             ("normal", mean, std)
+#   ("triangular", low, mode, high)    ("tolerance", nominal, fraction)   -> uniform nominal * (1 ± fraction)
+#   ("taps", nominal, step, low_tap, high_tap)                            -> nominal * (1 + step * tap), tap uniform over the range
+def sample(spec, rng, n):
+    if np.isscalar(spec):
+        return np.full(n, float(spec))
+    kind, *args = spec
+    if kind == "uniform":
+        return rng.uniform(args[0], args[1], n)
+    if kind == "normal":
+        return rng.normal(args[0], args[1], n)
+    if kind == "triangular":
+        return rng.triangular(args[0], args[1], args[2], n)
+    if kind == "tolerance":
+        nominal, fraction = args
+        return nominal * rng.uniform(1 - fraction, 1 + fraction, n)
+    if kind == "taps":
+        nominal, step, low_tap, high_tap = args
+        return nominal * (1 + step * rng.integers(low_tap, high_tap + 1, n))
+    raise ValueError(f"unknown distribution {kind!r}")
+
+def iec_impedance_tolerance(z_percent):
+    # IEC 60076-1: ±7.5 % of the declared value for Z >= 10 %, ±10 % below that
+    return 0.075 if z_percent >= 10 else 0.10
+
+def base_transformer(kva, secondary_voltage=415, primary_voltage=11000, catalogue=None):
+    # The catalogue rating that covers kva, e.g. 1000 kVA 11 kV/415 V at 6 % from distribution_11kv
+    catalogue = catalogue or RatingCatalogue.from_tables()
+    index = catalogue.covering(kva, secondary_voltage, primary_voltage)
+    if index is None:
+        raise ValueError(f"no catalogue rating covers {kva} kVA at {primary_voltage}/{secondary_voltage} V")
+    row = catalogue.row(index)
+    return {"vp": row["primary_voltage"], "vs": row["secondary_voltage"],
+            "kva": row["kva"], "z_percent": row["impedance"]}
+
+# --- Bounded-memory accumulator ---
+class FaultStatistics:
+    # Exact min/max/mean plus a fixed-size uniform random sample (reservoir)
+    # that percentiles are taken from. Memory does not grow with the number
+    # of samples; with no more samples than the reservoir holds, percentiles are exact.
+    def __init__(self, names, reservoir_size=DEFAULT_RESERVOIR_SIZE, seed=None):
+        self.names = tuple(names)
+        self.reservoir_size = reservoir_size
+        self.rng = np.random.default_rng(seed)
+        self.keys = np.empty(0)
+        self.values = np.empty((len(self.names), 0))
+        self.count = 0
+        self.sums = np.zeros(len(self.names))
+        self.minima = np.full(len(self.names), np.inf)
+        self.maxima = np.full(len(self.names), -np.inf)
+
+    def update(self, results):
+        chunk = np.vstack([results[name] for name in self.names])
+        chunk = chunk[:, np.isfinite(chunk).all(axis=0)]
+        if chunk.shape[1] == 0:
+            return
+        self.count += chunk.shape[1]
+        self.sums += chunk.sum(axis=1)
+        self.minima = np.minimum(self.minima, chunk.min(axis=1))
+        self.maxima = np.maximum(self.maxima, chunk.max(axis=1))
+
+        # Keeping the samples with the smallest random keys is a uniform sample of everything seen
+        keys = np.concatenate([self.keys, self.rng.random(chunk.shape[1])])
+        values = np.hstack([self.values, chunk])
+        if len(keys) > self.reservoir_size:
+            keep = np.argpartition(keys, self.reservoir_size)[:self.reservoir_size]
+            keys, values = keys[keep], values[:, keep]
+        self.keys, self.values = keys, values
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        summary = {"samples": self.count}
+        if self.count == 0:
+            return summary
+        points = np.percentile(self.values, percentiles, axis=1)
+        for i, name in enumerate(self.names):
+            summary[name] = {
+                "min": float(self.minima[i]),
+                "mean": float(self.sums[i] / self.count),
+                "max": float(self.maxima[i]),
+                "percentiles": {f"p{p:g}": float(points[j, i]) for j, p in enumerate(percentiles)},
+            }
+        return summary
+
+# --- Monte-Carlo and grid sweeps ---
+def _evaluate(inputs, detailed):
+    results = simple_fault_batch(inputs["vp"], inputs["vs"], inputs["kva"], inputs["z_percent"])
+    if detailed:
+        # The detailed calculation takes the rating in VA
+        results.update(detailed_fault_batch(inputs["zp"], inputs["r1_r2"], inputs["vp"], inputs["vs"],
+                                            inputs["kva"] * 1000, inputs["z_percent"]))
+    return results
+
+def _output_names(detailed):
+    return SIMPLE_OUTPUTS + (DETAILED_OUTPUTS if detailed else ())
+
+def monte_carlo(base, samples=1_000_000, chunk_size=DEFAULT_CHUNK_SIZE, percentiles=DEFAULT_PERCENTILES,
+                reservoir_size=DEFAULT_RESERVOIR_SIZE, seed=None, **distributions):
+    # base holds vp, vs, kva, z_percent and optionally zp and r1_r2; keyword
+    # arguments replace any of them with a distribution, e.g.
+    # monte_carlo(base, z_percent=("tolerance", 6.0, 0.1), vp=("taps", 11000, 0.025, -2, 2))
+    params = dict(base, **distributions)
+    detailed = "zp" in params and "r1_r2" in params
+    rng = np.random.default_rng(seed)
+    stats = FaultStatistics(_output_names(detailed), reservoir_size, rng.integers(2**63))
+    for start in range(0, samples, chunk_size):
+        n = min(chunk_size, samples - start)
+        inputs = {name: sample(spec, rng, n) for name, spec in params.items()}
+        stats.update(_evaluate(inputs, detailed))
+    return stats.summary(percentiles)
+
+def grid_sweep(base, chunk_size=DEFAULT_CHUNK_SIZE, percentiles=DEFAULT_PERCENTILES,
+               reservoir_size=DEFAULT_RESERVOIR_SIZE, seed=None, **grids):
+    # Every combination of the given value grids, e.g. grid_sweep(base, z_percent=[5.4, 6.0, 6.6], zp=np.linspace(0.1, 1, 50));
+    # combinations are generated chunk by chunk rather than as a full meshgrid
+    if not grids:
+        raise ValueError("grid_sweep needs at least one grid")
+    params = dict(base)
+    detailed = ("zp" in params or "zp" in grids) and ("r1_r2" in params or "r1_r2" in grids)
+    names = list(grids)
+    axes = [np.asarray(grids[name], dtype=np.float64) for name in names]
+    shape = tuple(len(axis) for axis in axes)
+    total = int(np.prod(shape))
+    stats = FaultStatistics(_output_names(detailed), reservoir_size, seed)
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        n = len(flat)
+        inputs = {name: np.full(n, float(value)) for name, value in params.items() if name not in grids}
+        for name, axis, index in zip(names, axes, np.unravel_index(flat, shape)):
+            inputs[name] = axis[index]
+        stats.update(_evaluate(inputs, detailed))
+    return stats.summary(percentiles)
+
+def _parse_distribution(text):
+    # "6.0" -> 6.0, "tolerance:6.0:0.1" -> ("tolerance", 6.0, 0.1)
+    kind, _, rest = text.partition(":")
+    if not rest:
+        return float(kind)
+    values = [float(v) for v in rest.split(":")]
+    if kind == "taps":
+        values[2:] = [int(v) for v in values[2:]]
+    return (kind, *values)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Monte-Carlo fault current tolerance study")
+    parser.add_argument("--kva", type=float, default=1000, help="load in kVA; the 11 kV/415 V catalogue rating covering it is the base")
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int)
+    for name in ("vp", "vs", "z_percent", "zp", "r1_r2"):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=_parse_distribution,
+                            help="number or kind:arg:arg..., e.g. tolerance:6:0.1 or taps:11000:0.025:-2:2")
+    args = parser.parse_args()
+
+    base = base_transformer(args.kva)
+    if args.z_percent is None:
+        args.z_percent = ("tolerance", base["z_percent"], iec_impedance_tolerance(base["z_percent"]))
+    distributions = {name: getattr(args, name) for name in ("vp", "vs", "z_percent", "zp", "r1_r2")
+                     if getattr(args, name) is not None}
+    print(json.dumps(monte_carlo(base, args.samples, seed=args.seed, **distributions), indent=2))
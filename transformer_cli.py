@@ -0,0 +1,297 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+import numpy as np
+
+from fault_engine import (simple_fault_batch, detailed_fault_batch, simple_fault_batch_complex,
+                          detailed_fault_batch_complex, split_impedance)
+from calc_cache import dedup_batch
+from result_store import ResultStore, ResultStoreWriter
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# Accepted spellings for each input column (matched case-insensitively)
+INPUT_COLUMNS = {
+    "vp": ("vp", "primary_voltage", "v_pri"),
+    "vs": ("vs", "secondary_voltage", "v_sec"),
+    "kva": ("kva", "rating_kva", "transformer_rating"),
+    "z_percent": ("z%", "z_percent", "impedance", "z (%)"),
+    "zp": ("zp", "primary_impedance", "ze+2r1"),
+    "r1_r2": ("r1+r2", "r1_r2", "secondary_impedance"),
+    # Complex engine only: transformer X/R, source X/R and circuit reactance X1+X2
+    "x_r": ("x/r", "x_r", "xr"),
+    "zp_x_r": ("zp_x/r", "zp_x_r"),
+    "x1_x2": ("x1+x2", "x1_x2"),
+}
+REQUIRED_COLUMNS = ("vp", "vs", "kva", "z_percent")
+DETAILED_COLUMNS = ("zp", "r1_r2")
+
+SIMPLE_OUTPUTS = ("vz", "secondary_full_load", "primary_current", "max_fault_current", "max_fault_kA")
+DETAILED_OUTPUTS = ("zp_referred", "zt", "zsec", "earth_fault_current", "primary_fault_current", "max_theoretical_fault")
+SIMPLE_COMPLEX_OUTPUTS = SIMPLE_OUTPUTS + ("kappa", "peak_max_fault_current", "asym_max_fault_current")
+DETAILED_COMPLEX_OUTPUTS = ("earth_fault_current", "primary_fault_current", "max_theoretical_fault",
+                            "peak_earth_fault_current", "asym_earth_fault_current")
+
+# --- Input readers (yield dicts of column arrays, one per chunk) ---
+def resolve_columns(header):
+    lookup = {name.strip().lower(): i for i, name in enumerate(header)}
+    positions = {}
+    for column, aliases in INPUT_COLUMNS.items():
+        for alias in aliases:
+            if alias in lookup:
+                positions[column] = lookup[alias]
+                break
+    missing = [c for c in REQUIRED_COLUMNS if c not in positions]
+    if missing:
+        raise ValueError(f"input is missing required column(s): {', '.join(missing)}")
+    return positions
+
+def _to_float(value):
+    if value is None or value == "":
+        return np.nan
+    return float(value)
+
+def _rows_to_columns(rows, positions, header, line_numbers):
+    # Transpose once and let NumPy parse each column of strings in C
+    fields = list(zip(*rows))
+    columns = {}
+    for column, pos in positions.items():
+        try:
+            columns[column] = np.array([value or "nan" for value in fields[pos]], dtype=np.float64)
+        except ValueError:
+            # Only on failure: find the cell NumPy rejected so the error can point at it
+            for line_number, value in zip(line_numbers, fields[pos]):
+                try:
+                    float(value or "nan")
+                except ValueError:
+                    raise ValueError(f"line {line_number}: column {header[pos]!r} is not a number: {value!r}") from None
+            raise
+    return columns
+
+def read_csv_chunks(stream, chunk_size):
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = resolve_columns(header)
+    width = len(header)
+
+    def data_rows():
+        for row in reader:
+            if not any(field.strip() for field in row):
+                # Blank lines carry no data
+                continue
+            if len(row) != width:
+                raise ValueError(f"line {reader.line_num}: expected {width} fields, got {len(row)}")
+            yield reader.line_num, row
+
+    rows_iter = data_rows()
+    while True:
+        numbered = list(itertools.islice(rows_iter, chunk_size))
+        if not numbered:
+            break
+        line_numbers, rows = zip(*numbered)
+        yield _rows_to_columns(rows, positions, header, line_numbers)
+
+def _parse_record(line_number, line):
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"line {line_number}: invalid JSON ({e})") from None
+    if not isinstance(record, dict):
+        raise ValueError(f"line {line_number}: expected a JSON object, got {type(record).__name__}")
+    return record
+
+def _record_float(line_number, record, key):
+    value = record.get(key)
+    try:
+        return _to_float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"line {line_number}: field {key!r} is not a number: {value!r}") from None
+
+def read_jsonl_chunks(stream, chunk_size):
+    lines = ((n, line) for n, line in enumerate(stream, 1) if line.strip())
+    positions = None
+    while True:
+        numbered = list(itertools.islice(lines, chunk_size))
+        if not numbered:
+            break
+        records = [(n, _parse_record(n, line)) for n, line in numbered]
+        if positions is None:
+            keys = list(records[0][1].keys())
+            positions = {column: keys[pos] for column, pos in resolve_columns(keys).items()}
+        yield {column: np.array([_record_float(n, r, key) for n, r in records], dtype=np.float64)
+               for column, key in positions.items()}
+
+def read_store_chunks(store, chunk_size):
+    # Input columns straight out of a result store written by an earlier run
+    positions = {column: store.names[pos] for column, pos in resolve_columns(store.names).items()}
+    for start in range(0, len(store), chunk_size):
+        yield {column: np.array(store[name][start:start + chunk_size], dtype=np.float64)
+               for column, name in positions.items()}
+
+# --- Calculation ---
+def calculate_chunk(columns, mode="auto", dedupe=False, engine="magnitude"):
+    # With dedupe, each distinct input row is computed once and scattered back
+    def run(kernel, *arrays):
+        return dedup_batch(kernel, *arrays)[0] if dedupe else kernel(*arrays)
+
+    if engine == "complex":
+        return _calculate_complex(columns, mode)
+    vp, vs, kva, z_percent = (columns[c] for c in REQUIRED_COLUMNS)
+    results = {}
+    if mode in ("auto", "simple", "both"):
+        simple = run(simple_fault_batch, vp, vs, kva, z_percent)
+        results.update((name, simple[name]) for name in SIMPLE_OUTPUTS)
+    if _wants_detailed(columns, mode):
+        # The detailed calculation takes the rating in VA
+        detailed = run(detailed_fault_batch, columns["zp"], columns["r1_r2"], vp, vs, kva * 1000, z_percent)
+        results.update((name, detailed[name]) for name in DETAILED_OUTPUTS)
+    return results
+
+def _wants_detailed(columns, mode):
+    has_detailed = all(c in columns for c in DETAILED_COLUMNS)
+    if mode in ("detailed", "both") and not has_detailed:
+        raise ValueError("detailed mode needs Zp and R1+R2 columns")
+    return has_detailed and mode != "simple"
+
+def _calculate_complex(columns, mode):
+    if "x_r" not in columns:
+        raise ValueError("the complex engine needs an X/R column for the transformer")
+    vp, vs, kva, z_percent = (columns[c] for c in REQUIRED_COLUMNS)
+    results = {}
+    if mode in ("auto", "simple", "both"):
+        simple = simple_fault_batch_complex(vp, vs, kva, z_percent, columns["x_r"])
+        results.update((name, simple[name]) for name in SIMPLE_COMPLEX_OUTPUTS)
+    if _wants_detailed(columns, mode):
+        # Missing source X/R or circuit reactance leaves that part purely resistive
+        zp, r1_r2 = columns["zp"], columns["r1_r2"]
+        if "zp_x_r" in columns:
+            zp = split_impedance(zp, np.nan_to_num(columns["zp_x_r"]))
+        if "x1_x2" in columns:
+            r1_r2 = r1_r2 + 1j * np.nan_to_num(columns["x1_x2"])
+        detailed = detailed_fault_batch_complex(zp, r1_r2, vp, vs, kva * 1000, z_percent, columns["x_r"])
+        results.update((name, detailed[name]) for name in DETAILED_COMPLEX_OUTPUTS)
+        results["zsec_r"] = detailed["zsec"].real
+        results["zsec_x"] = detailed["zsec"].imag
+        results["loop_x_r"] = detailed["x_r"]
+    return results
+
+# --- Output writers (append one chunk at a time) ---
+FLOAT_FORMAT = "%.12g"
+
+class CsvResultWriter:
+    def __init__(self, stream):
+        self.stream = stream
+        self.header_written = False
+
+    def write(self, columns, results):
+        if not self.header_written:
+            csv.writer(self.stream, lineterminator="\n").writerow(list(columns) + list(results))
+            self.header_written = True
+        # Every cell is numeric, so rows can be joined directly without csv quoting
+        fields = [list(map(FLOAT_FORMAT.__mod__, a.tolist()))
+                  for a in itertools.chain(columns.values(), results.values())]
+        self.stream.writelines(",".join(row) + "\n" for row in zip(*fields))
+
+    def flush(self):
+        self.stream.flush()
+
+class JsonlResultWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, columns, results):
+        names = list(columns) + list(results)
+        # NaN is not valid JSON, so missing/invalid values are written as null
+        arrays = [np.where(np.isnan(a), None, a).tolist() for a in itertools.chain(columns.values(), results.values())]
+        self.stream.writelines(json.dumps(dict(zip(names, row))) + "\n" for row in zip(*arrays))
+
+    def flush(self):
+        self.stream.flush()
+
+# The store format reads and writes a result_store directory instead of a stream
+READERS = {"csv": read_csv_chunks, "jsonl": read_jsonl_chunks, "store": read_store_chunks}
+WRITERS = {"csv": CsvResultWriter, "jsonl": JsonlResultWriter, "store": ResultStoreWriter}
+
+def detect_format(path, default="csv"):
+    ext = os.path.splitext(path.rstrip("/\\"))[1].lower().lstrip(".")
+    if ext == "store" or os.path.isdir(path):
+        return "store"
+    if ext in ("jsonl", "ndjson", "json"):
+        return "jsonl"
+    if ext in ("csv", "txt"):
+        return "csv"
+    return default
+
+def run_batch(input_stream, output_stream, input_format="csv", output_format="csv",
+              chunk_size=DEFAULT_CHUNK_SIZE, workers=1, **options):
+    writer = WRITERS[output_format](output_stream)
+    chunks = READERS[input_format](input_stream, chunk_size)
+    if workers == 1:
+        processed = ((columns, calculate_chunk(columns, **options)) for columns in chunks)
+    else:
+        from parallel_study import run_chunks
+        processed = run_chunks(chunks, workers, **options)
+    total = 0
+    for columns, results in processed:
+        writer.write(columns, results)
+        writer.flush()
+        total += len(columns["vp"])
+    return total
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="transformer_cli",
+        description="Headless batch mode for the Transformer & Short Circuit Calculator")
+    parser.add_argument("input", help="CSV or JSONL file with Vp, Vs, kVA, Z%% and optionally Zp, R1+R2 ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file ('-' for stdout); a *.store path writes a memory-mapped result store directory")
+    parser.add_argument("--input-format", choices=sorted(READERS), help="defaults to the input file extension")
+    parser.add_argument("--output-format", choices=sorted(WRITERS), help="defaults to the output file extension")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk (default %(default)s)")
+    parser.add_argument("--mode", choices=("auto", "simple", "detailed", "both"), default="auto",
+                        help="auto runs the detailed calculation when Zp and R1+R2 are present")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for the calculation; 0 uses every core (default %(default)s)")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="compute each distinct input row once per chunk and copy the result to its duplicates")
+    parser.add_argument("--engine", choices=("magnitude", "complex"), default="magnitude",
+                        help="complex adds impedances as R + jX using the X/R columns and reports peak/asymmetrical current")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    input_format = args.input_format or detect_format(args.input)
+    output_format = args.output_format or detect_format(args.output)
+    if "-" in (args.input, args.output) and "store" in (input_format, output_format):
+        print("error: a result store must be a directory path, not '-'", file=sys.stderr)
+        return 2
+    if input_format == "store":
+        input_stream = ResultStore(args.input)
+    else:
+        input_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    if output_format == "store":
+        output_stream = args.output
+    else:
+        output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        total = run_batch(input_stream, output_stream, input_format, output_format, args.chunk_size,
+                          args.workers or os.cpu_count() or 1, mode=args.mode, dedupe=args.dedupe, engine=args.engine)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if input_stream is not sys.stdin and input_format != "store":
+            input_stream.close()
+        if output_stream is not sys.stdout and output_format != "store":
+            output_stream.close()
+    print(f"{total:,} rows processed", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
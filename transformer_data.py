@@ -0,0 +1,35 @@
+from rating_tables import load_tables
+
+# --- Transformer rating reference data (shown on the Transformer Tables page) ---
+# Each table is generated from its ratings and voltage class by rating_tables;
+# "columns" picks what the page shows, in order. The 240 V and 480 V tables
+# carry no impedance data, so they have no short-circuit column.
+TRANSFORMER_TABLES = {
+    "single_phase_240v": {
+        "kva": (1, 5, 10, 15, 25, 37.5, 50, 75, 100, 167, 250),
+        "secondary_voltage": 240, "phases": 1, "decimals": 2,
+        "columns": ("kva", "base_current"),
+    },
+    "three_phase_480v": {
+        "kva": (3, 6, 9, 15, 30, 45, 75, 112.5, 150, 225, 300, 500, 750, 1000),
+        "secondary_voltage": 480, "decimals": 1,
+        "columns": ("kva", "base_current"),
+    },
+    "distribution_11kv": {
+        "kva": (100, 200, 315, 630, 1000, 1250, 1600, 2000, 2500),
+        "primary_voltage": 11000, "secondary_voltage": 415, "decimals": 1,
+        "impedance": (4.5, 4.5, 5.0, 5.5, 6.0, 6.0, 6.5, 6.5, 7.0),
+        "columns": ("kva", "primary_voltage", "secondary_voltage", "base_current", "impedance"),
+    },
+    "power_transformers": {
+        "kva": (12500, 20000, 31500, 100000, 160000, 315000, 500000),
+        "primary_voltage": (66000, 66000, 66000, 132000, 132000, 400000, 765000),
+        "secondary_voltage": (11000, 11000, 11000, 11000, 11000, 220000, 400000),
+        "impedance": (8.0, 8.5, 9.0, 12.0, 12.5, 14.0, 15.0), "decimals": 1,
+        "columns": ("mva", "voltage", "base_current_hv", "base_current_lv", "impedance"),
+    },
+}
+
+def load_transformer_data(cache_dir=None):
+    # Each table comes back as {column name: NumPy array}, from the on-disk cache when the specs are unchanged
+    return load_tables(TRANSFORMER_TABLES, cache_dir)
@@ -0,0 +1,1164 @@
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+                             QPushButton, QLineEdit, QLabel, QGroupBox, QGridLayout,
+                             QTableView, QMessageBox,
+                             QHeaderView, QTabWidget, QScrollArea, QDialog,
+                             QMainWindow, QMenuBar, QAction, QStackedWidget, QFileDialog)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QVariant, QObject,
+                          QRunnable, QThreadPool, QTimer)
+import math
+import os
+import numpy as np
+from calc_cache import cached_simple_fault, cached_detailed_fault, DEFAULT_CACHE
+from transformer_data import load_transformer_data
+from rating_catalogue import RatingCatalogue
+from result_store import ResultStore
+from project_file import Project, ProjectFormatError
+from report_export import export_tables, iter_column_rows
+import instrumentation
+from instrumentation import span
+
+# --- Application stylesheet ---
+# The whole theme is one sheet, set once on the main window (which measured
+# faster than the QApplication for page builds and restyles). Page widgets only
+# get an objectName, so building a page never parses CSS and a restyle is a
+# single setStyleSheet call. Dialogs are parented to the window, so the sheet
+# reaches them (and the menus) too.
+APP_STYLESHEET = """
+QMainWindow, QWidget { background-color: #2c3e50; color: #ecf0f1; font-family: 'Segoe UI', Arial, sans-serif; }
+QMenuBar { background-color: #34495e; color: #ecf0f1; font-size: 14px; font-weight: bold; padding: 5px; }
+QMenuBar::item { padding: 8px 15px; margin: 2px; }
+QMenuBar::item:selected { background-color: #4a6278; border-radius: 5px; }
+QMenu { background-color: #34495e; color: #ecf0f1; border: 1px solid #7f8c8d; }
+QMenu::item:selected { background-color: #e67e22; }
+QScrollArea#pageScroll { border: none; background-color: #2c3e50; }
+QScrollArea#pageScroll QScrollBar:vertical { background-color: #34495e; width: 12px; border-radius: 6px; }
+QScrollArea#pageScroll QScrollBar::handle:vertical { background-color: #e67e22; border-radius: 6px; min-height: 20px; }
+QScrollArea#pageScroll QScrollBar::handle:vertical:hover { background-color: #f39c12; }
+QLabel#pageIcon { color: #e67e22; font-size: 36pt; }
+QLabel#pageTitle { color: #e67e22; margin-bottom: 5px; font-size: 20pt; font-weight: bold; }
+QLabel#pageDescription { color: #bdc3c7; margin-bottom: 15px; font-size: 12pt; }
+QLabel#tableTitle { color: #e67e22; margin: 10px; font-size: 25pt; font-weight: bold; }
+QPushButton#backButton { background-color: #34495e; color: #ecf0f1; border: 1px solid #7f8c8d; border-radius: 6px; padding: 8px 20px; font-size: 14px; font-weight: bold; }
+QPushButton#backButton:hover { background-color: #4a6278; border: 1px solid #bdc3c7; }
+QPushButton#actionButton { background-color: #e67e22; color: white; border: none; border-radius: 10px; padding: 12px; font-size: 16px; font-weight: bold; margin: 15px 0px; min-height: 25px; }
+QPushButton#actionButton:hover { background-color: #f39c12; }
+QPushButton#actionButton:pressed { background-color: #d35400; }
+QGroupBox { background-color: #34495e; border-radius: 12px; border: 1px solid #7f8c8d; padding: 15px; font-size: 14px; font-weight: bold; color: #e67e22; margin-top: 8px; }
+QGroupBox::title { color: #e67e22; font-size: 16px; padding: 5px; }
+QGroupBox QLabel { color: #ecf0f1; font-size: 13px; font-weight: bold; }
+QLineEdit { background-color: #2c3e50; color: #ecf0f1; border: 2px solid #7f8c8d; border-radius: 6px; padding: 10px; font-size: 14px; }
+QLineEdit:focus { border: 2px solid #e67e22; background-color: #4a6278; }
+QLabel#results { background-color: #233140; color: #f39c12; border: 1px solid #34495e; border-radius: 8px; padding: 15px; font-size: 13px; font-family: 'Consolas', 'Courier New', monospace; font-weight: bold; }
+QTableView { background-color: #2c3e50; color: #ecf0f1; border: 1px solid #7f8c8d; border-radius: 8px; gridline-color: #34495e; font-size: 12px; }
+QTableView::item { padding: 8px; border-bottom: 1px solid #34495e; }
+QTableView::item:selected { background-color: #e67e22; color: white; font-weight: bold; }
+QTableView::item:alternate { background-color: #34495e; }
+QHeaderView::section { background-color: #34495e; color: #ecf0f1; padding: 10px; font-weight: bold; border: 1px solid #7f8c8d; font-size: 12px; }
+QHeaderView::section:hover { background-color: #4a6278; }
+QTabWidget::pane { border: 1px solid #7f8c8d; background-color: #34495e; border-radius: 8px; }
+QTabBar::tab { background-color: #2c3e50; color: #ecf0f1; padding: 10px 20px; margin: 2px; border-top-left-radius: 6px; border-top-right-radius: 6px; border: 1px solid #7f8c8d; border-bottom: none; font-size: 12px; font-weight: bold; }
+QTabBar::tab:selected { background-color: #34495e; }
+QTabBar::tab:hover { background-color: #4a6278; }
+QLabel#logo { background-color: #34495e; border: 4px solid #ecf0f1; border-radius: 60px; }
+QLabel#appTitle { color: #ecf0f1; margin-left: 40px; }
+QLabel#appSubtitle { color: #bdc3c7; margin-left: 40px; }
+QLabel#appVersion { color: #e67e22; margin-left: 40px; }
+QLabel#sectionTitle { color: #e67e22; margin: 40px 0px; }
+QPushButton#menuCard { background-color: #34495e; border: 2px solid #7f8c8d; border-radius: 25px; padding: 20px; }
+QPushButton#menuCard:hover { background-color: #4a6278; border: 2px solid #e67e22; }
+QPushButton#menuCard:pressed { background-color: #2c3e50; }
+QLabel#menuCardIcon { color: #e67e22; background: transparent; border: none; }
+QLabel#menuCardTitle { color: #ecf0f1; background: transparent; border: none; }
+QLabel#footer { margin-top: 50px; }
+QLabel#aboutTitle { color: #e67e22; margin: 20px; }
+QLabel#aboutVersion { color: #bdc3c7; margin-bottom: 20px; }
+QLabel#aboutDescription { margin: 20px; line-height: 1.6; }
+QLabel#aboutCopyright { color: #7f8c8d; margin-top: 20px; }
+QPushButton#dialogButton { background-color: #34495e; color: #ecf0f1; border: 1px solid #7f8c8d; border-radius: 8px; padding: 10px 30px; font-size: 14px; font-weight: bold; }
+QPushButton#dialogButton:hover { background-color: #4a6278; border: 1px solid #bdc3c7; }
+QDialog#statsDialog QLabel { font-size: 13px; }
+QDialog#statsDialog QPushButton { background-color: #34495e; color: #ecf0f1; border: 1px solid #7f8c8d; border-radius: 6px; padding: 8px 16px; font-size: 13px; font-weight: bold; }
+QDialog#statsDialog QPushButton:hover { background-color: #4a6278; border: 1px solid #bdc3c7; }
+QDialog#statsDialog QTableView { background-color: #34495e; color: #ecf0f1; gridline-color: #7f8c8d; }
+QDialog#statsDialog QHeaderView::section { background-color: #e67e22; color: white; padding: 6px; border: none; font-weight: bold; }
+"""
+
+# --- About Dialog (with link and new theme) ---
+class AboutDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("About - Transformer Calculator")
+        self.setMinimumSize(600, 500)
+        self.setModal(True)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        title = QLabel("Transformer & Short Circuit Calculator")
+        title.setFont(QFont('Segoe UI', 20, QFont.Bold))
+        title.setAlignment(Qt.AlignCenter)
+        title.setObjectName("aboutTitle")
+
+        version = QLabel("Version 1.0.0")
+        version.setFont(QFont('Segoe UI', 14))
+        version.setAlignment(Qt.AlignCenter)
+        version.setObjectName("aboutVersion")
+
+        description = QLabel("""
+        Professional Transformer and Short Circuit Calculator
+        
+        Features:
+        • Simple and Detailed Calculations
+        • Comprehensive Transformer Rating Tables
+        • Fault Current Analysis
+        • Loop Impedance Calculations
+        • Primary and Secondary Current Analysis
+        • Industry Standard Formulas (IEEE/IEC)
+        
+        Based on Blakley Calculator methodology with advanced 
+        electrical engineering calculations for power system analysis.
+        
+        Developed for electrical engineers, technicians, and 
+        power system professionals.
+        """)
+        description.setFont(QFont('Segoe UI', 12))
+        description.setWordWrap(True)
+        description.setAlignment(Qt.AlignLeft)
+        description.setObjectName("aboutDescription")
+
+        website_link = QLabel('<a href="https://roshannfs.github.io/SRT-/SRT-/" style="color: #f39c12; text-decoration: none;">Visit Roshan Technologies</a>')
+        website_link.setFont(QFont('Segoe UI', 12, QFont.Bold))
+        website_link.setAlignment(Qt.AlignCenter)
+        website_link.setOpenExternalLinks(True)
+
+        copyright_label = QLabel("© 2025 ROSHAN TECHNOLOGIES. I N N O V A T E . E L E V A T E . D O M I N A T E")
+        copyright_label.setFont(QFont('Segoe UI', 10))
+        copyright_label.setAlignment(Qt.AlignCenter)
+        copyright_label.setObjectName("aboutCopyright")
+
+        close_button = QPushButton("Close")
+        close_button.setObjectName("dialogButton")
+        close_button.clicked.connect(self.accept)
+
+        layout.addWidget(title)
+        layout.addWidget(version)
+        layout.addWidget(description)
+        layout.addWidget(website_link)
+        layout.addWidget(copyright_label)
+        layout.addWidget(close_button, alignment=Qt.AlignCenter)
+        self.setLayout(layout)
+
+class PerformanceStatsDialog(QDialog):
+    # Live view of the instrumentation counters plus the calculation cache
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Performance Stats")
+        self.setMinimumSize(720, 520)
+        self.init_ui()
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+
+    def init_ui(self):
+        self.setObjectName("statsDialog")
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel()
+        self.table = QTableView()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # One model for the dialog's lifetime; refresh() swaps its columns
+        self.model = ColumnTableModel([[], [], [], [], []], ["Span", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)"],
+                                      self.table)
+        self.table.setModel(self.model)
+        self.cache_label = QLabel()
+
+        buttons = QHBoxLayout()
+        self.enable_button = QPushButton()
+        self.enable_button.clicked.connect(self.toggle_enabled)
+        self.profile_button = QPushButton()
+        self.profile_button.clicked.connect(self.toggle_profile)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset)
+        dump_button = QPushButton("Dump Trace...")
+        dump_button.clicked.connect(self.dump_trace)
+        for button in (self.enable_button, self.profile_button, reset_button, dump_button):
+            buttons.addWidget(button)
+
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.table)
+        layout.addWidget(self.cache_label)
+        layout.addLayout(buttons)
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        rows = instrumentation.snapshot()
+        columns = [np.array([r["name"] for r in rows], dtype=str), np.array([r["count"] for r in rows], dtype=np.int64)]
+        columns += [np.array([r[key] * 1000 for r in rows], dtype=np.float64) for key in ("total", "mean", "max")]
+        self.model.set_columns(columns)
+        enabled, profiling = instrumentation.is_enabled(), instrumentation.is_profiling()
+        self.status_label.setText(f"Instrumentation: {'on' if enabled else 'off'}"
+                                  f"{' - profiling this session' if profiling else ''}")
+        self.enable_button.setText("Disable" if enabled else "Enable")
+        self.profile_button.setText("Stop Profile" if profiling else "Start Profile")
+        stats = DEFAULT_CACHE.stats()
+        self.cache_label.setText(f"Calculation cache: {stats['size']}/{stats['maxsize']} entries, "
+                                 f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+
+    def toggle_enabled(self):
+        if instrumentation.is_enabled():
+            instrumentation.disable()
+        else:
+            instrumentation.enable()
+        self.refresh()
+
+    def toggle_profile(self):
+        if instrumentation.is_profiling():
+            self.profile = instrumentation.stop_profile()
+        else:
+            instrumentation.start_profile()
+        self.refresh()
+
+    def reset(self):
+        instrumentation.reset()
+        self.refresh()
+
+    def dump_trace(self):
+        directory = QFileDialog.getExistingDirectory(self, "Dump Trace To")
+        if not directory:
+            return
+        # A running profile would leave self.profile pointing at the previous session, so end it here
+        if instrumentation.is_profiling():
+            self.profile = instrumentation.stop_profile()
+            self.refresh()
+        written = instrumentation.dump_trace(directory, getattr(self, "profile", None))
+        QMessageBox.information(self, "Dump Trace", "Wrote:\n" + "\n".join(written))
+
+# --- Base Widget for common styles and back button signal ---
+class BasePageWidget(QWidget):
+    back_pressed = pyqtSignal()
+    # Emitted when anything a project file would save changes
+    state_changed = pyqtSignal()
+    # Project state key -> QLineEdit attribute
+    state_fields = {}
+
+    def get_state(self):
+        return {key: getattr(self, attr).text() for key, attr in self.state_fields.items()}
+
+    def set_state(self, state):
+        for key, attr in self.state_fields.items():
+            if key in state:
+                getattr(self, attr).setText(state[key])
+
+    def track_state(self):
+        for attr in self.state_fields.values():
+            getattr(self, attr).textChanged.connect(self.state_changed.emit)
+
+    def create_top_bar(self):
+        top_bar_layout = QHBoxLayout()
+        back_button = QPushButton("⬅ Back to Menu", objectName="backButton")
+        back_button.setFixedWidth(170) # FIX: Increased width
+        back_button.clicked.connect(self.back_pressed.emit)
+        top_bar_layout.addWidget(back_button)
+        top_bar_layout.addStretch()
+        return top_bar_layout
+
+    def create_title(self, icon, title, description):
+        title_layout = QHBoxLayout()
+        icon_label = QLabel(icon, objectName="pageIcon")
+        icon_label.setFixedWidth(60)
+        title_info = QVBoxLayout()
+        title_info.addWidget(QLabel(title, objectName="pageTitle"))
+        title_info.addWidget(QLabel(description, objectName="pageDescription", wordWrap=True))
+        title_layout.addWidget(icon_label)
+        title_layout.addLayout(title_info)
+        title_layout.addStretch()
+        return title_layout
+
+    def autofill_impedance(self, rating_kva, primary_field, secondary_field, impedance_field):
+        # Pre-fill Z% from the catalogue rating that covers the entered load, if the user left it blank
+        if self.catalogue is None or impedance_field.text().strip():
+            return
+        try:
+            rating = self.catalogue.autofill(rating_kva(), float(secondary_field.text()), float(primary_field.text()))
+        except ValueError:
+            return
+        if rating is not None and not math.isnan(rating["impedance"]):
+            impedance_field.setText(f"{rating['impedance']:g}")
+
+# --- Live recalculation: debounced, computed on the thread pool ---
+class CalculationSignals(QObject):
+    finished = pyqtSignal(int, object, object, object)
+
+class CalculationTask(QRunnable):
+    def __init__(self, live, generation, inputs):
+        super().__init__()
+        self.live = live
+        self.generation = generation
+        self.inputs = inputs
+        # The calculator keeps its own reference: a pool-deleted task would
+        # leave pending_task dangling for tryTake()
+        self.setAutoDelete(False)
+
+    def run(self):
+        # Skip work that a newer keystroke has already superseded
+        if self.generation != self.live.generation:
+            return
+        try:
+            with span("compute"):
+                result, error = self.live.compute(self.inputs), None
+        except Exception as e:
+            result, error = None, e
+        self.live.signals.finished.emit(self.generation, self.inputs, result, error)
+
+class LiveCalculator(QObject):
+    # Recomputes a page whenever one of its fields changes. Each edit bumps a
+    # generation counter: queued tasks for older generations are taken back off
+    # the pool, and results that arrive for them are dropped.
+    def __init__(self, page, fields, delay_ms=250):
+        super().__init__(page)
+        self.page = page
+        self.compute = page.compute
+        self.generation = 0
+        self.pending_task = None
+        self.signals = CalculationSignals(self)
+        self.signals.finished.connect(self.on_finished)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.start)
+        for field in fields:
+            field.textChanged.connect(self.schedule)
+
+    def schedule(self):
+        self.generation += 1
+        self.cancel_pending()
+        self.timer.start()
+
+    def cancel_pending(self):
+        if self.pending_task is not None:
+            QThreadPool.globalInstance().tryTake(self.pending_task)
+            self.pending_task = None
+
+    def start(self):
+        try:
+            with span("parse"):
+                inputs = self.page.read_live_inputs()
+        except ValueError as e:
+            # A filled-in field that is not a number: don't leave a stale result on screen
+            self.page.show_error(e)
+            return
+        if inputs is None:
+            # Still being filled in, which is not an error
+            self.page.show_placeholder()
+            return
+        self.generation += 1
+        self.pending_task = CalculationTask(self, self.generation, inputs)
+        QThreadPool.globalInstance().start(self.pending_task)
+
+    def on_finished(self, generation, inputs, result, error):
+        if generation != self.generation:
+            return
+        self.pending_task = None
+        if error is not None:
+            self.page.show_error(error)
+        else:
+            self.page.show_result(inputs, result)
+
+# --- Calculator pages built from a declarative field spec ---
+class FormPageWidget(BasePageWidget):
+    # Subclasses describe the page and supply compute() and format_result().
+    # fields holds one (attribute, project key, label, placeholder) entry per
+    # numeric input, in the order read_inputs() returns them.
+    span_name = "calculate"
+    icon = title = description = ""
+    input_title = "Input Parameters"
+    fields = ()
+    button_text = "Calculate"
+    results_title = "Calculation Results"
+    results_placeholder = ""
+    results_height = 250
+    # (rating, primary voltage, secondary voltage, impedance) attributes for Z% autofill
+    autofill_fields = None
+    # kVA per unit of the rating field
+    rating_kva_scale = 1.0
+
+    def __init__(self, catalogue=None):
+        super().__init__()
+        self.catalogue = catalogue
+        self.init_ui()
+
+    @property
+    def state_fields(self):
+        return {key: attr for attr, key, _, _ in self.fields}
+
+    def input_fields(self):
+        return [getattr(self, attr) for attr, _, _, _ in self.fields]
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        scroll_area = QScrollArea(objectName="pageScroll", widgetResizable=True)
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.setSpacing(15)
+        content_layout.setContentsMargins(20, 20, 20, 20)
+        content_layout.addLayout(self.create_top_bar())
+        content_layout.addLayout(self.create_title(self.icon, self.title, self.description))
+
+        input_group = QGroupBox(self.input_title)
+        input_layout = QGridLayout(input_group)
+        input_layout.setSpacing(12)
+        input_layout.setColumnStretch(1, 2) # FIX: Allow input column to stretch
+        for row, (attr, _, label, placeholder) in enumerate(self.fields):
+            field = QLineEdit(placeholderText=placeholder)
+            setattr(self, attr, field)
+            input_layout.addWidget(QLabel(label), row, 0)
+            input_layout.addWidget(field, row, 1)
+        if self.autofill_fields:
+            rating, primary, secondary, impedance = (getattr(self, attr) for attr in self.autofill_fields)
+            rating.editingFinished.connect(lambda: self.autofill_impedance(
+                lambda: float(rating.text()) * self.rating_kva_scale, primary, secondary, impedance))
+        self.live_calculator = LiveCalculator(self, self.input_fields())
+        self.track_state()
+        content_layout.addWidget(input_group)
+
+        calc_button = QPushButton(self.button_text, objectName="actionButton")
+        calc_button.clicked.connect(self.calculate)
+        content_layout.addWidget(calc_button)
+
+        results_group = QGroupBox(self.results_title)
+        results_layout = QVBoxLayout(results_group)
+        self.results_display = QLabel(self.results_placeholder, objectName="results", wordWrap=True)
+        self.results_display.setMinimumHeight(self.results_height)
+        self.results_display.setAlignment(Qt.AlignTop)
+        results_layout.addWidget(self.results_display)
+        content_layout.addWidget(results_group)
+        content_layout.addStretch()
+
+        scroll_area.setWidget(content_widget)
+        main_layout.addWidget(scroll_area)
+
+    def read_inputs(self):
+        return tuple(float(field.text()) for field in self.input_fields())
+
+    def read_live_inputs(self):
+        # None while any field is blank; only the Calculate button treats that as an error
+        if any(not field.text().strip() for field in self.input_fields()):
+            return None
+        return self.read_inputs()
+
+    def show_placeholder(self):
+        self.results_display.setText(self.results_placeholder)
+
+    def show_result(self, inputs, result):
+        with span("format"):
+            text = self.format_result(inputs, result)
+        with span("widget_update"):
+            self.results_display.setText(text)
+
+    def show_error(self, error):
+        if isinstance(error, ValueError):
+            self.results_display.setText("❌ ERROR: Please enter valid numerical values for all fields.")
+        else:
+            self.results_display.setText(f"❌ UNEXPECTED ERROR: {str(error)}")
+
+    def calculate(self):
+        with span(self.span_name):
+            try:
+                with span("parse"):
+                    inputs = self.read_inputs()
+                with span("compute"):
+                    result = self.compute(inputs)
+                self.show_result(inputs, result)
+            except Exception as e:
+                self.show_error(e)
+
+class SimpleCalculationWidget(FormPageWidget):
+    span_name = "calculate.simple"
+    icon, title = "🔌", "Simple Calculations"
+    description = "Basic transformer fault current calculations using impedance voltage method"
+    fields = (
+        ("primary_voltage", "vp", "Primary Voltage (V):", "e.g., 11000"),
+        ("secondary_voltage", "vs", "Secondary Voltage (V):", "e.g., 415"),
+        ("transformer_rating", "kva", "Transformer Rating (kVA):", "e.g., 1000"),
+        ("impedance", "z_percent", "Impedance (%):", "e.g., 6"),
+    )
+    autofill_fields = ("transformer_rating", "primary_voltage", "secondary_voltage", "impedance")
+    results_placeholder = "Enter values and click Calculate to see results"
+
+    @staticmethod
+    def compute(inputs):
+        vp, vs, va_kva, z_percent = inputs
+        if vp > 0 and vs > 0 and va_kva > 0 and z_percent > 0:
+            return cached_simple_fault(vp, vs, va_kva, z_percent)
+        return None
+
+    def format_result(self, inputs, result):
+        if result is None:
+            return "⚠️ Please enter all required values greater than zero."
+        vp, vs, va_kva, z_percent = inputs
+        vz = result["vz"]
+        secondary_full_load = result["secondary_full_load"]
+        max_fault_current = result["max_fault_current"]
+        max_fault_kA = result["max_fault_kA"]
+        primary_current = result["primary_current"]
+        results_text = f"""📊 CALCULATION RESULTS:\n\n🔹 Impedance Voltage (Vz): {vz:.2f} V\n🔹 Secondary Full Load Current: {secondary_full_load:.2f} A\n🔹 Primary Current: {primary_current:.2f} A\n🔹 Maximum Fault Current: {max_fault_current:.2f} A\n🔹 Maximum Fault Current: {max_fault_kA:.3f} kA\n\n📋 FORMULAS USED:\n• Vz = (Vp × Z%) / 100\n• I_secondary = VA / (√3 × Vs)\n• I_fault_max = (100 / Z%) × I_secondary\n• I_primary = VA / (√3 × Vp)\n\n📝 INPUT VALUES:\n• Primary Voltage: {vp:,.0f} V\n• Secondary Voltage: {vs:,.0f} V\n• Transformer Rating: {va_kva:,.0f} kVA\n• Impedance: {z_percent:.1f}%\n\n✅ ANALYSIS COMPLETE"""
+        return results_text
+
+class DetailedCalculationWidget(FormPageWidget):
+    span_name = "calculate.detailed"
+    icon, title = "⚡", "Detailed Calculations"
+    description = "Advanced fault analysis with loop impedance calculations"
+    input_title = "System Parameters"
+    fields = (
+        ("primary_impedance", "zp", "Primary Circuit Impedance (Ω):", "Ze + 2R1 (e.g., 0.46)"),
+        ("secondary_impedance", "r1_r2", "Secondary Circuit Impedance (Ω):", "R1 + R2 (e.g., 0.2)"),
+        ("primary_voltage", "vp", "Primary Voltage (V):", "Primary voltage"),
+        ("secondary_voltage", "vs", "Secondary Voltage (V):", "Secondary voltage"),
+        ("transformer_rating", "va", "Transformer Rating (VA):", "VA rating"),
+        ("impedance_percent", "z_percent", "Impedance (%):", "Impedance %"),
+    )
+    button_text = "Calculate Loop Impedance"
+    results_title = "Detailed Fault Analysis Results"
+    results_placeholder = "Enter all system parameters and click Calculate to perform detailed fault analysis"
+    results_height = 300
+    autofill_fields = ("transformer_rating", "primary_voltage", "secondary_voltage", "impedance_percent")
+    rating_kva_scale = 0.001
+
+    @staticmethod
+    def compute(inputs):
+        zp, r1_r2, vp, vs, va, z_percent = inputs
+        if vp > 0 and vs > 0 and va > 0 and z_percent > 0:
+            return cached_detailed_fault(zp, r1_r2, vp, vs, va, z_percent)
+        return None
+
+    def format_result(self, inputs, result):
+        if result is None:
+            return "⚠️ Please enter all required values greater than zero."
+        zp, r1_r2, vp, vs, va, z_percent = inputs
+        zp_referred = result["zp_referred"]
+        zt = result["zt"]
+        zsec = result["zsec"]
+        voltage_to_earth = result["voltage_to_earth"]
+        earth_fault_current = result["earth_fault_current"]
+        primary_fault_current = result["primary_fault_current"]
+        secondary_full_load = result["secondary_full_load"]
+        max_theoretical_fault = result["max_theoretical_fault"]
+
+        results_text = f"""⚡ DETAILED FAULT ANALYSIS RESULTS:\n\n🔸 Total Loop Impedance (Zsec): {zsec:.4f} Ω\n🔸 Earth Fault Current: {earth_fault_current:.2f} A\n🔸 Primary Fault Current: {primary_fault_current:.2f} A\n🔸 Secondary Full Load Current: {secondary_full_load:.2f} A\n🔸 Max Theoretical Fault Current: {max_theoretical_fault:.2f} A (for reference)\n\n📊 IMPEDANCE BREAKDOWN:\n• Primary Circuit (referred to sec.): {zp_referred:.4f} Ω\n• Transformer Impedance (referred to sec.): {zt:.4f} Ω\n• Secondary Circuit (R1 + R2): {r1_r2:.4f} Ω\n\n⚙️ SYSTEM PARAMETERS:\n• Primary Voltage: {vp:,.0f} V\n• Secondary Voltage: {vs:,.0f} V\n• Transformer Rating: {va:,.0f} VA\n• Voltage to Earth: {voltage_to_earth:.1f} V\n\n✅ ANALYSIS COMPLETE"""
+        return results_text
+
+    def show_error(self, error):
+        if isinstance(error, ValueError):
+            self.results_display.setText("❌ ERROR: Please enter valid numerical values for all fields.")
+        elif isinstance(error, ZeroDivisionError):
+            self.results_display.setText("❌ ERROR: Division by zero. Check that voltage and VA values are not zero.")
+        else:
+            self.results_display.setText(f"❌ UNEXPECTED ERROR: {str(error)}")
+
+# --- Table model reading straight from column arrays ---
+class ColumnTableModel(QAbstractTableModel):
+    # Cells are formatted on demand from the underlying arrays, so no per-cell
+    # objects exist. Sorting and filtering only rebuild the row permutation.
+    number_format = "%.10g"
+    # Rows whose text the filter formats at a time
+    filter_chunk_rows = 1 << 16
+
+    def __init__(self, columns, headers, parent=None):
+        super().__init__(parent)
+        self.columns = [np.asarray(values) for values in columns]
+        self.headers = list(headers)
+        self.row_count = len(self.columns[0]) if self.columns else 0
+        self.rows = np.arange(self.row_count)
+        self.filter_text = ""
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            return self.format_value(self.columns[index.column()][self.rows[index.row()]].item())
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def format_value(self, value):
+        return self.number_format % value if isinstance(value, (int, float)) else str(value)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # A negative column (no sort indicator) restores the original row order
+        self.sort_column, self.sort_order = (column if column >= 0 else None), order
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self.rows
+        self.rows = self._ordered(self.rows)
+        # Selections and the current index follow their data rows to the new positions
+        persistent = self.persistentIndexList()
+        if persistent:
+            position = np.empty(self.row_count, dtype=np.intp)
+            position[self.rows] = np.arange(len(self.rows))
+            self.changePersistentIndexList(
+                persistent, [self.index(int(position[old_rows[i.row()]]), i.column()) for i in persistent])
+        self.layoutChanged.emit()
+
+    def set_filter(self, text):
+        request = self.filter_request(text)
+        self.apply_filter(request, self.find_rows(request))
+
+    # --- Filtering in two halves, so TableFilter can search off the GUI thread ---
+    def filter_request(self, text):
+        # A snapshot of everything the search reads. Typing more of the same
+        # filter can only drop rows, so then only the rows still shown (already
+        # in order) are searched.
+        text = text.strip().lower()
+        narrowing = bool(self.filter_text) and self.filter_text in text
+        return {"text": text, "columns": self.columns, "row_count": self.row_count, "shown": self.rows, "narrowing": narrowing,
+                "sort_values": None if self.sort_column is None else self.columns[self.sort_column],
+                "descending": self.sort_order == Qt.DescendingOrder}
+
+    def find_rows(self, request):
+        # Reads only the request, so it is safe to run on a worker thread
+        rows = request["shown"] if request["narrowing"] else np.arange(request["row_count"])
+        if request["text"]:
+            rows = self._matching(rows, request["text"], request["columns"])
+        if request["narrowing"]:
+            return rows
+        return self._order(rows, request["sort_values"], request["descending"])
+
+    def apply_filter(self, request, rows):
+        if request["columns"] is not self.columns or request["shown"] is not self.rows:
+            # The data, sort or filter changed while the search ran: search again here
+            request = self.filter_request(request["text"])
+            rows = self.find_rows(request)
+        self.filter_text = request["text"]
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def set_columns(self, columns):
+        # Swap in fresh data. When the visible shape is unchanged the view only
+        # hears that cells changed, so its selection and scroll position survive.
+        fresh = ColumnTableModel(columns, self.headers)
+        fresh.filter_text, fresh.sort_column, fresh.sort_order = self.filter_text, self.sort_column, self.sort_order
+        rows = fresh._visible_rows()
+        same_shape = len(rows) == len(self.rows) and len(fresh.columns) == len(self.columns)
+        if same_shape:
+            self.layoutAboutToBeChanged.emit()
+        else:
+            self.beginResetModel()
+        self.columns, self.row_count = fresh.columns, fresh.row_count
+        self.rows = rows
+        if not same_shape:
+            self.endResetModel()
+            return
+        self.layoutChanged.emit()
+        if len(rows) and self.columns:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self.columns) - 1))
+
+    def _visible_rows(self):
+        rows = np.arange(self.row_count)
+        if self.filter_text:
+            rows = self._matching(rows, self.filter_text, self.columns)
+        return self._ordered(rows)
+
+    def _ordered(self, rows):
+        sort_values = None if self.sort_column is None else self.columns[self.sort_column]
+        return self._order(rows, sort_values, self.sort_order == Qt.DescendingOrder)
+
+    @staticmethod
+    def _order(rows, sort_values, descending):
+        if sort_values is None:
+            # Unsorted means the original (data) order
+            return np.sort(rows)
+        order = np.argsort(sort_values[rows], kind="stable")
+        if descending:
+            order = order[::-1]
+        return rows[order]
+
+    def _matching(self, rows, text, columns):
+        # The rows (kept in order) whose display text contains the filter. Text
+        # is made a chunk at a time, once per distinct value, and dropped again,
+        # so no column of strings is ever held; a row matched by one column is
+        # not formatted for the next.
+        kept = []
+        for start in range(0, len(rows), self.filter_chunk_rows):
+            chunk = rows[start:start + self.filter_chunk_rows]
+            mask = np.zeros(len(chunk), dtype=bool)
+            for values in columns:
+                rest = np.flatnonzero(~mask)
+                if not len(rest):
+                    break
+                distinct, inverse = np.unique(values[chunk[rest]], return_inverse=True)
+                to_text = self.number_format.__mod__ if values.dtype.kind in "iuf" else (lambda v: str(v).lower())
+                hits = np.fromiter((text in value for value in map(to_text, distinct.tolist())),
+                                   dtype=bool, count=len(distinct))
+                mask[rest[hits[inverse.ravel()]]] = True
+            kept.append(chunk[mask])
+        return np.concatenate(kept) if kept else rows[:0]
+
+class TransformerTablesWidget(BasePageWidget):
+    def __init__(self, transformer_data):
+        super().__init__()
+        self.transformer_data = transformer_data
+        self.result_paths = []
+        # (title, headers, columns) of every tab, in tab order, for export
+        self.tables = []
+        self.init_ui()
+    
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        main_layout.addLayout(self.create_top_bar())
+        main_layout.addLayout(self.create_title("📋", "Transformer Rating Tables",
+                                                "Comprehensive reference data for electrical engineers"))
+        
+        self.tab_widget = QTabWidget()
+        
+        self.create_tabs()
+        self.tab_widget.currentChanged.connect(self.state_changed.emit)
+        
+        main_layout.addWidget(self.tab_widget)
+        
+    def create_tabs(self):
+        self.tab_widget.addTab(self.create_table_tab('Single Phase 240V Transformers', ['kVA', 'Base Current (A)'], self.transformer_data['single_phase_240v']), "     Single Phase 240V    " )
+        self.tab_widget.addTab(self.create_table_tab('Three Phase 480V Transformers', ['kVA', 'Base Current (A)'], self.transformer_data['three_phase_480v']), "    Three Phase 480V    ")
+        self.tab_widget.addTab(self.create_table_tab('Distribution Transformers 11kV/415V', ['kVA', 'V_pri', 'V_sec', 'I_base (A)', 'Z (%)'], self.transformer_data['distribution_11kv']), "   Distribution 11kV/415V   ")
+        self.tab_widget.addTab(self.create_table_tab('Power Transformers', ['MVA', 'Voltage', 'I_hv (A)', 'I_lv (A)', 'Z (%)'], self.transformer_data['power_transformers']), "    Power Transformers    ")
+
+    def add_result_store(self, path):
+        # Columns stay memory-mapped; the model only reads the rows it displays
+        store = ResultStore(path)
+        title = os.path.basename(os.path.normpath(path))
+        tab = self.create_table_tab(f'Results: {title} ({len(store):,} rows)', store.names, store.columns())
+        self.result_paths.append(path)
+        self.tab_widget.setCurrentIndex(self.tab_widget.addTab(tab, f"   {title}   "))
+
+    def get_state(self):
+        return {"tab": self.tab_widget.currentIndex(), "results": list(self.result_paths)}
+
+    def set_state(self, state):
+        for path in state.get("results", []):
+            if path not in self.result_paths and os.path.isdir(path):
+                self.add_result_store(path)
+        if 0 <= state.get("tab", -1) < self.tab_widget.count():
+            self.tab_widget.setCurrentIndex(state["tab"])
+
+    def create_table_tab(self, title_text, headers, data):
+        self.tables.append((title_text, list(headers), data))
+        with span("table_build"):
+            return self.build_table_tab(title_text, headers, data)
+
+    def export(self, path):
+        # Streams every tab (result stores included) from its column arrays
+        return export_tables(path, ((title, headers, iter_column_rows(data)) for title, headers, data in self.tables),
+                             title="Transformer Rating Tables")
+
+    def build_table_tab(self, title_text, headers, data):
+        tab_widget = QWidget()
+        layout = QVBoxLayout(tab_widget)
+        desc = QLabel(title_text, objectName="tableTitle")
+        filter_input = QLineEdit(placeholderText="Filter rows...")
+
+        model = ColumnTableModel(list(data.values()), headers, tab_widget)
+        table = QTableView()
+        table.setModel(model)
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        table.horizontalHeader().setSortIndicatorShown(True)
+        # Kept on the tab so the filter lives as long as its table
+        tab_widget.table_filter = TableFilter(model, filter_input)
+        
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights keep Qt from measuring every row of a large catalogue
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(36)
+        table.setAlternatingRowColors(True)
+        
+        layout.addWidget(desc)
+        layout.addWidget(filter_input)
+        layout.addWidget(table)
+        return tab_widget
+
+class TableFilter(QObject):
+    # Runs a table's filter box through a LiveCalculator: the row search waits
+    # for a pause in typing and runs on the thread pool, so a large table never
+    # blocks the GUI; the found rows are swapped into the model on the GUI thread.
+    def __init__(self, model, filter_input):
+        super().__init__(filter_input)
+        self.model = model
+        self.filter_input = filter_input
+        self.live_calculator = LiveCalculator(self, [filter_input])
+
+    def read_live_inputs(self):
+        return self.model.filter_request(self.filter_input.text())
+
+    def compute(self, request):
+        return self.model.find_rows(request)
+
+    def show_result(self, request, rows):
+        self.model.apply_filter(request, rows)
+
+    def show_error(self, error):
+        # Not expected from a text search; fall back to filtering in place
+        self.model.set_filter(self.filter_input.text())
+
+# --- Main Window using QStackedWidget ---
+class TransformerCalculatorMainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.transformer_data = self.load_transformer_data()
+        self.catalogue = self.load_catalogue()
+        self.project = Project()
+        self.init_ui()
+
+    def init_ui(self):
+        self.update_title()
+        self.setMinimumSize(1200, 800)
+        self.resize(1400, 900)
+        self.set_dark_theme()
+        self.create_menu_bar()
+
+        self.stacked_widget = QStackedWidget()
+        self.setCentralWidget(self.stacked_widget)
+        
+        self.main_menu_widget = self.create_main_menu_page()
+        self.stacked_widget.addWidget(self.main_menu_widget)
+
+        # Calculator pages are only built the first time they are shown
+        self.pages = {}
+        self.page_factories = {
+            "simple": lambda: SimpleCalculationWidget(self.catalogue),
+            "detailed": lambda: DetailedCalculationWidget(self.catalogue),
+            "tables": lambda: TransformerTablesWidget(self.transformer_data),
+        }
+
+    def get_page(self, name):
+        page = self.pages.get(name)
+        if page is None:
+            with span(f"build.{name}"):
+                page = self.page_factories[name]()
+            # A project section is only decoded when its page is first shown
+            try:
+                state = self.project.get(f"page/{name}")
+            except (OSError, ValueError) as e:
+                # A corrupt record (bad JSON or an unknown kind) must not take the page down with it
+                QMessageBox.warning(self, "Open Project", f"Could not read the saved {name} page; it starts empty:\n{e}")
+                state = None
+            if state is not None:
+                page.set_state(state)
+            page.state_changed.connect(lambda: self.setWindowModified(True))
+            page.back_pressed.connect(self.show_main_menu)
+            self.stacked_widget.addWidget(page)
+            self.pages[name] = page
+        return page
+
+    @property
+    def simple_calc_widget(self): return self.get_page("simple")
+    @property
+    def detailed_calc_widget(self): return self.get_page("detailed")
+    @property
+    def tables_widget(self): return self.get_page("tables")
+
+    def create_main_menu_page(self):
+        main_menu_widget = QWidget()
+        main_layout = QVBoxLayout(main_menu_widget)
+        main_layout.setSpacing(50)
+        main_layout.setContentsMargins(50, 50, 50, 50)
+        main_layout.addLayout(self.create_header())
+        main_layout.addLayout(self.create_buttons_section())
+        main_layout.addStretch()
+        main_layout.addLayout(self.create_footer())
+        return main_menu_widget
+    
+    def show_main_menu(self):
+        with span("page.menu"):
+            self.stacked_widget.setCurrentWidget(self.main_menu_widget)
+    def show_simple_calculations(self): self.switch_page("simple")
+    def show_detailed_calculations(self): self.switch_page("detailed")
+    def show_transformer_tables(self): self.switch_page("tables")
+
+    def switch_page(self, name):
+        with span(f"page.{name}"):
+            self.stacked_widget.setCurrentWidget(self.get_page(name))
+
+    def load_transformer_data(self):
+        return load_transformer_data()
+
+    def load_catalogue(self):
+        # A manufacturer catalogue (CSV/JSON/NPZ) can replace the built-in tables for Z% autofill
+        path = os.environ.get("TRANSFORMER_CATALOGUE")
+        if path:
+            return RatingCatalogue.from_file(path)
+        return RatingCatalogue.from_tables(self.transformer_data)
+
+    def set_dark_theme(self):
+        self.setStyleSheet(APP_STYLESHEET)
+        
+    def create_menu_bar(self):
+        menubar = self.menuBar()
+        file_menu = menubar.addMenu('File')
+        for label, shortcut, handler in (('New Project', 'Ctrl+N', self.new_project),
+                                         ('Open Project...', 'Ctrl+O', self.open_project),
+                                         ('Save Project', 'Ctrl+S', self.save_project),
+                                         ('Save Project As...', 'Ctrl+Shift+S', self.save_project_as)):
+            action = QAction(label, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(handler)
+            file_menu.addAction(action)
+        file_menu.addSeparator()
+        open_results_action = QAction('Open Results...', self)
+        open_results_action.triggered.connect(self.open_results)
+        file_menu.addAction(open_results_action)
+        export_action = QAction('Export Tables...', self)
+        export_action.triggered.connect(self.export_tables)
+        file_menu.addAction(export_action)
+
+        help_menu = menubar.addMenu('Help')
+        about_action = QAction('About', self)
+        about_action.triggered.connect(self.show_about)
+        help_menu.addAction(about_action)
+        stats_action = QAction('Performance Stats', self)
+        stats_action.triggered.connect(self.show_performance_stats)
+        help_menu.addAction(stats_action)
+
+    # --- Project files ---
+    def update_title(self):
+        name = os.path.basename(self.project.path) if self.project.path else None
+        self.setWindowTitle(f"{name}[*] - Transformer & Short Circuit Calculator" if name
+                            else 'Transformer & Short Circuit Calculator[*]')
+
+    def collect_state(self):
+        # Pages never shown keep whatever the file already holds
+        for name, page in self.pages.items():
+            self.project.set(f"page/{name}", page.get_state())
+        self.project.set("window", {"page": next((n for n, p in self.pages.items()
+                                                  if p is self.stacked_widget.currentWidget()), None)})
+
+    def maybe_save(self):
+        if not self.isWindowModified():
+            return True
+        answer = QMessageBox.question(self, "Unsaved Changes", "Save changes to the project?",
+                                      QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel)
+        if answer == QMessageBox.Save:
+            return self.save_project()
+        return answer == QMessageBox.Discard
+
+    def reset_pages(self):
+        for page in self.pages.values():
+            self.stacked_widget.removeWidget(page)
+            page.deleteLater()
+        self.pages = {}
+        self.show_main_menu()
+
+    def new_project(self):
+        if not self.maybe_save():
+            return
+        self.project = Project()
+        self.reset_pages()
+        self.setWindowModified(False)
+        self.update_title()
+
+    def open_project(self):
+        if not self.maybe_save():
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", "Transformer projects (*.txproj);;All files (*)")
+        if path:
+            self.load_project(path)
+
+    def load_project(self, path):
+        try:
+            project = Project(path)
+        except (OSError, ProjectFormatError) as e:
+            QMessageBox.warning(self, "Open Project", f"Could not open project:\n{e}")
+            return
+        self.project = project
+        self.reset_pages()
+        try:
+            page = (project.get("window") or {}).get("page")
+        except (OSError, ValueError):
+            page = None
+        if page in self.page_factories:
+            self.switch_page(page)
+        self.setWindowModified(False)
+        self.update_title()
+
+    def save_project(self):
+        if self.project.path is None:
+            return self.save_project_as()
+        return self.write_project(None)
+
+    def save_project_as(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Project As", "", "Transformer projects (*.txproj)")
+        if not path:
+            return False
+        if not os.path.splitext(path)[1]:
+            path += ".txproj"
+        return self.write_project(path)
+
+    def write_project(self, path):
+        self.collect_state()
+        try:
+            self.project.save(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Save Project", f"Could not save project:\n{e}")
+            return False
+        self.setWindowModified(False)
+        self.update_title()
+        return True
+
+    def closeEvent(self, event):
+        if self.maybe_save():
+            event.accept()
+        else:
+            event.ignore()
+
+    def open_results(self):
+        path = QFileDialog.getExistingDirectory(self, "Open Result Store")
+        if not path:
+            return
+        try:
+            self.tables_widget.add_result_store(path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.warning(self, "Open Results", f"Could not open result store:\n{e}")
+            return
+        self.show_transformer_tables()
+
+    def export_tables(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Tables", "",
+                                              "CSV (*.csv);;Excel Workbook (*.xlsx);;PDF (*.pdf)")
+        if not path:
+            return
+        try:
+            with span("export"):
+                stats = self.tables_widget.export(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Export Tables", f"Could not export tables:\n{e}")
+            return
+        self.statusBar().showMessage(f"Exported {os.path.basename(path)}: {stats}", 10000)
+
+    def show_about(self):
+        about_dialog = AboutDialog(self)
+        about_dialog.exec_()
+
+    def show_performance_stats(self):
+        # Modeless so the counters can be watched while using the calculator
+        if getattr(self, "stats_dialog", None) is None:
+            self.stats_dialog = PerformanceStatsDialog(self)
+        self.stats_dialog.show()
+        self.stats_dialog.raise_()
+
+    def create_header(self):
+        header_layout = QVBoxLayout()
+        header_layout.setSpacing(30)
+        title_row = QHBoxLayout()
+        logo_label = QLabel("SRT")
+        logo_label.setFixedSize(120, 120)
+        logo_label.setObjectName("logo")
+        logo_label.setAlignment(Qt.AlignCenter)
+        logo_label.setFont(QFont('Segoe UI', 28, QFont.Bold))
+        title_section = QVBoxLayout()
+        title_section.setSpacing(10)
+        title_label = QLabel('Transformer & Short Circuit Calculator')
+        title_label.setFont(QFont('Segoe UI', 42, QFont.Bold))
+        title_label.setObjectName("appTitle")
+        subtitle_label = QLabel('Professional Power System Analysis Tool')
+        subtitle_label.setFont(QFont('Segoe UI', 20))
+        subtitle_label.setObjectName("appSubtitle")
+        version_label = QLabel('Version 1.0.0')
+        version_label.setFont(QFont('Segoe UI', 16))
+        version_label.setObjectName("appVersion")
+        title_section.addWidget(title_label)
+        title_section.addWidget(subtitle_label)
+        title_section.addWidget(version_label)
+        title_row.addWidget(logo_label)
+        title_row.addLayout(title_section)
+        title_row.addStretch()
+        header_layout.addLayout(title_row)
+        return header_layout
+
+    def create_buttons_section(self):
+        buttons_layout = QVBoxLayout()
+        buttons_layout.setSpacing(50)
+        section_title = QLabel("Select Calculation Type")
+        section_title.setFont(QFont('Segoe UI', 28, QFont.Bold))
+        section_title.setAlignment(Qt.AlignCenter)
+        section_title.setObjectName("sectionTitle")
+        buttons_layout.addWidget(section_title)
+        buttons_grid = QHBoxLayout()
+        buttons_grid.setSpacing(60)
+        buttons_grid.setAlignment(Qt.AlignCenter)
+        simple_button = self.create_styled_button("🔌", "Simple Calculations", self.show_simple_calculations)
+        detailed_button = self.create_styled_button("⚡", "Detailed Calculations", self.show_detailed_calculations)
+        tables_button = self.create_styled_button("📋", "Transformer Tables", self.show_transformer_tables)
+        buttons_grid.addWidget(simple_button)
+        buttons_grid.addWidget(detailed_button)
+        buttons_grid.addWidget(tables_button)
+        buttons_layout.addLayout(buttons_grid)
+        return buttons_layout
+
+    def create_styled_button(self, icon, title, callback):
+        button = QPushButton()
+        button.setFixedSize(300, 200)
+        button.setCursor(Qt.PointingHandCursor)
+        button_layout = QVBoxLayout(button)
+        button_layout.setSpacing(20)
+        button_layout.setAlignment(Qt.AlignCenter)
+        icon_label = QLabel(icon)
+        icon_label.setFont(QFont('Segoe UI', 72))
+        icon_label.setAlignment(Qt.AlignCenter)
+        icon_label.setObjectName("menuCardIcon")
+        title_label = QLabel(title)
+        title_label.setFont(QFont('Segoe UI', 18, QFont.Bold))
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setObjectName("menuCardTitle")
+        title_label.setWordWrap(True)
+        button_layout.addWidget(icon_label)
+        button_layout.addWidget(title_label)
+        button.setObjectName("menuCard")
+        button.clicked.connect(callback)
+        return button
+
+    def create_footer(self):
+        footer_layout = QHBoxLayout()
+        footer_text = QLabel('<a href="https://roshannfs.github.io/SRT-/SRT-/" style="color: #7f8c8d; text-decoration: none;">© 2025 ROSHAN TECHNOLOGIES - I N N O V A T E . E L E V A T E . D O M I N A T E</a>')
+        footer_text.setFont(QFont('Segoe UI', 14))
+        footer_text.setAlignment(Qt.AlignCenter)
+        footer_text.setObjectName("footer")
+        footer_text.setOpenExternalLinks(True)
+        footer_layout.addWidget(footer_text)
+        return footer_layout
+
+def run_app(argv):
+    app = QApplication(argv)
+    app.setStyle('Fusion')
+    app.setApplicationName("Transformer Calculator")
+    app.setApplicationVersion("1.0.0")
+    app.setOrganizationName("ROSHAN TECHNOLOGIES")
+    window = TransformerCalculatorMainWindow()
+    window.show()
+    return app.exec_()